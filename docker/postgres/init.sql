@@ -1,8 +1,109 @@
+-- Safe to run again: on a database created by an earlier version, it adds what is
+-- missing and moves the data (see the migrations below).
 CREATE TABLE IF NOT EXISTS users (
     id VARCHAR(36) PRIMARY KEY,
     email VARCHAR(255) UNIQUE NOT NULL,
     password_hash VARCHAR(255) NOT NULL,
     is_active BOOLEAN DEFAULT FALSE,
     activation_code VARCHAR(4),
-    code_expires_at TIMESTAMPTZ
+    code_expires_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Migration: users created before created_at existed get the migration time
+ALTER TABLE users ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT now();
+
+-- Keyset pagination of the admin listing
+CREATE INDEX IF NOT EXISTS idx_users_created_at_id ON users (created_at, id);
+
+-- Pending registrations churn (code resent, activated or abandoned within minutes):
+-- they live apart from the mostly-read active users, in a table vacuumed after a
+-- fixed number of dead rows instead of a fraction of its size. Activation moves
+-- the row to users.
+CREATE TABLE IF NOT EXISTS pending_users (
+    id VARCHAR(36) PRIMARY KEY,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    activation_code VARCHAR(4),
+    code_expires_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+) WITH (
+    fillfactor = 70,
+    autovacuum_vacuum_scale_factor = 0.0,
+    autovacuum_vacuum_threshold = 200,
+    autovacuum_analyze_scale_factor = 0.05
+);
+
+CREATE INDEX IF NOT EXISTS idx_pending_users_created_at_id ON pending_users (created_at, id);
+
+-- Registration funnel: registrations whose activation code expired unused
+CREATE INDEX IF NOT EXISTS idx_pending_users_code_expires_at ON pending_users (code_expires_at);
+
+-- Migration: users not activated before the split move to pending_users, where
+-- activation looks for them
+WITH moved AS (
+    DELETE FROM users WHERE is_active IS NOT TRUE
+    RETURNING id, email, password_hash, activation_code, code_expires_at, created_at
+)
+INSERT INTO pending_users (id, email, password_hash, activation_code, code_expires_at, created_at)
+SELECT id, email, password_hash, activation_code, code_expires_at, created_at FROM moved;
+
+-- An email is unique across both tables: each table's UNIQUE constraint only
+-- covers its own rows. The advisory lock serializes the writers of one email, so
+-- that the check sees a concurrent registration once it commits. The row of the
+-- same user (activation moves it) does not count.
+CREATE OR REPLACE FUNCTION check_email_unique_across_users() RETURNS trigger AS $$
+DECLARE
+    other_table TEXT;
+    taken BOOLEAN;
+BEGIN
+    other_table := CASE TG_TABLE_NAME WHEN 'users' THEN 'pending_users' ELSE 'users' END;
+    PERFORM pg_advisory_xact_lock(hashtextextended(NEW.email, 0));
+    EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I WHERE email = $1 AND id <> $2)', other_table)
+        INTO taken USING NEW.email, NEW.id;
+    IF taken THEN
+        RAISE unique_violation USING MESSAGE = format('Email %s already registered.', NEW.email);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS users_email_unique ON users;
+CREATE TRIGGER users_email_unique BEFORE INSERT ON users
+    FOR EACH ROW EXECUTE FUNCTION check_email_unique_across_users();
+
+DROP TRIGGER IF EXISTS pending_users_email_unique ON pending_users;
+CREATE TRIGGER pending_users_email_unique BEFORE INSERT ON pending_users
+    FOR EACH ROW EXECUTE FUNCTION check_email_unique_across_users();
+
+-- What the repository reads: both tables, as the single users table they replace
+CREATE OR REPLACE VIEW all_users AS
+    SELECT id, email, password_hash, is_active, activation_code, code_expires_at, created_at
+    FROM users
+    UNION ALL
+    SELECT id, email, password_hash, false, activation_code, code_expires_at, created_at
+    FROM pending_users;
+
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key VARCHAR(300) PRIMARY KEY,
+    fingerprint VARCHAR(64) NOT NULL,
+    status_code SMALLINT,
+    body JSONB,
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_idempotency_keys_expires_at ON idempotency_keys (expires_at);
+
+-- Registration funnel counters, added to per hour by every worker (RegistrationFunnel)
+CREATE TABLE IF NOT EXISTS registration_funnel (
+    hour TIMESTAMPTZ NOT NULL,
+    metric VARCHAR(64) NOT NULL,
+    value DOUBLE PRECISION NOT NULL,
+    PRIMARY KEY (hour, metric)
+);
+
+-- Shard of each user id when users are sharded (DB_SHARDS), in the directory database
+CREATE TABLE IF NOT EXISTS user_shards (
+    user_id VARCHAR(36) PRIMARY KEY,
+    shard SMALLINT NOT NULL
 );
@@ -1,4 +1,5 @@
 from .activate_user_request import ActivateUserRequest
+from .lookup_users_request import LookupUsersRequest
 from .register_user_request import RegisterUserRequest
 
-__all__ = ["ActivateUserRequest", "RegisterUserRequest"]
+__all__ = ["ActivateUserRequest", "LookupUsersRequest", "RegisterUserRequest"]
@@ -0,0 +1,7 @@
+import uuid
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LookupUsersRequest:
+    ids: list[uuid.UUID]
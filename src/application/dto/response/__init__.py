@@ -1,3 +1,5 @@
+from .user_export_row import UserExportRow
+from .user_page_response import UserPageResponse
 from .user_response import UserResponse
 
-__all__ = ["UserResponse"]
+__all__ = ["UserExportRow", "UserPageResponse", "UserResponse"]
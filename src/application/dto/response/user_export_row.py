@@ -0,0 +1,27 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.domain.model import User
+
+
+@dataclass(frozen=True)
+class UserExportRow:
+    """User as exported for reconciliation, without password hash nor activation code"""
+
+    id: uuid.UUID
+    email: str
+    is_active: bool
+    code_expires_at: Optional[datetime]
+
+    @staticmethod
+    def from_domain(user: User) -> "UserExportRow":
+        return UserExportRow(
+            id=user.id,
+            email=user.email.value,
+            is_active=user.is_active,
+            code_expires_at=(
+                user.activation_code.expires_at if user.activation_code else None
+            ),
+        )
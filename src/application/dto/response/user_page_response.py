@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .user_response import UserResponse
+
+
+@dataclass(frozen=True)
+class UserPageResponse:
+    items: list[UserResponse]
+    next_cursor: Optional[str]
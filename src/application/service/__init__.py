@@ -1,4 +1,15 @@
 from .activate_user_service import ActivateUserService
+from .export_users_service import ExportUsersService, EXPORT_FORMATS
+from .list_users_service import ListUsersService, UserPage
+from .lookup_users_service import LookupUsersService
 from .register_user_service import RegisterUserService
 
-__all__ = ["ActivateUserService", "RegisterUserService"]
+__all__ = [
+    "ActivateUserService",
+    "ExportUsersService",
+    "EXPORT_FORMATS",
+    "ListUsersService",
+    "LookupUsersService",
+    "RegisterUserService",
+    "UserPage",
+]
@@ -1,16 +1,44 @@
+import logging
 import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, Optional
 
 from src.domain.model import User
 from src.domain.model import Email
-from src.domain.port import UserRepositoryPort
-from src.domain.exception import UserNotFoundException
+from src.domain.port import (
+    ActivationTokenPort,
+    RegistrationStatsPort,
+    UserRepositoryPort,
+)
+from src.domain.exception import (
+    ExpiredActivationCodeException,
+    InvalidActivationCodeException,
+    UserAlreadyActiveException,
+    UserNotFoundException,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ActivateUserService:
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        activation_tokens: Optional[ActivationTokenPort] = None,
+        stats: Optional[RegistrationStatsPort] = None,
+    ):
         self.user_repository = user_repository
+        self.activation_tokens = activation_tokens
+        self.stats = stats
 
     def activate_user(self, user_id: uuid.UUID, activation_code: str) -> User:
+        with self._count_expired(), _log_activation(user_id, "code"):
+            user = self._activate_user(user_id, activation_code)
+        self._count_activated(user)
+        return user
+
+    def _activate_user(self, user_id: uuid.UUID, activation_code: str) -> User:
         user = self.user_repository.find_by_id(user_id)
         if user is None:
             raise UserNotFoundException(f"No user found with id: {user_id}")
@@ -18,3 +46,58 @@ class ActivateUserService:
         user.activate(activation_code)
         self.user_repository.save(user)
         return user
+
+    def activate_with_token(self, token: str) -> User:
+        """Activates the user a signed token was issued for: the token is checked
+        without reading the user, whose row is then updated in a single write"""
+        if self.activation_tokens is None:
+            raise InvalidActivationCodeException("Activation tokens are not enabled.")
+        with self._count_expired():
+            user_id = self.activation_tokens.verify(token)
+
+        with _log_activation(user_id, "link"):
+            user = self._mark_active(user_id)
+        self._count_activated(user)
+        return user
+
+    @contextmanager
+    def _count_expired(self) -> Iterator[None]:
+        try:
+            yield
+        except ExpiredActivationCodeException:
+            if self.stats is not None:
+                self.stats.record_expired()
+            raise
+
+    def _count_activated(self, user: User) -> None:
+        if self.stats is not None and user.created_at is not None:
+            self.stats.record_activated(datetime.now(timezone.utc) - user.created_at)
+
+    def _mark_active(self, user_id: uuid.UUID) -> User:
+        user = self.user_repository.mark_active(user_id)
+        if user is not None:
+            return user
+        existing_user = self.user_repository.find_by_id(user_id)
+        if existing_user is None:
+            raise UserNotFoundException(f"No user found with id: {user_id}")
+        raise UserAlreadyActiveException(
+            f"User ({existing_user.email.value}) already active."
+        )
+
+
+@contextmanager
+def _log_activation(user_id: uuid.UUID, activation: str) -> Iterator[None]:
+    fields = {"user_id": str(user_id), "activation": activation}
+    try:
+        yield
+    except Exception as exception:
+        logger.info(
+            "user_activation_failed",
+            extra={
+                "event": "user_activation_failed",
+                "reason": type(exception).__name__,
+                **fields,
+            },
+        )
+        raise
+    logger.info("user_activated", extra={"event": "user_activated", **fields})
@@ -0,0 +1,52 @@
+import csv
+import dataclasses
+import io
+import json
+from typing import Iterator
+
+from src.application.dto.response import UserExportRow
+from src.domain.port import UserRepositoryPort
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_COLUMNS = [f.name for f in dataclasses.fields(UserExportRow)]
+
+
+class ExportUsersService:
+    def __init__(self, user_repository: UserRepositoryPort, chunk_rows: int = 500):
+        self.user_repository = user_repository
+        self.chunk_rows = chunk_rows
+
+    def export(self, export_format: str, fetch_size: int) -> Iterator[str]:
+        """Streams every user as NDJSON or CSV text chunks, without secrets.
+        The first row is flushed on its own so that the first byte leaves immediately.
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format}")
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+        if export_format == "csv":
+            writer.writeheader()
+
+        pending = 0
+        first_chunk = True
+        for user in self.user_repository.stream_all(fetch_size):
+            row = dataclasses.asdict(UserExportRow.from_domain(user))
+            if export_format == "csv":
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(row, default=str) + "\n")
+            pending += 1
+            if first_chunk or pending >= self.chunk_rows:
+                yield self._drain(buffer)
+                pending = 0
+                first_chunk = False
+        if buffer.tell():
+            yield self._drain(buffer)
+
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
@@ -0,0 +1,51 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.domain.model import User
+from src.domain.port import UserRepositoryPort
+
+
+@dataclass(frozen=True)
+class UserPage:
+    users: list[User]
+    next_cursor: Optional[str]
+
+
+class ListUsersService:
+    def __init__(self, user_repository: UserRepositoryPort):
+        self.user_repository = user_repository
+
+    def list_users(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        pending_expired: bool = False,
+    ) -> UserPage:
+        """Lists one page of users, continuing after the position encoded in cursor"""
+        after = self.decode_cursor(cursor) if cursor else None
+        users = self.user_repository.list_page(
+            limit + 1, after, is_active, pending_expired
+        )
+        if len(users) <= limit:
+            return UserPage(users=users, next_cursor=None)
+        users = users[:limit]
+        return UserPage(users=users, next_cursor=self.encode_cursor(users[-1]))
+
+    @staticmethod
+    def encode_cursor(user: User) -> str:
+        position = json.dumps([user.created_at.isoformat(), str(user.id)])
+        return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at, user_id = json.loads(base64.urlsafe_b64decode(padded))
+            return datetime.fromisoformat(created_at), str(user_id)
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
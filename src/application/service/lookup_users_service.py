@@ -0,0 +1,21 @@
+import uuid
+
+from src.domain.model import User
+from src.domain.port import UserRepositoryPort
+
+
+class LookupUsersService:
+    def __init__(self, user_repository: UserRepositoryPort):
+        self.user_repository = user_repository
+
+    def find_users(self, user_ids: list[uuid.UUID]) -> list[User]:
+        """Finds the existing users among the ids, in the requested order, with one query"""
+        unique_ids = list(dict.fromkeys(user_ids))
+        users_by_id = {
+            str(user.id): user for user in self.user_repository.find_by_ids(unique_ids)
+        }
+        return [
+            users_by_id[str(user_id)]
+            for user_id in unique_ids
+            if str(user_id) in users_by_id
+        ]
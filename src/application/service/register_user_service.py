@@ -1,33 +1,91 @@
+import logging
 import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
 from passlib.context import CryptContext
 
 from src.domain.exception import EmailAlreadyExistsException
 from src.domain.model import User, Email, ActivationCode
-from src.domain.port import EmailSenderPort, UserRepositoryPort
+from src.domain.port import (
+    ActivationTokenPort,
+    EmailSenderPort,
+    RegistrationStatsPort,
+    UserRepositoryPort,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class RegisterUserService:
     def __init__(
-        self, user_repository: UserRepositoryPort, email_sender: EmailSenderPort
+        self,
+        user_repository: UserRepositoryPort,
+        email_sender: EmailSenderPort,
+        activation_tokens: Optional[ActivationTokenPort] = None,
+        activation_token_ttl: timedelta = timedelta(minutes=15),
+        stats: Optional[RegistrationStatsPort] = None,
     ):
         self.user_repository = user_repository
         self.email_sender = email_sender
+        self.activation_tokens = activation_tokens
+        self.activation_token_ttl = activation_token_ttl
+        self.stats = stats
         self.crypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
     def register_user(self, email: str, plain_password: str) -> User:
-        """Registers a new user and sends an activation email"""
+        """Registers a new user and sends an activation email, holding either a
+        4-digit code or, when activation tokens are enabled, a signed link"""
+        try:
+            user = self._register_user(email, plain_password)
+        except Exception as exception:
+            logger.info(
+                "user_registration_failed",
+                extra={
+                    "event": "user_registration_failed",
+                    "reason": type(exception).__name__,
+                },
+            )
+            raise
+        logger.info(
+            "user_registered",
+            extra={
+                "event": "user_registered",
+                "user_id": str(user.id),
+                "activation": "code" if self.activation_tokens is None else "link",
+            },
+        )
+        if self.stats is not None:
+            self.stats.record_registered()
+        return user
+
+    def _register_user(self, email: str, plain_password: str) -> User:
         user_email = Email(email)
         existing_user = self.user_repository.find_by_email(user_email)
         if existing_user is not None:
             raise EmailAlreadyExistsException(f"Email {email} already registered.")
         password_hash = self.crypt_context.hash(plain_password)
-        activation_code = ActivationCode.generate_activation_code()
+        activation_code = (
+            ActivationCode.generate_activation_code()
+            if self.activation_tokens is None
+            else None
+        )
         user = User(
             id=uuid.uuid4(),
             email=user_email,
             password_hash=password_hash,
             activation_code=activation_code,
+            created_at=datetime.now(timezone.utc),
         )
         self.user_repository.save(user)
-        self.email_sender.send_activation_email(user_email, activation_code.value)
+        if activation_code is not None:
+            self.email_sender.send_activation_email(
+                user_email, activation_code.value, expires_at=activation_code.expires_at
+            )
+        else:
+            expires_at = user.created_at + self.activation_token_ttl
+            token = self.activation_tokens.issue(user.id, expires_at)
+            self.email_sender.send_activation_link(
+                user_email, token, expires_at=expires_at
+            )
         return user
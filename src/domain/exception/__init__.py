@@ -1,3 +1,4 @@
+from .deadline_exceptions import DeadlineExceededException
 from .user_exceptions import (
     UserDomainException,
     UserAlreadyActiveException,
@@ -9,6 +10,7 @@ from .user_exceptions import (
 )
 
 __all__ = [
+    "DeadlineExceededException",
     "UserDomainException",
     "UserAlreadyActiveException",
     "InvalidActivationCodeException",
@@ -0,0 +1,4 @@
+class DeadlineExceededException(Exception):
+    """Raised when the time budget of the current request is exhausted."""
+
+    pass
@@ -1,5 +1,6 @@
 import uuid
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
 from src.domain.exception import (
@@ -20,6 +21,7 @@ class User:
     password_hash: str
     is_active: bool = False
     activation_code: Optional[ActivationCode] = None
+    created_at: Optional[datetime] = None
 
     def activate(self, provided_code: str) -> None:
         """Activates the user if the provided code matches and is not expired"""
@@ -1,8 +1,24 @@
+from .activation_token_port import ActivationTokenPort
+from .async_email_sender_port import AsyncEmailSenderPort
 from .email_sender_port import EmailSenderPort, EmailDeliveryException
+from .idempotency_store_port import (
+    IdempotencyStorePort,
+    IdempotentResponse,
+    IdempotencyKeyMismatchException,
+    IdempotencyKeyInFlightException,
+)
+from .registration_stats_port import RegistrationStatsPort
 from .user_repository_port import UserRepositoryPort
 
 __all__ = [
+    "ActivationTokenPort",
     "UserRepositoryPort",
+    "AsyncEmailSenderPort",
     "EmailSenderPort",
     "EmailDeliveryException",
+    "IdempotencyStorePort",
+    "IdempotentResponse",
+    "IdempotencyKeyMismatchException",
+    "IdempotencyKeyInFlightException",
+    "RegistrationStatsPort",
 ]
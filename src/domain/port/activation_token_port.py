@@ -0,0 +1,18 @@
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class ActivationTokenPort(ABC):
+    """Interface (port) for self-contained, expiring activation tokens"""
+
+    @abstractmethod
+    def issue(self, user_id: uuid.UUID, expires_at: datetime) -> str:
+        """Issues a token proving the ownership of the user's email until expires_at"""
+        pass
+
+    @abstractmethod
+    def verify(self, token: str) -> uuid.UUID:
+        """Returns the id of the user the token was issued for.
+        Raises InvalidActivationCodeException or ExpiredActivationCodeException."""
+        pass
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from src.domain.model import Email
+
+
+class AsyncEmailSenderPort(ABC):
+    """Interface (port) for sending emails from the event loop"""
+
+    @abstractmethod
+    async def send_activation_email(
+        self,
+        email: Email,
+        activation_code: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def send_activation_link(
+        self,
+        email: Email,
+        activation_token: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        pass
+
+    async def close(self) -> None:
+        """Releases the connections kept by the sender"""
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
 
 from src.domain.model import Email
 
@@ -7,9 +9,33 @@ class EmailSenderPort(ABC):
     """Interface (port) for sending emails"""
 
     @abstractmethod
-    def send_activation_email(self, email: Email, activation_code: str) -> None:
+    def send_activation_email(
+        self,
+        email: Email,
+        activation_code: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        """Sends an activation code. expires_at, when known, is when the code
+        expires: senders that defer emails may drop them past that time."""
         pass
 
+    @abstractmethod
+    def send_activation_link(
+        self,
+        email: Email,
+        activation_token: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        pass
+
+    def warm_up(self) -> None:
+        """Opens connections ahead of the first emails, when the sender keeps any"""
+
+    def close(self) -> None:
+        """Releases the connections kept by the sender"""
+
 
 class EmailDeliveryException(Exception):
     pass
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class IdempotentResponse:
+    """Immutable snapshot of a completed response, replayed for retried requests"""
+
+    status_code: int
+    body: Any
+
+
+class IdempotencyStorePort(ABC):
+    """Interface (port) for storing the outcome of idempotent requests"""
+
+    @abstractmethod
+    def fingerprint(self, payload: dict) -> str:
+        """Keyed digest of a request payload, stored to detect a key reused with
+        another payload"""
+        pass
+
+    @abstractmethod
+    def begin(self, key: str, fingerprint: str) -> Optional[IdempotentResponse]:
+        """Claims the key for execution and returns None, or returns the stored
+        response when a request with the same key already completed.
+        Waits while another request holding the same key is still in flight, at
+        most until the request deadline (DeadlineExceededException)."""
+        pass
+
+    @abstractmethod
+    def complete(self, key: str, response: IdempotentResponse) -> None:
+        """Stores the response of a claimed key and wakes up waiting duplicates"""
+        pass
+
+    @abstractmethod
+    def abandon(self, key: str) -> None:
+        """Releases a claimed key without a response so that it can be retried"""
+        pass
+
+
+class IdempotencyKeyMismatchException(Exception):
+    """Raised when an idempotency key is reused with a different request payload."""
+
+    pass
+
+
+class IdempotencyKeyInFlightException(Exception):
+    """Raised when a request with the same idempotency key did not complete in time."""
+
+    pass
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+
+class RegistrationStatsPort(ABC):
+    """Interface (port) for counting the registration funnel as it happens, so that
+    funnel statistics never have to be computed from the users tables"""
+
+    @abstractmethod
+    def record_registered(self) -> None:
+        pass
+
+    @abstractmethod
+    def record_activated(self, latency: timedelta) -> None:
+        """latency: from registration to activation"""
+        pass
+
+    @abstractmethod
+    def record_expired(self) -> None:
+        """An activation attempted with an expired code or link"""
+        pass
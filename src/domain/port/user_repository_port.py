@@ -1,6 +1,7 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Iterator, Optional
 
 from src.domain.model import Email, User
 
@@ -13,6 +14,23 @@ class UserRepositoryPort(ABC):
         """Saves a user or update the code of a user to the repository"""
         pass
 
+    def save_many(self, users: list[User]) -> None:
+        """Saves users in a single transaction where the adapter supports it.
+        As with successive saves, the last user with a given email wins."""
+        for user in users:
+            self.save(user)
+
+    @abstractmethod
+    def mark_active(self, user_id: uuid.UUID) -> Optional[User]:
+        """Activates a pending user in a single write, without reading it first.
+        Returns None when no pending user has this id."""
+        pass
+
+    @abstractmethod
+    def delete(self, user_id: uuid.UUID) -> None:
+        """Deletes a user, pending or active, if it exists"""
+        pass
+
     @abstractmethod
     def find_by_id(self, user_id: uuid.UUID) -> Optional[User]:
         """Finds a user by id"""
@@ -22,3 +40,28 @@ class UserRepositoryPort(ABC):
     def find_by_email(self, email: Email) -> Optional[User]:
         """Finds a user by email"""
         pass
+
+    @abstractmethod
+    def find_by_ids(self, user_ids: list[uuid.UUID]) -> list[User]:
+        """Finds the existing users among the given ids"""
+        pass
+
+    @abstractmethod
+    def stream_all(self, fetch_size: int) -> Iterator[User]:
+        """Iterates over every user, holding at most fetch_size of them in memory"""
+        pass
+
+    @abstractmethod
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        is_active: Optional[bool] = None,
+        pending_expired: bool = False,
+    ) -> list[User]:
+        """Lists up to limit users ordered by (created_at, id), strictly after the
+        given (created_at, id) keyset position"""
+        pass
+
+    def close(self) -> None:
+        """Releases the connections or writers kept by the repository"""
@@ -1,3 +1,23 @@
-from .api import router as api_router
+from .api import (
+    router as api_router,
+    admin_router,
+    funnel_router,
+    health_router,
+    memory_router,
+    msgpack_router,
+    slow_query_router,
+    DeadlineMiddleware,
+    deadline_exceeded_handler,
+)
 
-__all__ = ["api_router"]
+__all__ = [
+    "api_router",
+    "admin_router",
+    "funnel_router",
+    "health_router",
+    "memory_router",
+    "msgpack_router",
+    "slow_query_router",
+    "DeadlineMiddleware",
+    "deadline_exceeded_handler",
+]
@@ -1,3 +1,68 @@
-from .user_controller import router, register_user, activate_user
+from .admin_controller import (
+    router as admin_router,
+    list_users,
+    lookup_users,
+    export_users,
+)
+from .deadline_middleware import DeadlineMiddleware, deadline_exceeded_handler
+from .funnel_controller import router as funnel_router, registration_funnel
+from .health_controller import router as health_router, live, ready
+from .memory_controller import (
+    router as memory_router,
+    tracemalloc_status,
+    start_tracemalloc,
+    stop_tracemalloc,
+    take_snapshot,
+    snapshot_top,
+    snapshot_diff,
+    request_allocations,
+)
+from .msgpack_controller import (
+    router as msgpack_router,
+    MessagePackResponse,
+    register_user_msgpack,
+    activate_user_msgpack,
+    register_users_msgpack,
+    activate_users_msgpack,
+)
+from .slow_query_controller import router as slow_query_router, slow_queries
+from .user_controller import (
+    router,
+    register_user,
+    activate_user,
+    activate_user_with_token,
+)
 
-__all__ = ["router", "register_user", "activate_user"]
+__all__ = [
+    "router",
+    "admin_router",
+    "funnel_router",
+    "health_router",
+    "memory_router",
+    "msgpack_router",
+    "slow_query_router",
+    "DeadlineMiddleware",
+    "MessagePackResponse",
+    "deadline_exceeded_handler",
+    "register_user",
+    "activate_user",
+    "activate_user_with_token",
+    "list_users",
+    "lookup_users",
+    "export_users",
+    "live",
+    "ready",
+    "tracemalloc_status",
+    "start_tracemalloc",
+    "stop_tracemalloc",
+    "take_snapshot",
+    "snapshot_top",
+    "snapshot_diff",
+    "request_allocations",
+    "slow_queries",
+    "registration_funnel",
+    "register_user_msgpack",
+    "activate_user_msgpack",
+    "register_users_msgpack",
+    "activate_users_msgpack",
+]
@@ -0,0 +1,78 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from src.application.dto.request import LookupUsersRequest
+from src.application.dto.response import UserPageResponse, UserResponse
+from src.application.service import (
+    ExportUsersService,
+    ListUsersService,
+    LookupUsersService,
+)
+from src.infrastructure.config import AdminConfig
+from src.infrastructure.dependencies import (
+    get_admin_config,
+    get_export_service,
+    get_list_service,
+    get_lookup_service,
+    verify_admin,
+)
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+router = APIRouter(
+    prefix="/api/v1/admin/users",
+    tags=["admin"],
+    dependencies=[Depends(verify_admin)],
+)
+
+
+@router.get("", response_model=UserPageResponse)
+def list_users(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    pending_expired: bool = False,
+    service: ListUsersService = Depends(get_list_service),
+) -> UserPageResponse:
+    try:
+        page = service.list_users(limit, cursor, is_active, pending_expired)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return UserPageResponse(
+        items=[UserResponse.from_domain(user) for user in page.users],
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.post("/lookup", response_model=list[UserResponse])
+def lookup_users(
+    request: LookupUsersRequest,
+    service: LookupUsersService = Depends(get_lookup_service),
+    admin_config: AdminConfig = Depends(get_admin_config),
+) -> list[UserResponse]:
+    if len(request.ids) > admin_config.max_batch_lookup:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {admin_config.max_batch_lookup} ids per lookup.",
+        )
+    users = service.find_users(request.ids)
+    return [UserResponse.from_domain(user) for user in users]
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_users(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    fetch_size: Optional[int] = Query(None, ge=1, le=50_000),
+    service: ExportUsersService = Depends(get_export_service),
+    admin_config: AdminConfig = Depends(get_admin_config),
+) -> StreamingResponse:
+    chunks = service.export(export_format, fetch_size or admin_config.export_fetch_size)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="users.{export_format}"'
+        },
+    )
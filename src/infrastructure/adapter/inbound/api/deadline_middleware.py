@@ -0,0 +1,50 @@
+from typing import Optional
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.domain.exception import DeadlineExceededException
+from src.infrastructure.config import DeadlineConfig
+from src.infrastructure.deadline import reset_deadline, set_deadline
+
+
+class DeadlineMiddleware:
+    """Starts the time budget of each request, from its route and the client header.
+    Database and SMTP calls shorten their timeouts to the time left."""
+
+    def __init__(self, app: ASGIApp, config: DeadlineConfig = DeadlineConfig()):
+        self.app = app
+        self.config = config
+        self.header = config.header.lower().encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        budget = self.config.budget_for(
+            scope["method"], scope["path"], self._requested(scope)
+        )
+        token = set_deadline(budget)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_deadline(token)
+
+    def _requested(self, scope: Scope) -> Optional[float]:
+        for name, value in scope["headers"]:
+            if name == self.header:
+                try:
+                    return float(value)
+                except ValueError:
+                    return None
+        return None
+
+
+async def deadline_exceeded_handler(
+    request: Request, exception: DeadlineExceededException
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": str(exception)},
+    )
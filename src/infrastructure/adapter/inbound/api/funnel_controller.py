@@ -0,0 +1,22 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from src.infrastructure.adapter.outbound.stats import RegistrationFunnel
+from src.infrastructure.dependencies import get_registration_funnel, verify_admin
+
+router = APIRouter(
+    prefix="/api/v1/admin/funnel",
+    tags=["admin"],
+    dependencies=[Depends(verify_admin)],
+)
+
+
+@router.get("")
+def registration_funnel(
+    hours: Optional[int] = Query(None, ge=1, le=24 * 90),
+    funnel: RegistrationFunnel = Depends(get_registration_funnel),
+) -> dict:
+    """Registrations, activations, expired registrations and activation
+    attempts, and activation latencies over the last hours"""
+    return funnel.summary(hours)
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from src.infrastructure.dependencies import get_warm_up
+from src.infrastructure.warm_up import WarmUp
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/live")
+def live() -> dict:
+    """The process is up and serving, without touching any backend"""
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+def ready(warm_up: WarmUp = Depends(get_warm_up)) -> JSONResponse:
+    """Ready to take traffic once the worker has warmed up"""
+    if not warm_up.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up", "pending": warm_up.pending},
+        )
+    return JSONResponse(content={"status": "ready"})
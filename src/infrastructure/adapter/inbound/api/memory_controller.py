@@ -0,0 +1,78 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.infrastructure.dependencies import get_allocation_profiler, verify_admin
+from src.infrastructure.observability import AllocationProfiler
+
+# Each worker process profiles itself: responses carry its pid
+router = APIRouter(
+    prefix="/api/v1/admin/memory",
+    tags=["admin"],
+    dependencies=[Depends(verify_admin)],
+)
+
+
+@router.get("/tracemalloc")
+def tracemalloc_status(
+    profiler: AllocationProfiler = Depends(get_allocation_profiler),
+) -> dict:
+    return profiler.status()
+
+
+@router.post("/tracemalloc/start")
+def start_tracemalloc(
+    frames: Optional[int] = Query(None, ge=1, le=100),
+    profiler: AllocationProfiler = Depends(get_allocation_profiler),
+) -> dict:
+    return profiler.start(frames)
+
+
+@router.post("/tracemalloc/stop")
+def stop_tracemalloc(
+    profiler: AllocationProfiler = Depends(get_allocation_profiler),
+) -> dict:
+    return profiler.stop()
+
+
+@router.post("/snapshots", status_code=status.HTTP_201_CREATED)
+def take_snapshot(
+    profiler: AllocationProfiler = Depends(get_allocation_profiler),
+) -> dict:
+    try:
+        return profiler.take_snapshot()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+@router.get("/snapshots/{snapshot_id}/top")
+def snapshot_top(
+    snapshot_id: int,
+    limit: int = Query(10, ge=1, le=100),
+    profiler: AllocationProfiler = Depends(get_allocation_profiler),
+) -> dict:
+    try:
+        return profiler.top(snapshot_id, limit)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.args[0])
+
+
+@router.get("/snapshots/{snapshot_id}/diff")
+def snapshot_diff(
+    snapshot_id: int,
+    base: int = Query(..., description="id of the earlier snapshot"),
+    limit: int = Query(10, ge=1, le=100),
+    profiler: AllocationProfiler = Depends(get_allocation_profiler),
+) -> dict:
+    try:
+        return profiler.diff(base, snapshot_id, limit)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.args[0])
+
+
+@router.get("/allocations")
+def request_allocations(
+    profiler: AllocationProfiler = Depends(get_allocation_profiler),
+) -> dict:
+    """Instances of the tracked types created per sampled request, by route"""
+    return profiler.request_allocations()
@@ -0,0 +1,213 @@
+import uuid
+from dataclasses import fields
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+import anyio
+import msgpack
+from anyio import to_thread
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+
+from src.application.dto.request import ActivateUserRequest, RegisterUserRequest
+from src.application.dto.response import UserResponse
+from src.application.service import ActivateUserService, RegisterUserService
+from src.domain.exception import DeadlineExceededException
+from src.infrastructure.config import InternalApiConfig
+from src.infrastructure.deadline import deadline_exceeded
+from src.infrastructure.dependencies import (
+    get_activate_service,
+    get_internal_api_config,
+    get_register_service,
+    verify_internal_service,
+)
+
+MEDIA_TYPE = "application/msgpack"
+
+T = TypeVar("T")
+
+router = APIRouter(
+    prefix="/internal/v1/users",
+    tags=["internal"],
+    dependencies=[Depends(verify_internal_service)],
+)
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} as MessagePack")
+
+
+class MessagePackResponse(Response):
+    media_type = MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_encode)
+
+
+async def msgpack_body(request: Request) -> Any:
+    """The decoded request body: internal clients skip JSON and pydantic, the
+    operations below check the few fields they read"""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type != MEDIA_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Expected {MEDIA_TYPE}",
+        )
+    try:
+        return msgpack.unpackb(await request.body())
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid MessagePack body"
+        )
+
+
+def msgpack_batch(
+    body: Any = Depends(msgpack_body),
+    config: InternalApiConfig = Depends(get_internal_api_config),
+) -> list:
+    if not isinstance(body, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Expected an array"
+        )
+    if len(body) > config.max_batch_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"At most {config.max_batch_size} items per batch",
+        )
+    return body
+
+
+def decode(dto_type: type[T], item: Any) -> T:
+    """Builds a request DTO from a map of string fields"""
+    names = [field.name for field in fields(dto_type)]
+    if not isinstance(item, dict) or not all(
+        isinstance(item.get(name), str) for name in names
+    ):
+        raise ValueError(f"Expected a map with string fields: {', '.join(names)}")
+    return dto_type(*(item[name] for name in names))
+
+
+def register(service: RegisterUserService, item: Any) -> tuple[int, dict]:
+    """Same outcomes as user_controller.register_user, as (status, body)"""
+    try:
+        request = decode(RegisterUserRequest, item)
+        user = service.register_user(request.email, request.password)
+    except DeadlineExceededException:
+        raise
+    except Exception as e:
+        return status.HTTP_400_BAD_REQUEST, {"detail": str(e)}
+    return status.HTTP_201_CREATED, vars(UserResponse.from_domain(user))
+
+
+def activate(service: ActivateUserService, item: Any) -> tuple[int, dict]:
+    """Activation with a code on behalf of the user: the caller is a trusted
+    service, there are no user credentials to check"""
+    try:
+        request = decode(ActivateUserRequest, item)
+        user_id = uuid.UUID(item.get("user_id"))
+        user = service.activate_user(user_id, request.activation_code)
+    except DeadlineExceededException:
+        raise
+    except Exception as e:
+        return status.HTTP_400_BAD_REQUEST, {"detail": str(e)}
+    return status.HTTP_200_OK, vars(UserResponse.from_domain(user))
+
+
+def repeated_emails(items: list) -> set[int]:
+    """Indexes of the items whose email an earlier item of the batch already has,
+    compared as the shard routing does. Run concurrently, both would pass the
+    service's existence check and the last upsert would win."""
+    seen: set[str] = set()
+    repeated = set()
+    for index, item in enumerate(items):
+        email = item.get("email") if isinstance(item, dict) else None
+        if not isinstance(email, str):
+            continue
+        normalized = email.strip().lower()
+        if normalized in seen:
+            repeated.add(index)
+        seen.add(normalized)
+    return repeated
+
+
+async def run_batch(
+    operation: Callable[[Any], tuple[int, dict]], items: list, concurrency: int
+) -> list[dict]:
+    """Runs the operation on each item in threadpool threads, at most concurrency
+    at a time. Items still running or waiting at the deadline fail with a 504."""
+    results: list[dict] = [{}] * len(items)
+    semaphore = anyio.Semaphore(concurrency)
+
+    async def run(index: int, item: Any) -> None:
+        async with semaphore:
+            try:
+                if deadline_exceeded():
+                    raise DeadlineExceededException("Request deadline exceeded.")
+                status_code, body = await to_thread.run_sync(operation, item)
+            except DeadlineExceededException as e:
+                status_code, body = status.HTTP_504_GATEWAY_TIMEOUT, {"detail": str(e)}
+        results[index] = {"status": status_code, "body": body}
+
+    async with anyio.create_task_group() as task_group:
+        for index, item in enumerate(items):
+            task_group.start_soon(run, index, item)
+    return results
+
+
+@router.post("/register", response_class=MessagePackResponse)
+def register_user_msgpack(
+    body: Any = Depends(msgpack_body),
+    service: RegisterUserService = Depends(get_register_service),
+) -> MessagePackResponse:
+    status_code, content = register(service, body)
+    return MessagePackResponse(content, status_code)
+
+
+@router.post("/activate", response_class=MessagePackResponse)
+def activate_user_msgpack(
+    body: Any = Depends(msgpack_body),
+    service: ActivateUserService = Depends(get_activate_service),
+) -> MessagePackResponse:
+    status_code, content = activate(service, body)
+    return MessagePackResponse(content, status_code)
+
+
+@router.post("/register/batch", response_class=MessagePackResponse)
+async def register_users_msgpack(
+    items: list = Depends(msgpack_batch),
+    service: RegisterUserService = Depends(get_register_service),
+    config: InternalApiConfig = Depends(get_internal_api_config),
+) -> MessagePackResponse:
+    """One {status, body} result per item, in order. An email repeated in the
+    batch is only registered by its first item, the others get a 409."""
+    repeated = repeated_emails(items)
+    unique = [item for index, item in enumerate(items) if index not in repeated]
+    registered = iter(
+        await run_batch(partial(register, service), unique, config.batch_concurrency)
+    )
+    results = [
+        (
+            {
+                "status": status.HTTP_409_CONFLICT,
+                "body": {"detail": "Email already in this batch."},
+            }
+            if index in repeated
+            else next(registered)
+        )
+        for index in range(len(items))
+    ]
+    return MessagePackResponse(results)
+
+
+@router.post("/activate/batch", response_class=MessagePackResponse)
+async def activate_users_msgpack(
+    items: list = Depends(msgpack_batch),
+    service: ActivateUserService = Depends(get_activate_service),
+    config: InternalApiConfig = Depends(get_internal_api_config),
+) -> MessagePackResponse:
+    """One {status, body} result per item, in order"""
+    results = await run_batch(
+        partial(activate, service), items, config.batch_concurrency
+    )
+    return MessagePackResponse(results)
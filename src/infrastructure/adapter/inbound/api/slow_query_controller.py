@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+
+from src.infrastructure.adapter.outbound.repository import SlowQueryLog
+from src.infrastructure.dependencies import get_slow_query_log, verify_admin
+
+router = APIRouter(
+    prefix="/api/v1/admin/slow-queries",
+    tags=["admin"],
+    dependencies=[Depends(verify_admin)],
+)
+
+
+@router.get("")
+def slow_queries(slow_query_log: SlowQueryLog = Depends(get_slow_query_log)) -> dict:
+    """Slowest statements seen by this worker, with their plan when sampled"""
+    return {
+        "threshold_ms": slow_query_log.config.threshold_ms,
+        "queries": slow_query_log.worst(),
+    }
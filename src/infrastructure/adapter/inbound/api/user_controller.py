@@ -1,14 +1,34 @@
 import uuid
+from typing import Annotated, Callable, Optional
 
-from fastapi import FastAPI, APIRouter, Depends, HTTPException, status, Path
+from fastapi import (
+    FastAPI,
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Path,
+    Header,
+    Query,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBasic
 
 from src.application.dto.request import ActivateUserRequest, RegisterUserRequest
 from src.application.dto.response import UserResponse
 from src.application.service import ActivateUserService, RegisterUserService
+from src.domain.exception import DeadlineExceededException
 from src.domain.model import User
+from src.domain.port import (
+    IdempotencyStorePort,
+    IdempotentResponse,
+    IdempotencyKeyMismatchException,
+    IdempotencyKeyInFlightException,
+)
 from src.infrastructure.dependencies import (
     get_activate_service,
+    get_idempotency_store,
     get_register_service,
     verify_credentials,
 )
@@ -17,6 +37,44 @@ router = APIRouter(prefix="/api/v1/users", tags=["users"])
 app = FastAPI()
 security = HTTPBasic()
 
+IdempotencyKey = Annotated[Optional[str], Header(alias="Idempotency-Key")]
+IdempotencyStore = Annotated[IdempotencyStorePort, Depends(get_idempotency_store)]
+
+
+def run_idempotent(
+    store: Optional[IdempotencyStorePort],
+    key: Optional[str],
+    payload: dict,
+    status_code: int,
+    operation: Callable[[], UserResponse],
+):
+    """Executes the operation once per idempotency key and replays its response"""
+    if not key or store is None:
+        return operation()
+
+    try:
+        replayed = store.begin(key, store.fingerprint(payload))
+    except IdempotencyKeyMismatchException as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e)
+        )
+    except IdempotencyKeyInFlightException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if replayed is not None:
+        return JSONResponse(
+            status_code=replayed.status_code,
+            content=replayed.body,
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+    try:
+        response = operation()
+    except BaseException:
+        store.abandon(key)
+        raise
+    store.complete(key, IdempotentResponse(status_code, jsonable_encoder(response)))
+    return response
+
 
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
@@ -24,12 +82,25 @@ security = HTTPBasic()
 def register_user(
     request: RegisterUserRequest,
     service: RegisterUserService = Depends(get_register_service),
+    idempotency_key: IdempotencyKey = None,
+    idempotency_store: IdempotencyStore = None,
 ) -> UserResponse:
-    try:
-        user = service.register_user(request.email, request.password)
-        return UserResponse.from_domain(user)
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    def register() -> UserResponse:
+        try:
+            user = service.register_user(request.email, request.password)
+            return UserResponse.from_domain(user)
+        except DeadlineExceededException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return run_idempotent(
+        idempotency_store,
+        idempotency_key and f"register:{idempotency_key}",
+        {"email": request.email, "password": request.password},
+        status.HTTP_201_CREATED,
+        register,
+    )
 
 
 @router.post(
@@ -40,6 +111,8 @@ def activate_user(
     request: ActivateUserRequest = ...,
     service: ActivateUserService = Depends(get_activate_service),
     logged_user: User = Depends(verify_credentials),
+    idempotency_key: IdempotencyKey = None,
+    idempotency_store: IdempotencyStore = None,
 ) -> UserResponse:
     if str(user_id) != str(logged_user.id):
         raise HTTPException(
@@ -47,9 +120,35 @@ def activate_user(
             detail="You can only activate your own account.",
         )
 
+    def activate() -> UserResponse:
+        try:
+            user = service.activate_user(logged_user.id, request.activation_code)
+            return UserResponse.from_domain(user)
+        except DeadlineExceededException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return run_idempotent(
+        idempotency_store,
+        idempotency_key and f"activate:{logged_user.id}:{idempotency_key}",
+        {"activation_code": request.activation_code},
+        status.HTTP_200_OK,
+        activate,
+    )
+
+
+@router.get("/activate", response_model=UserResponse, status_code=status.HTTP_200_OK)
+def activate_user_with_token(
+    token: str = Query(..., min_length=1),
+    service: ActivateUserService = Depends(get_activate_service),
+) -> UserResponse:
+    """Target of the activation link: the signed token replaces code and credentials"""
     try:
-        user = service.activate_user(logged_user.id, request.activation_code)
+        user = service.activate_with_token(token)
         return UserResponse.from_domain(user)
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
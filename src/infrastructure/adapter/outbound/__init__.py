@@ -1,4 +1,18 @@
-from .email import MailhogEmailSender
+from .email import (
+    AsyncSmtpEmailSender,
+    CircuitBreakerEmailSender,
+    MailhogEmailSender,
+    ScheduledEmailSender,
+)
+from .idempotency import InMemoryIdempotencyStore, PostgresIdempotencyStore
 from .repository import PostgresUserRepository
 
-__all__ = ["MailhogEmailSender", "PostgresUserRepository"]
+__all__ = [
+    "AsyncSmtpEmailSender",
+    "CircuitBreakerEmailSender",
+    "MailhogEmailSender",
+    "ScheduledEmailSender",
+    "InMemoryIdempotencyStore",
+    "PostgresIdempotencyStore",
+    "PostgresUserRepository",
+]
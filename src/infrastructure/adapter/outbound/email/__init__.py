@@ -1,3 +1,15 @@
+from .activation_email_templates import ActivationEmailTemplates
+from .async_smtp_email_sender import AsyncSmtpEmailSender
+from .circuit_breaker_email_sender import CircuitBreakerEmailSender
+from .email_retry_queue import EmailRetryQueue
 from .mailhog_email_sender import MailhogEmailSender
+from .scheduled_email_sender import ScheduledEmailSender
 
-__all__ = ["MailhogEmailSender"]
+__all__ = [
+    "ActivationEmailTemplates",
+    "AsyncSmtpEmailSender",
+    "CircuitBreakerEmailSender",
+    "EmailRetryQueue",
+    "MailhogEmailSender",
+    "ScheduledEmailSender",
+]
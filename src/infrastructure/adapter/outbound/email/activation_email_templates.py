@@ -0,0 +1,139 @@
+import binascii
+import html
+import re
+from email import charset as email_charset
+from email import policy
+from email.mime.multipart import MIMEMultipart
+from datetime import datetime, timedelta, timezone
+from email.mime.text import MIMEText
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from src.infrastructure.config import ActivationConfig
+
+DEFAULT_TEMPLATE_DIRECTORY = Path(__file__).parent / "templates"
+PLACEHOLDER = re.compile(r"\$\{(\w+)\}")
+COMPILED_PLACEHOLDER = re.compile(rb"\$\{(header|text|html):(\w+)\}")
+
+_QUOTED_PRINTABLE_UTF8 = email_charset.Charset("utf-8")
+_QUOTED_PRINTABLE_UTF8.body_encoding = email_charset.QP
+
+DEFAULT_LINK_TTL = timedelta(seconds=ActivationConfig.token_ttl_seconds)
+
+
+class CompiledTemplate:
+    """Pre-serialized email whose placeholders are filled by joining byte segments"""
+
+    def __init__(self, serialized: bytes):
+        parts = COMPILED_PLACEHOLDER.split(serialized)
+        self._literals = parts[0::3]
+        self._placeholders = [
+            (context.decode(), name.decode())
+            for context, name in zip(parts[1::3], parts[2::3])
+        ]
+
+    @property
+    def placeholders(self) -> set[str]:
+        return {name for _, name in self._placeholders}
+
+    def render(self, **values: str) -> bytes:
+        encoded = {
+            (context, name): _encode(context, values[name])
+            for context, name in set(self._placeholders)
+        }
+        segments = [self._literals[0]]
+        for placeholder, literal in zip(self._placeholders, self._literals[1:]):
+            segments.append(encoded[placeholder])
+            segments.append(literal)
+        return b"".join(segments)
+
+
+class ActivationEmailTemplates:
+    """Per-locale activation emails (plain-text and HTML), compiled once at load.
+    Each template set ("activation", "activation_link") is a directory of locales."""
+
+    def __init__(self, compiled: dict[str, CompiledTemplate], default_locale: str):
+        if default_locale not in compiled:
+            raise ValueError(
+                f"No activation email template for locale: {default_locale}"
+            )
+        self.compiled = compiled
+        self.default_locale = default_locale
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load(
+        sender_email: str,
+        default_locale: str = "en",
+        directory: Optional[str] = None,
+        name: str = "activation",
+    ) -> "ActivationEmailTemplates":
+        """Loads and compiles every locale of a template set, once per process"""
+        root = Path(directory or DEFAULT_TEMPLATE_DIRECTORY) / name
+        compiled = {
+            locale_dir.name: compile_template(
+                subject=(locale_dir / "subject.txt").read_text("utf-8").strip(),
+                text=(locale_dir / "body.txt").read_text("utf-8"),
+                html_body=(locale_dir / "body.html").read_text("utf-8"),
+                sender_email=sender_email,
+            )
+            for locale_dir in sorted(root.iterdir())
+            if locale_dir.is_dir()
+        }
+        return ActivationEmailTemplates(compiled, default_locale)
+
+    def resolve(self, locale: Optional[str]) -> CompiledTemplate:
+        """Picks the exact locale, then its language ("fr-CA" -> "fr"), then the default"""
+        if locale:
+            normalized = locale.replace("_", "-").lower()
+            for candidate in (normalized, normalized.split("-")[0]):
+                if candidate in self.compiled:
+                    return self.compiled[candidate]
+        return self.compiled[self.default_locale]
+
+    def render(self, locale: Optional[str], **values: str) -> bytes:
+        return self.resolve(locale).render(**values)
+
+
+def compile_template(
+    subject: str, text: str, html_body: str, sender_email: str
+) -> CompiledTemplate:
+    """Serializes a multipart/alternative message once, with tagged placeholders"""
+    message = MIMEMultipart("alternative")
+    message["Subject"] = subject
+    message["From"] = sender_email
+    message["To"] = "${header:recipient}"
+    for subtype, body in (("plain", text), ("html", html_body)):
+        context = "text" if subtype == "plain" else "html"
+        tagged = PLACEHOLDER.sub(rf"${{{context}:\1}}", body)
+        message.attach(MIMEText(tagged, subtype, _QUOTED_PRINTABLE_UTF8))
+
+    serialized = message.as_bytes(policy=policy.SMTP)
+    compiled = CompiledTemplate(serialized)
+    expected = set(PLACEHOLDER.findall(text)) | set(PLACEHOLDER.findall(html_body))
+    if not expected <= compiled.placeholders:
+        raise ValueError(f"Placeholders split while encoding template: {subject}")
+    return compiled
+
+
+def expires_in_minutes(expires_at: Optional[datetime]) -> str:
+    """Minutes left before expires_at, at least one: the email may be sent a while
+    after the link was issued. Without expires_at, the default link TTL."""
+    left = (
+        expires_at - datetime.now(timezone.utc)
+        if expires_at is not None
+        else DEFAULT_LINK_TTL
+    )
+    return str(max(1, round(left.total_seconds() / 60)))
+
+
+def _encode(context: str, value: str) -> bytes:
+    if context == "header":
+        if "\r" in value or "\n" in value:
+            raise ValueError("Line breaks are not allowed in email headers")
+        return value.encode("utf-8")
+    if context == "html":
+        value = html.escape(value)
+    # Soft line breaks of long values (links) must follow the CRLF of the message
+    return binascii.b2a_qp(value.encode("utf-8")).replace(b"=\n", b"=\r\n")
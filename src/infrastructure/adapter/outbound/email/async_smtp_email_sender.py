@@ -0,0 +1,195 @@
+import asyncio
+import re
+import socket
+from datetime import datetime
+from typing import Optional
+
+from src.domain.exception import DeadlineExceededException
+from src.domain.model import Email
+from src.domain.port import AsyncEmailSenderPort, EmailDeliveryException
+from src.infrastructure.config import SmtpConfig
+from src.infrastructure.deadline import bounded_timeout, deadline_exceeded
+from .activation_email_templates import ActivationEmailTemplates, expires_in_minutes
+
+LEADING_DOT = re.compile(rb"^\.", re.MULTILINE)
+# "Service not available, closing transmission channel": also how servers drop
+# a session that stayed idle too long
+SERVICE_NOT_AVAILABLE = 421
+
+
+class SmtpReplyError(EmailDeliveryException):
+    def __init__(self, code: int, lines: list[str]):
+        super().__init__(f"SMTP error: {code} {' '.join(lines)}")
+        self.code = code
+
+
+class SmtpConnection:
+    """One SMTP session over asyncio streams. With the PIPELINING extension
+    (RFC 2920), the whole envelope is sent in a single round trip."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.extensions: set[str] = set()
+
+    @classmethod
+    async def open(cls, host: str, port: int) -> "SmtpConnection":
+        reader, writer = await asyncio.open_connection(host, port)
+        connection = cls(reader, writer)
+        try:
+            await connection.expect(220)
+            connection.writer.write(f"EHLO {socket.getfqdn()}\r\n".encode())
+            lines = await connection.expect(250)
+        except BaseException:
+            connection.abort()
+            raise
+        connection.extensions = {line.split(" ")[0].upper() for line in lines[1:]}
+        return connection
+
+    @property
+    def pipelining(self) -> bool:
+        return "PIPELINING" in self.extensions
+
+    async def send(self, sender: str, recipients: list[str], message: bytes) -> None:
+        envelope = [f"MAIL FROM:<{sender}>\r\n".encode()] + [
+            f"RCPT TO:<{recipient}>\r\n".encode() for recipient in recipients
+        ]
+        if self.pipelining:
+            self.writer.write(b"".join(envelope) + b"DATA\r\n")
+            replies = [await self.read_reply() for _ in range(len(envelope) + 1)]
+        else:
+            replies = []
+            for command in [*envelope, b"DATA\r\n"]:
+                self.writer.write(command)
+                replies.append(await self.read_reply())
+                if replies[-1][0] >= 400:
+                    break
+        for (code, lines), expected in zip(replies, [250] * len(envelope) + [354]):
+            if code != expected:
+                raise SmtpReplyError(code, lines)
+
+        body = LEADING_DOT.sub(b"..", message)
+        if not body.endswith(b"\r\n"):
+            body += b"\r\n"
+        self.writer.write(body + b".\r\n")
+        await self.expect(250)
+
+    async def read_reply(self) -> tuple[int, list[str]]:
+        lines = []
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                raise ConnectionResetError("SMTP connection closed")
+            lines.append(line[4:].decode(errors="replace").strip())
+            if line[3:4] != b"-":
+                return int(line[:3]), lines
+
+    async def expect(self, code: int) -> list[str]:
+        await self.writer.drain()
+        reply_code, lines = await self.read_reply()
+        if reply_code != code:
+            raise SmtpReplyError(reply_code, lines)
+        return lines
+
+    async def quit(self) -> None:
+        try:
+            self.writer.write(b"QUIT\r\n")
+            await self.writer.drain()
+            await self.read_reply()
+        except (OSError, EmailDeliveryException):
+            pass
+        finally:
+            self.abort()
+
+    def abort(self) -> None:
+        self.writer.close()
+
+
+class AsyncSmtpEmailSender(AsyncEmailSenderPort):
+    """Sends emails on the event loop over up to max_connections SMTP sessions,
+    which stay open between emails"""
+
+    def __init__(self, config: SmtpConfig = SmtpConfig()):
+        self.config = config
+        self.templates = ActivationEmailTemplates.load(
+            config.sender_email, config.default_locale, config.template_directory
+        )
+        self.link_templates = ActivationEmailTemplates.load(
+            config.sender_email,
+            config.default_locale,
+            config.template_directory,
+            "activation_link",
+        )
+        self._idle: list[SmtpConnection] = []
+        # Created on first use, within the event loop of the sender
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def send_activation_email(
+        self,
+        email: Email,
+        activation_code: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        message = self.templates.render(
+            locale, recipient=email.value, activation_code=activation_code
+        )
+        await self._send(email, message)
+
+    async def send_activation_link(
+        self,
+        email: Email,
+        activation_token: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        message = self.link_templates.render(
+            locale,
+            recipient=email.value,
+            activation_link=self.config.activation_link_url + activation_token,
+            expires_in_minutes=expires_in_minutes(expires_at),
+        )
+        await self._send(email, message)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(connection.quit() for connection in idle))
+
+    async def _send(self, email: Email, message: bytes) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.config.max_connections)
+        async with self._slots:
+            for attempt in range(2):
+                # The other idle sessions waited as long as a dead one: the
+                # retry opens a new session instead of trying them
+                reused = not attempt and bool(self._idle)
+                connection = None
+                try:
+                    async with asyncio.timeout(bounded_timeout(self.config.timeout)):
+                        connection = self._idle.pop() if reused else None
+                        if connection is None:
+                            connection = await SmtpConnection.open(
+                                self.config.host, self.config.port
+                            )
+                        await connection.send(
+                            self.config.sender_email, [email.value], message
+                        )
+                except (OSError, TimeoutError, EmailDeliveryException) as exception:
+                    if connection is not None:
+                        connection.abort()
+                    # An idle session may have been closed by the server: retry once
+                    if reused and _session_lost(exception):
+                        continue
+                    if isinstance(exception, TimeoutError) and deadline_exceeded():
+                        raise DeadlineExceededException("Request deadline exceeded.")
+                    if isinstance(exception, EmailDeliveryException):
+                        raise
+                    raise EmailDeliveryException(f"SMTP error: {exception!r}")
+                self._idle.append(connection)
+                return
+
+
+def _session_lost(exception: Exception) -> bool:
+    if isinstance(exception, SmtpReplyError):
+        return exception.code == SERVICE_NOT_AVAILABLE
+    return not isinstance(exception, EmailDeliveryException)
@@ -0,0 +1,91 @@
+from datetime import datetime
+from functools import partial
+from typing import Callable, Optional
+
+from src.domain.exception import DeadlineExceededException
+from src.domain.model import Email
+from src.domain.port import EmailSenderPort, EmailDeliveryException
+from src.infrastructure.config import CircuitBreakerConfig
+from src.infrastructure.deadline import deadline_exceeded
+from src.infrastructure.resilience import CircuitBreaker, CircuitOpenError
+from .email_retry_queue import EmailRetryQueue
+
+
+class CircuitBreakerEmailSender(EmailSenderPort):
+    """Guards an email sender with a circuit breaker. While the circuit is open,
+    emails fail fast, or are deferred to a retry queue with the "queue" fallback."""
+
+    def __init__(
+        self,
+        delegate: EmailSenderPort,
+        config: CircuitBreakerConfig = CircuitBreakerConfig(),
+        breaker: Optional[CircuitBreaker] = None,
+        retry_queue: Optional[EmailRetryQueue] = None,
+    ):
+        self.delegate = delegate
+        self.config = config
+        self.breaker = breaker or CircuitBreaker(config)
+        if retry_queue is None and config.fallback == "queue":
+            retry_queue = EmailRetryQueue(
+                config.retry_queue_size, config.retry_interval_seconds
+            )
+        self.retry_queue = retry_queue
+
+    def send_activation_email(
+        self,
+        email: Email,
+        activation_code: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        self._send(
+            partial(
+                self.delegate.send_activation_email,
+                email,
+                activation_code,
+                locale,
+                expires_at,
+            )
+        )
+
+    def send_activation_link(
+        self,
+        email: Email,
+        activation_token: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        self._send(
+            partial(
+                self.delegate.send_activation_link,
+                email,
+                activation_token,
+                locale,
+                expires_at,
+            )
+        )
+
+    def warm_up(self) -> None:
+        self.delegate.warm_up()
+
+    def close(self) -> None:
+        if self.retry_queue is not None:
+            self.retry_queue.stop()
+        self.delegate.close()
+
+    def _send(self, send: Callable[[], None]) -> None:
+        # A request out of budget says nothing about the SMTP server: it does not
+        # reach the breaker. A send that runs past the deadline does, as a failure.
+        if deadline_exceeded():
+            raise DeadlineExceededException("Request deadline exceeded.")
+        try:
+            self.breaker.call(send)
+        except (CircuitOpenError, EmailDeliveryException, OSError) as exception:
+            if self.retry_queue is not None:
+                self.retry_queue.put(partial(self.breaker.call, send))
+            elif isinstance(exception, CircuitOpenError):
+                raise EmailDeliveryException(
+                    "Email delivery is temporarily unavailable"
+                )
+            else:
+                raise
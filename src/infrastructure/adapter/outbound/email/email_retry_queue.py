@@ -0,0 +1,61 @@
+import logging
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from src.domain.port import EmailDeliveryException
+
+logger = logging.getLogger(__name__)
+
+
+class EmailRetryQueue:
+    """Bounded, process-local queue of emails retried in the background, in order.
+    Emails still queued when the process stops are lost."""
+
+    def __init__(self, max_size: int = 1000, retry_interval_seconds: float = 5.0):
+        self.max_size = max_size
+        self.retry_interval_seconds = retry_interval_seconds
+        self._pending: deque[Callable[[], None]] = deque()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, send: Callable[[], None]) -> None:
+        with self._lock:
+            if len(self._pending) >= self.max_size:
+                raise EmailDeliveryException("Email retry queue is full")
+            self._pending.append(send)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="email-retry", daemon=True
+                )
+                self._thread.start()
+
+    def drain(self) -> int:
+        """Sends queued emails until one fails, returns how many were sent"""
+        sent = 0
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return sent
+                send = self._pending[0]
+            try:
+                send()
+            except Exception as exception:
+                logger.warning("Queued email not sent yet: %s", exception)
+                return sent
+            with self._lock:
+                self._pending.popleft()
+            sent += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._pending:
+            logger.warning("%d queued emails dropped", len(self._pending))
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.retry_interval_seconds):
+            self.drain()
@@ -1,27 +1,150 @@
 import smtplib
-from email.mime.text import MIMEText
+import threading
+import time
+from datetime import datetime
+from typing import Optional
 
+from src.domain.exception import DeadlineExceededException
 from src.domain.model import Email
 from src.domain.port import EmailSenderPort, EmailDeliveryException
 from src.infrastructure.config import SmtpConfig
+from src.infrastructure.deadline import bounded_timeout, deadline_exceeded
+from .activation_email_templates import ActivationEmailTemplates, expires_in_minutes
 
 
 class MailhogEmailSender(EmailSenderPort):
     def __init__(self, config: SmtpConfig = SmtpConfig()):
         self.config = config
+        self.templates = ActivationEmailTemplates.load(
+            config.sender_email, config.default_locale, config.template_directory
+        )
+        self.link_templates = ActivationEmailTemplates.load(
+            config.sender_email,
+            config.default_locale,
+            config.template_directory,
+            "activation_link",
+        )
+        # LIFO reuse of open sessions saves a TCP and SMTP handshake per email
+        # With the monotonic time they were checked in at
+        self._sessions: list[tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
 
-    def send_activation_email(self, email: Email, activation_code: str) -> None:
-        message = MIMEText(f"Your activation code is: {activation_code}")
-        message["Subject"] = "Activate Your Account"
-        message["From"] = self.config.sender_email
-        message["To"] = email.value
+    def warm_up(self) -> None:
+        """Opens the idle SMTP sessions ahead of the first emails"""
+        with self._lock:
+            missing = self.config.max_idle_sessions - len(self._sessions)
+        for _ in range(missing):
+            self._check_in(self._connect(self.config.timeout))
 
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for server, _ in sessions:
+            self._close_quietly(server)
+
+    def send_activation_email(
+        self,
+        email: Email,
+        activation_code: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        message = self.templates.render(
+            locale, recipient=email.value, activation_code=activation_code
+        )
+        self._send(email, message)
+
+    def send_activation_link(
+        self,
+        email: Email,
+        activation_token: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        message = self.link_templates.render(
+            locale,
+            recipient=email.value,
+            activation_link=self.config.activation_link_url + activation_token,
+            expires_in_minutes=expires_in_minutes(expires_at),
+        )
+        self._send(email, message)
+
+    def _send(self, email: Email, message: bytes) -> None:
+        for attempt in range(2):
+            # Socket timeout of this dialogue, shortened to the request deadline
+            timeout = bounded_timeout(self.config.timeout)
+            if attempt:
+                # The other idle sessions waited as long as the dead one: the
+                # retry opens a new session instead of trying them
+                server, reused = self._connect(timeout), False
+            else:
+                server, reused = self._check_out(timeout)
+            try:
+                server.sock.settimeout(timeout)
+                server.sendmail(self.config.sender_email, [email.value], message)
+            except (smtplib.SMTPException, TimeoutError) as exception:
+                self._close_quietly(server)
+                # An idle session may have been closed by the server: retry once
+                if (
+                    isinstance(exception, smtplib.SMTPServerDisconnected)
+                    and reused
+                    and not attempt
+                    and not deadline_exceeded()
+                ):
+                    continue
+                raise _delivery_error(exception)
+            self._check_in(server)
+            return
+
+    def _connect(self, timeout: float) -> smtplib.SMTP:
+        try:
+            return smtplib.SMTP(
+                host=self.config.host, port=self.config.port, timeout=timeout
+            )
+        except (smtplib.SMTPException, TimeoutError) as exception:
+            raise _delivery_error(exception)
+
+    def _check_out(self, timeout: float) -> tuple[smtplib.SMTP, bool]:
+        while True:
+            with self._lock:
+                if not self._sessions:
+                    break
+                server, idle_since = self._sessions.pop()
+            idle_seconds = time.monotonic() - idle_since
+            if idle_seconds < self.config.idle_check_seconds or self._alive(
+                server, timeout
+            ):
+                return server, True
+            self._close_quietly(server)
+        return self._connect(timeout), False
+
+    def _check_in(self, server: smtplib.SMTP) -> None:
+        with self._lock:
+            if len(self._sessions) < self.config.max_idle_sessions:
+                self._sessions.append((server, time.monotonic()))
+                return
+        self._close_quietly(server)
+
+    @staticmethod
+    def _alive(server: smtplib.SMTP, timeout: float) -> bool:
+        try:
+            server.sock.settimeout(timeout)
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _close_quietly(server: smtplib.SMTP) -> None:
         try:
-            with smtplib.SMTP(
-                host=self.config.host,
-                port=self.config.port,
-                timeout=self.config.timeout,
-            ) as server:
-                server.send_message(message)
-        except smtplib.SMTPException as exception:
-            raise EmailDeliveryException(f"SMTP error: {exception}")
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+def _delivery_error(exception: Exception) -> Exception:
+    """Timeouts past the request deadline are reported as such, not as SMTP errors"""
+    if deadline_exceeded():
+        return DeadlineExceededException("Request deadline exceeded.")
+    if isinstance(exception, smtplib.SMTPException):
+        return EmailDeliveryException(f"SMTP error: {exception}")
+    return EmailDeliveryException(f"SMTP error: {exception!r}")
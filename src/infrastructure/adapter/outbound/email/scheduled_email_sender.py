@@ -0,0 +1,258 @@
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Callable, Optional
+
+from src.domain.model import Email
+from src.domain.port import EmailSenderPort, EmailDeliveryException
+from src.infrastructure.config import EmailSchedulerConfig
+from src.infrastructure.resilience import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Lanes, highest priority first: activation codes expire within a minute, links
+# last longer, and retries wait behind fresh emails
+CODE, LINK, RETRY = 0, 1, 2
+
+
+@dataclass
+class _Job:
+    send: Callable[[], None]
+    domain: str
+    expires_at: Optional[datetime]
+    attempts: int = 0
+    # clock() time before which a retry is not sent
+    not_before: float = 0.0
+
+
+def recipient_domain(email: Email) -> str:
+    return email.value.rsplit("@", 1)[-1].lower()
+
+
+class ScheduledEmailSender(EmailSenderPort):
+    """Queues emails and sends them from worker threads, shaped per recipient
+    domain: each domain has a token bucket, so that a burst of registrations at
+    one provider is spread out instead of throttled, while emails to the other
+    domains keep flowing. Emails are taken by lane, then round-robin across
+    domains. An email whose expires_at has passed is dropped instead of sent.
+
+    Sending returns once the email is queued: delivery failures are retried, then
+    logged, but no longer reach the caller. With workers=0, nothing is sent in
+    the background and emails are only sent by step()."""
+
+    def __init__(
+        self,
+        delegate: EmailSenderPort,
+        config: EmailSchedulerConfig = EmailSchedulerConfig(),
+        clock: Callable[[], float] = time.monotonic,
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.delegate = delegate
+        self.config = config
+        self._clock = clock
+        self._now = now
+        self._lanes: list[OrderedDict[str, deque[_Job]]] = [
+            OrderedDict() for _ in (CODE, LINK, RETRY)
+        ]
+        self._queued = 0
+        # Jobs taken from the queue and not delivered yet
+        self._in_flight = 0
+        self._buckets: dict[str, TokenBucket] = {}
+        self._condition = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._closed = False
+        # Past the drain timeout: retries are dropped instead of queued
+        self._abandoned = False
+
+    def __len__(self) -> int:
+        return self._queued
+
+    def send_activation_email(
+        self,
+        email: Email,
+        activation_code: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        send = partial(
+            self.delegate.send_activation_email,
+            email,
+            activation_code,
+            locale,
+            expires_at,
+        )
+        self._put(CODE, _Job(send, recipient_domain(email), expires_at))
+
+    def send_activation_link(
+        self,
+        email: Email,
+        activation_token: str,
+        locale: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        send = partial(
+            self.delegate.send_activation_link,
+            email,
+            activation_token,
+            locale,
+            expires_at,
+        )
+        self._put(LINK, _Job(send, recipient_domain(email), expires_at))
+
+    def warm_up(self) -> None:
+        self.delegate.warm_up()
+
+    def close(self) -> None:
+        """Stops accepting emails and sends the queued ones, for at most
+        drain_timeout_seconds. The emails still queued then are dropped, and the
+        delegate is closed once the ones being sent are."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        give_up_at = time.monotonic() + self.config.drain_timeout_seconds
+        for worker in self._workers:
+            worker.join(max(0.0, give_up_at - time.monotonic()))
+        with self._condition:
+            dropped = self._queued
+            for lane in self._lanes:
+                lane.clear()
+            self._queued = 0
+            self._abandoned = True
+            self._condition.notify_all()
+            while self._in_flight:
+                self._condition.wait()
+        if dropped:
+            logger.warning("%d queued emails dropped", dropped)
+        self.delegate.close()
+
+    def step(self) -> bool:
+        """Sends the next email ready to go, returns whether there was one"""
+        with self._condition:
+            job, _ = self._next_job()
+        if job is None:
+            return False
+        self._deliver(job)
+        return True
+
+    def _put(self, lane: int, job: _Job, retry: bool = False) -> None:
+        with self._condition:
+            if not retry:
+                if self._closed:
+                    raise EmailDeliveryException("Email sender is closed")
+                if self._queued >= self.config.max_queued:
+                    raise EmailDeliveryException("Email send queue is full")
+            elif self._abandoned:
+                logger.error("Email to %s dropped on close", job.domain)
+                return
+            self._lanes[lane].setdefault(job.domain, deque()).append(job)
+            self._queued += 1
+            self._start_workers()
+            self._condition.notify()
+
+    def _start_workers(self) -> None:
+        while len(self._workers) < self.config.workers:
+            worker = threading.Thread(
+                target=self._work,
+                name=f"email-scheduler-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                job, wait = self._next_job()
+                while job is None:
+                    if self._closed and not self._queued:
+                        return
+                    self._condition.wait(wait)
+                    job, wait = self._next_job()
+            self._deliver(job)
+
+    def _next_job(self) -> tuple[Optional[_Job], Optional[float]]:
+        """Takes the first email, by lane, whose domain has a token left. Otherwise
+        returns how long until one may have (None: no email is queued)."""
+        now = self._clock()
+        wait = None
+        for lane in self._lanes:
+            for domain, jobs in list(lane.items()):
+                self._drop_expired(jobs)
+                if not jobs:
+                    del lane[domain]
+                    continue
+                ready_in = jobs[0].not_before - now
+                if ready_in <= 0:
+                    bucket = self._bucket(domain)
+                    if bucket.try_acquire():
+                        job = jobs.popleft()
+                        self._taken(lane, domain, jobs)
+                        self._in_flight += 1
+                        return job, None
+                    ready_in = bucket.wait_seconds()
+                wait = ready_in if wait is None else min(wait, ready_in)
+        return None, wait
+
+    def _taken(self, lane: OrderedDict, domain: str, jobs: deque) -> None:
+        self._queued -= 1
+        if jobs:
+            lane.move_to_end(domain)
+        else:
+            del lane[domain]
+        if not self._queued:
+            # A full bucket behaves as a new one: forget the idle domains
+            self._buckets = {
+                domain: bucket
+                for domain, bucket in self._buckets.items()
+                if not bucket.full
+            }
+
+    def _drop_expired(self, jobs: deque) -> None:
+        while jobs and self._expired(jobs[0]):
+            job = jobs.popleft()
+            self._queued -= 1
+            logger.warning("Expired email to %s dropped", job.domain)
+
+    def _expired(self, job: _Job, delay_seconds: float = 0.0) -> bool:
+        return job.expires_at is not None and (
+            self._now() + timedelta(seconds=delay_seconds) >= job.expires_at
+        )
+
+    def _bucket(self, domain: str) -> TokenBucket:
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            rate = self.config.domain_rates.get(domain, self.config.per_domain_rate)
+            bucket = self._buckets[domain] = TokenBucket(
+                rate, self.config.per_domain_burst, self._clock
+            )
+        return bucket
+
+    def _deliver(self, job: _Job) -> None:
+        try:
+            self._attempt(job)
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _attempt(self, job: _Job) -> None:
+        try:
+            job.send()
+        except Exception as exception:
+            job.attempts += 1
+            delay = self.config.retry_delay_seconds
+            if job.attempts >= self.config.max_attempts or self._expired(job, delay):
+                logger.error(
+                    "Email to %s dropped after %d attempts: %s",
+                    job.domain,
+                    job.attempts,
+                    exception,
+                )
+                return
+            logger.warning("Email to %s not sent yet: %s", job.domain, exception)
+            job.not_before = self._clock() + delay
+            self._put(RETRY, job, retry=True)
@@ -0,0 +1,4 @@
+from .in_memory_idempotency_store import InMemoryIdempotencyStore
+from .postgres_idempotency_store import PostgresIdempotencyStore
+
+__all__ = ["InMemoryIdempotencyStore", "PostgresIdempotencyStore"]
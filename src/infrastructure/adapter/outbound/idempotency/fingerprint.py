@@ -0,0 +1,10 @@
+import hashlib
+import hmac
+import json
+
+
+def request_fingerprint(key: bytes, payload: dict) -> str:
+    """HMAC-SHA256 of the payload: a plain hash of a payload with a password would
+    be an unsalted password hash, cracked offline from a read of the store"""
+    serialized = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hmac.new(key, serialized, hashlib.sha256).hexdigest()
@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.domain.exception import DeadlineExceededException
+from src.domain.port import (
+    IdempotencyStorePort,
+    IdempotentResponse,
+    IdempotencyKeyMismatchException,
+    IdempotencyKeyInFlightException,
+)
+from src.infrastructure.config import IdempotencyConfig
+from src.infrastructure.deadline import bounded_timeout, deadline_exceeded
+from .fingerprint import request_fingerprint
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    expires_at: float
+    response: Optional[IdempotentResponse] = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class InMemoryIdempotencyStore(IdempotencyStorePort):
+    """Bounded, process-local idempotency store evicting the least recently used keys"""
+
+    def __init__(self, config: IdempotencyConfig = IdempotencyConfig()):
+        self.config = config
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fingerprint(self, payload: dict) -> str:
+        return request_fingerprint(self.config.fingerprint_key, payload)
+
+    def begin(self, key: str, fingerprint: str) -> Optional[IdempotentResponse]:
+        give_up_at = time.monotonic() + bounded_timeout(
+            self.config.wait_timeout_seconds
+        )
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry.expires_at <= time.monotonic():
+                    self._entries[key] = _Entry(
+                        fingerprint=fingerprint,
+                        expires_at=time.monotonic() + self.config.ttl_seconds,
+                    )
+                    self._evict()
+                    return None
+                if entry.fingerprint != fingerprint:
+                    raise IdempotencyKeyMismatchException(
+                        "Idempotency key already used with a different request."
+                    )
+                if entry.response is not None:
+                    self._entries.move_to_end(key)
+                    return entry.response
+
+            # Another request owns the key: wait for its result outside the lock
+            if not entry.done.wait(timeout=max(0.0, give_up_at - time.monotonic())):
+                if deadline_exceeded():
+                    raise DeadlineExceededException("Request deadline exceeded.")
+                raise IdempotencyKeyInFlightException(
+                    "A request with the same idempotency key is still in progress."
+                )
+
+    def complete(self, key: str, response: IdempotentResponse) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.response = response
+            self._entries.move_to_end(key)
+            entry.done.set()
+
+    def abandon(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.response is not None:
+                return
+            del self._entries[key]
+            entry.done.set()
+
+    def _evict(self) -> None:
+        """Drops the oldest completed entries once the store exceeds its capacity"""
+        overflow = len(self._entries) - self.config.max_entries
+        if overflow <= 0:
+            return
+        for key in list(self._entries):
+            if overflow == 0:
+                break
+            if self._entries[key].done.is_set():
+                del self._entries[key]
+                overflow -= 1
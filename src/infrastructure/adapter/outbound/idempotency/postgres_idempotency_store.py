@@ -0,0 +1,107 @@
+import time
+from typing import Optional
+
+from psycopg2.extras import Json
+
+from src.domain.exception import DeadlineExceededException
+from src.domain.port import (
+    IdempotencyStorePort,
+    IdempotentResponse,
+    IdempotencyKeyMismatchException,
+    IdempotencyKeyInFlightException,
+)
+from src.infrastructure.adapter.outbound.repository import ConnectionPool
+from src.infrastructure.config import DatabaseConfig, IdempotencyConfig
+from src.infrastructure.deadline import bounded_timeout, deadline_exceeded
+from .fingerprint import request_fingerprint
+
+
+class PostgresIdempotencyStore(IdempotencyStorePort):
+    """Idempotency store shared by every worker through the idempotency_keys table"""
+
+    def __init__(
+        self,
+        db_config: DatabaseConfig,
+        config: IdempotencyConfig = IdempotencyConfig(),
+        pool: Optional[ConnectionPool] = None,
+    ):
+        self.db_config = db_config
+        self.config = config
+        self.pool = pool or ConnectionPool(db_config)
+
+    def fingerprint(self, payload: dict) -> str:
+        return request_fingerprint(self.config.fingerprint_key, payload)
+
+    def begin(self, key: str, fingerprint: str) -> Optional[IdempotentResponse]:
+        claim = """
+        INSERT INTO idempotency_keys (key, fingerprint, expires_at)
+        VALUES (%s, %s, now() + make_interval(secs => %s))
+        ON CONFLICT (key) DO NOTHING
+        RETURNING key
+        """
+        purge_expired = (
+            "DELETE FROM idempotency_keys WHERE key = %s AND expires_at <= now()"
+        )
+        lookup = (
+            "SELECT fingerprint, status_code, body FROM idempotency_keys WHERE key = %s"
+        )
+
+        give_up_at = time.monotonic() + bounded_timeout(
+            self.config.wait_timeout_seconds
+        )
+        while True:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(purge_expired, (key,))
+                    cur.execute(claim, (key, fingerprint, self.config.ttl_seconds))
+                    claimed = cur.fetchone() is not None
+                    row = None
+                    if not claimed:
+                        cur.execute(lookup, (key,))
+                        row = cur.fetchone()
+                conn.commit()
+
+            if claimed:
+                return None
+            if row is not None:
+                stored_fingerprint, status_code, body = row
+                if stored_fingerprint != fingerprint:
+                    raise IdempotencyKeyMismatchException(
+                        "Idempotency key already used with a different request."
+                    )
+                if status_code is not None:
+                    return IdempotentResponse(status_code=status_code, body=body)
+
+            # Another worker owns the key: poll until it completes or abandons it
+            left = give_up_at - time.monotonic()
+            if left <= 0:
+                if deadline_exceeded():
+                    raise DeadlineExceededException("Request deadline exceeded.")
+                raise IdempotencyKeyInFlightException(
+                    "A request with the same idempotency key is still in progress."
+                )
+            time.sleep(min(self.config.poll_interval_seconds, left))
+
+    def complete(self, key: str, response: IdempotentResponse) -> None:
+        query = """
+        UPDATE idempotency_keys SET status_code = %s, body = %s
+        WHERE key = %s AND status_code IS NULL
+        """
+        # Keeps the table bounded by the TTL without a separate cleanup job
+        purge_expired = """
+        DELETE FROM idempotency_keys WHERE key IN (
+            SELECT key FROM idempotency_keys WHERE expires_at <= now() LIMIT 100
+        )
+        """
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (response.status_code, Json(response.body), key))
+                cur.execute(purge_expired)
+            conn.commit()
+
+    def abandon(self, key: str) -> None:
+        query = "DELETE FROM idempotency_keys WHERE key = %s AND status_code IS NULL"
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (key,))
+            conn.commit()
@@ -1,3 +1,32 @@
+from .connection_pool import ConnectionPool, PreparedStatement
+from .group_commit_user_repository import GroupCommitUserRepository
 from .postgres_user_repository import PostgresUserRepository
+from .shard_routing_index import (
+    ShardRoutingIndex,
+    InMemoryShardRoutingIndex,
+    PostgresShardRoutingIndex,
+)
+from .sharded_user_repository import (
+    RebalanceReport,
+    ShardedUserRepository,
+    shard_for_email,
+)
+from .slow_query_log import SlowQueryLog
+from .single_flight_user_repository import SingleFlightUserRepository
+from .sqlite_user_repository import SqliteUserRepository
 
-__all__ = ["PostgresUserRepository"]
+__all__ = [
+    "ConnectionPool",
+    "PreparedStatement",
+    "GroupCommitUserRepository",
+    "PostgresUserRepository",
+    "ShardRoutingIndex",
+    "InMemoryShardRoutingIndex",
+    "PostgresShardRoutingIndex",
+    "RebalanceReport",
+    "ShardedUserRepository",
+    "shard_for_email",
+    "SlowQueryLog",
+    "SingleFlightUserRepository",
+    "SqliteUserRepository",
+]
@@ -0,0 +1,162 @@
+import itertools
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterator, Optional
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+
+from src.domain.exception import DeadlineExceededException
+from src.infrastructure.config.database_config import DatabaseConfig
+from src.infrastructure.deadline import bounded_timeout, deadline_exceeded
+
+
+class PooledConnection(extensions.connection):
+    """Connection remembering the statements prepared in its server session"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements: set[str] = set()
+
+
+@dataclass(frozen=True)
+class PreparedStatement:
+    """SQL statement prepared once per server session and then executed by name"""
+
+    name: str
+    sql: str
+
+    @cached_property
+    def prepare_sql(self) -> str:
+        position = itertools.count(1)
+        numbered = re.sub("%s", lambda _: f"${next(position)}", self.sql)
+        return f"PREPARE {self.name} AS {numbered}"
+
+    @cached_property
+    def execute_sql(self) -> str:
+        placeholders = ", ".join(["%s"] * self.sql.count("%s"))
+        return f"EXECUTE {self.name} ({placeholders})"
+
+    def execute(
+        self,
+        conn,
+        cursor,
+        params: tuple,
+        prepared: bool = True,
+        statement_timeout_ms: Optional[int] = None,
+    ) -> None:
+        """Executes the statement, preparing it first on sessions that lack it.
+        A statement timeout is set for the transaction in the same round trip."""
+        prefix = (
+            f"SET LOCAL statement_timeout = {int(statement_timeout_ms)}; "
+            if statement_timeout_ms is not None
+            else ""
+        )
+        if not prepared:
+            cursor.execute(prefix + self.sql, params)
+            return
+        if self.name not in conn.prepared_statements:
+            cursor.execute(self.prepare_sql)
+            conn.prepared_statements.add(self.name)
+        try:
+            cursor.execute(prefix + self.execute_sql, params)
+        except psycopg2.errors.InvalidSqlStatementName:
+            # The server session lost its statements (reset, DISCARD ALL, ...)
+            conn.rollback()
+            conn.prepared_statements.clear()
+            cursor.execute(self.prepare_sql)
+            conn.prepared_statements.add(self.name)
+            cursor.execute(prefix + self.execute_sql, params)
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of long-lived database connections"""
+
+    def __init__(self, db_config: DatabaseConfig):
+        self.db_config = db_config
+        # LIFO reuse keeps the hottest sessions (and their prepared statements) busy
+        self._idle: list = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(db_config.max_pool_size)
+
+    def _connect(self):
+        return psycopg2.connect(
+            dbname=self.db_config.database,
+            user=self.db_config.user,
+            password=self.db_config.password,
+            host=self.db_config.host,
+            port=self.db_config.port,
+            connection_factory=PooledConnection,
+        )
+
+    def acquire(self, timeout: Optional[float] = None):
+        """Checks out an idle connection, opening one while under max_pool_size.
+        Waits at most until the request deadline."""
+        if timeout is None:
+            timeout = bounded_timeout(self.db_config.pool_acquire_timeout)
+        if not self._slots.acquire(timeout=timeout):
+            if deadline_exceeded():
+                raise DeadlineExceededException("Request deadline exceeded.")
+            raise PoolError("connection pool exhausted")
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None or conn.closed:
+                conn = self._connect()
+            return conn
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn, discard: bool = False) -> None:
+        """Returns a connection to the pool, closing it when broken or discarded"""
+        try:
+            if discard or conn.closed:
+                self._close_quietly(conn)
+                return
+            if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            with self._lock:
+                self._idle.append(conn)
+        except psycopg2.Error:
+            self._close_quietly(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator:
+        """Yields a pooled connection, which is dropped if the server closed it"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def prefill(self) -> None:
+        """Opens min_pool_size connections ahead of the first requests"""
+        connections = []
+        try:
+            for _ in range(
+                min(self.db_config.min_pool_size, self.db_config.max_pool_size)
+            ):
+                connections.append(self.acquire())
+        finally:
+            for conn in connections:
+                self.release(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._close_quietly(conn)
+
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
@@ -0,0 +1,134 @@
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Iterator, Optional
+
+from src.domain.exception import DeadlineExceededException
+from src.domain.model import Email, User
+from src.domain.port import UserRepositoryPort
+from src.infrastructure.config.group_commit_config import GroupCommitConfig
+from src.infrastructure.deadline import bounded_timeout
+
+_STOP = object()
+
+
+class GroupCommitUserRepository(UserRepositoryPort):
+    """Commits concurrent saves together. A writer thread takes the saves arriving
+    within max_delay_seconds of the first one, writes them with one save_many
+    (one transaction, one commit), then completes the future of each caller.
+    Reads and other writes go straight to the delegate."""
+
+    def __init__(self, delegate: UserRepositoryPort, config: GroupCommitConfig):
+        self.delegate = delegate
+        self.config = config
+        self._queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def save(self, user: User) -> None:
+        """Blocks until the batch holding the user is committed. Past the request
+        deadline, the caller gives up waiting but the save may still commit."""
+        timeout = bounded_timeout(None)
+        future: Future = Future()
+        self._start()
+        self._queue.put((user, future))
+        try:
+            future.result(timeout)
+        except TimeoutError:
+            raise DeadlineExceededException("Request deadline exceeded.")
+
+    def _start(self) -> None:
+        if self._writer is not None:
+            return
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write, name="group-commit", daemon=True
+                )
+                self._writer.start()
+
+    def close(self) -> None:
+        """Stops the writer once every queued save is committed"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(_STOP)
+            writer.join()
+        self.delegate.close()
+
+    def _write(self) -> None:
+        while True:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._commit(batch)
+            if stopping:
+                return
+
+    def _next_batch(self) -> tuple[list[tuple[User, Future]], bool]:
+        """Waits for a save, then takes what else arrives within the delay"""
+        batch = []
+        flush_at = None
+        while len(batch) < self.config.max_batch_size:
+            timeout = (
+                None if flush_at is None else max(0.0, flush_at - time.monotonic())
+            )
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+            if flush_at is None:
+                flush_at = time.monotonic() + self.config.max_delay_seconds
+        return batch, False
+
+    def _commit(self, batch: list[tuple[User, Future]]) -> None:
+        try:
+            self.delegate.save_many([user for user, _ in batch])
+        except Exception:
+            # Isolates the failing saves (constraint violation, ...): the others
+            # must not fail with them
+            for user, future in batch:
+                try:
+                    self.delegate.save(user)
+                except Exception as exception:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(None)
+            return
+        for _, future in batch:
+            future.set_result(None)
+
+    def save_many(self, users: list[User]) -> None:
+        self.delegate.save_many(users)
+
+    def mark_active(self, user_id: uuid.UUID) -> Optional[User]:
+        return self.delegate.mark_active(user_id)
+
+    def delete(self, user_id: uuid.UUID) -> None:
+        self.delegate.delete(user_id)
+
+    def find_by_id(self, user_id: uuid.UUID) -> Optional[User]:
+        return self.delegate.find_by_id(user_id)
+
+    def find_by_email(self, email: Email) -> Optional[User]:
+        return self.delegate.find_by_email(email)
+
+    def find_by_ids(self, user_ids: list[uuid.UUID]) -> list[User]:
+        return self.delegate.find_by_ids(user_ids)
+
+    def stream_all(self, fetch_size: int) -> Iterator[User]:
+        return self.delegate.stream_all(fetch_size)
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        is_active: Optional[bool] = None,
+        pending_expired: bool = False,
+    ) -> list[User]:
+        return self.delegate.list_page(limit, after, is_active, pending_expired)
@@ -1,87 +1,367 @@
 import psycopg2
+import time
 import uuid
-from psycopg2.extras import DictCursor
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Iterator, Optional
+from psycopg2.extras import DictCursor, execute_values
 
+from src.domain.exception import (
+    DeadlineExceededException,
+    EmailAlreadyExistsException,
+)
 from src.domain.model import User, Email, ActivationCode
 from src.domain.port.user_repository_port import UserRepositoryPort
 from src.infrastructure.config.database_config import DatabaseConfig
+from src.infrastructure.deadline import bounded_timeout, time_left
+from .connection_pool import ConnectionPool, PreparedStatement
+from .slow_query_log import SlowQueryLog
+
+# Pending registrations live in pending_users, active users in users (see init.sql):
+# reads go through the all_users view, activation moves the row between tables.
+SAVE_PENDING_USER = PreparedStatement(
+    "save_pending_user",
+    """
+        INSERT INTO pending_users (id, email, password_hash, activation_code, code_expires_at, created_at)
+        VALUES (%s, %s, %s, %s, %s, COALESCE(%s, now()))
+        ON CONFLICT (email) DO UPDATE SET
+            password_hash = EXCLUDED.password_hash,
+            activation_code = EXCLUDED.activation_code,
+            code_expires_at = EXCLUDED.code_expires_at
+        """,
+)
+SAVE_ACTIVE_USER = PreparedStatement(
+    "save_active_user",
+    """
+        WITH promoted AS (DELETE FROM pending_users WHERE id = %s)
+        INSERT INTO users (id, email, password_hash, is_active, activation_code, code_expires_at, created_at)
+        VALUES (%s, %s, %s, %s, %s, %s, COALESCE(%s, now()))
+        ON CONFLICT (email) DO UPDATE SET
+            password_hash = EXCLUDED.password_hash,
+            is_active = EXCLUDED.is_active,
+            activation_code = EXCLUDED.activation_code,
+            code_expires_at = EXCLUDED.code_expires_at
+        """,
+)
+MARK_USER_ACTIVE = PreparedStatement(
+    "mark_user_active",
+    """
+        WITH promoted AS (
+            DELETE FROM pending_users WHERE id = %s
+            RETURNING id, email, password_hash, created_at
+        )
+        INSERT INTO users (id, email, password_hash, is_active, activation_code, code_expires_at, created_at)
+        SELECT id, email, password_hash, true, NULL, NULL, created_at FROM promoted
+        RETURNING *
+        """,
+)
+# Multi-row variants of the saves above, for save_many (VALUES %s is expanded)
+USER_ROW_TEMPLATE = "(%s, %s, %s, %s, %s, %s::timestamptz, %s::timestamptz)"
+SAVE_PENDING_USERS = """
+    WITH batch (id, email, password_hash, is_active, activation_code, code_expires_at, created_at)
+        AS (VALUES %s)
+    INSERT INTO pending_users (id, email, password_hash, activation_code, code_expires_at, created_at)
+    SELECT id, email, password_hash, activation_code, code_expires_at, COALESCE(created_at, now())
+    FROM batch
+    ON CONFLICT (email) DO UPDATE SET
+        password_hash = EXCLUDED.password_hash,
+        activation_code = EXCLUDED.activation_code,
+        code_expires_at = EXCLUDED.code_expires_at
+    """
+SAVE_ACTIVE_USERS = """
+    WITH batch (id, email, password_hash, is_active, activation_code, code_expires_at, created_at)
+        AS (VALUES %s),
+    promoted AS (DELETE FROM pending_users WHERE id IN (SELECT id FROM batch))
+    INSERT INTO users (id, email, password_hash, is_active, activation_code, code_expires_at, created_at)
+    SELECT id, email, password_hash, is_active, activation_code, code_expires_at, COALESCE(created_at, now())
+    FROM batch
+    ON CONFLICT (email) DO UPDATE SET
+        password_hash = EXCLUDED.password_hash,
+        is_active = EXCLUDED.is_active,
+        activation_code = EXCLUDED.activation_code,
+        code_expires_at = EXCLUDED.code_expires_at
+    """
+DELETE_USER = PreparedStatement(
+    "delete_user",
+    """
+        WITH pending AS (DELETE FROM pending_users WHERE id = %s)
+        DELETE FROM users WHERE id = %s
+        """,
+)
+FIND_USER_BY_ID = PreparedStatement(
+    "find_user_by_id", "SELECT * FROM all_users WHERE id = %s"
+)
+FIND_USER_BY_EMAIL = PreparedStatement(
+    "find_user_by_email", "SELECT * FROM all_users WHERE email = %s"
+)
+FIND_USERS_BY_IDS = PreparedStatement(
+    "find_users_by_ids", "SELECT * FROM all_users WHERE id = ANY(%s)"
+)
+
+STREAM_USERS = "SELECT * FROM all_users"
+
+
+@lru_cache(maxsize=None)
+def list_users_statement(
+    after: bool, is_active: Optional[bool], pending_expired: bool
+) -> PreparedStatement:
+    """One statement per filter combination, each served by merging the
+    (created_at, id) indexes of users and pending_users"""
+    name, conditions = ["list_users"], []
+    if after:
+        name.append("after")
+        conditions.append("(created_at, id) > (%s, %s)")
+    if is_active is not None:
+        name.append("by_status")
+        conditions.append("is_active = %s")
+    if pending_expired:
+        name.append("pending_expired")
+        conditions.append("NOT is_active AND code_expires_at <= now()")
+    where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+    return PreparedStatement(
+        "_".join(name),
+        f"SELECT * FROM all_users {where}ORDER BY created_at, id LIMIT %s",
+    )
 
 
 class PostgresUserRepository(UserRepositoryPort):
-    def __init__(self, db_config: DatabaseConfig):
+    def __init__(
+        self,
+        db_config: DatabaseConfig,
+        pool: Optional[ConnectionPool] = None,
+        slow_queries: Optional[SlowQueryLog] = None,
+    ):
         self.db_config = db_config
+        self.pool = pool or ConnectionPool(db_config)
+        self.slow_queries = slow_queries
 
-    def _get_connection(self):
-        """Lazy connection initialization"""
-        return psycopg2.connect(
-            dbname=self.db_config.database,
-            user=self.db_config.user,
-            password=self.db_config.password,
-            host=self.db_config.host,
-            port=self.db_config.port,
-        )
+    def _run(
+        self, statement: PreparedStatement, params: tuple, fetch: Optional[str] = None
+    ):
+        def run(conn, cur, statement_timeout_ms: Optional[int]):
+            started = time.perf_counter()
+            statement.execute(
+                conn,
+                cur,
+                params,
+                self.db_config.prepared_statements,
+                statement_timeout_ms,
+            )
+            result = getattr(cur, fetch)() if fetch else None
+            return result, time.perf_counter() - started
+
+        result, duration = self._in_transaction(run)
+        # Once committed: the explain would otherwise wait on the locks of this
+        # transaction, from another connection
+        if self.slow_queries is not None:
+            self.slow_queries.record(
+                statement.name, statement.sql, params, duration, self._explain
+            )
+        return result
+
+    def _explain(self, sql: str, params: tuple) -> str:
+        """Plan of a statement as it runs now. Reads run under EXPLAIN (ANALYZE,
+        BUFFERS), in a rolled back transaction. Writes are only planned: running
+        them again would add WAL and dead tuples, and wait on concurrent writers."""
+        read = sql.lstrip().upper().startswith("SELECT")
+        with self.pool.connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SET LOCAL statement_timeout = %s",
+                        (self.slow_queries.config.explain_timeout_ms,),
+                    )
+                    options = "(ANALYZE, BUFFERS) " if read else ""
+                    cur.execute(f"EXPLAIN {options}{sql}", params)
+                    return "\n".join(row[0] for row in cur.fetchall())
+            finally:
+                conn.rollback()
+
+    def _in_transaction(self, work: Callable):
+        """Runs work(conn, cursor, statement_timeout_ms) in a transaction on a pooled
+        connection, retrying once on a fresh connection when the server closed the
+        previous one. Statements are cancelled by the server once the request
+        deadline is reached."""
+        for attempt in range(2):
+            conn = None
+            try:
+                with self.pool.connection() as conn:
+                    timeout = bounded_timeout(None)
+                    with conn.cursor(cursor_factory=DictCursor) as cur:
+                        result = work(
+                            conn,
+                            cur,
+                            None if timeout is None else max(1, int(timeout * 1000)),
+                        )
+                    conn.commit()
+                    return result
+            except psycopg2.errors.QueryCanceled:
+                if time_left() is None:
+                    raise
+                raise DeadlineExceededException("Request deadline exceeded.")
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                if attempt or conn is None or not conn.closed:
+                    raise
 
     def save(self, user: User) -> None:
-        query = """
-        INSERT INTO users (id, email, password_hash, is_active, activation_code, code_expires_at)
-        VALUES (%s, %s, %s, %s, %s, %s)
-        ON CONFLICT (email) DO UPDATE SET
-            password_hash = EXCLUDED.password_hash,
-            is_active = EXCLUDED.is_active,
-            activation_code = EXCLUDED.activation_code,
-            code_expires_at = EXCLUDED.code_expires_at
-        """
-        with self._get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    query,
-                    (
-                        str(user.id),
-                        user.email.value,
-                        user.password_hash,
-                        user.is_active,
-                        user.activation_code.value if user.activation_code else None,
-                        (
-                            user.activation_code.expires_at
-                            if user.activation_code
-                            else None
-                        ),
-                    ),
-                )
-            conn.commit()
+        """Upserts a pending user into pending_users. An active user is written to
+        users, and its pending row removed in the same statement (promotion).
+        Raises EmailAlreadyExistsException when another user of either table has
+        the email (init.sql checks it across both)."""
+        try:
+            self._save(user)
+        except psycopg2.errors.UniqueViolation:
+            raise EmailAlreadyExistsException(
+                f"Email {user.email.value} already registered."
+            )
+
+    def _save(self, user: User) -> None:
+        activation_code = user.activation_code
+        code = activation_code.value if activation_code else None
+        expires_at = activation_code.expires_at if activation_code else None
+        if not user.is_active:
+            self._run(
+                SAVE_PENDING_USER,
+                (
+                    str(user.id),
+                    user.email.value,
+                    user.password_hash,
+                    code,
+                    expires_at,
+                    user.created_at,
+                ),
+            )
+            return
+        self._run(
+            SAVE_ACTIVE_USER,
+            (
+                str(user.id),
+                str(user.id),
+                user.email.value,
+                user.password_hash,
+                user.is_active,
+                code,
+                expires_at,
+                user.created_at,
+            ),
+        )
+
+    def save_many(self, users: list[User]) -> None:
+        """Writes the users with one multi-row upsert per table, in one transaction.
+        A row may only be upserted once per statement: the last user of an email
+        wins, as with successive saves."""
+        latest = {user.email.value: user for user in users}
+        pending = [self._row(user) for user in latest.values() if not user.is_active]
+        active = [self._row(user) for user in latest.values() if user.is_active]
+        durations: list[tuple[str, float]] = []
+
+        def run(conn, cur, statement_timeout_ms: Optional[int]):
+            prefix = (
+                f"SET LOCAL statement_timeout = {statement_timeout_ms}; "
+                if statement_timeout_ms is not None
+                else ""
+            )
+            for statement, rows in (
+                (SAVE_PENDING_USERS, pending),
+                (SAVE_ACTIVE_USERS, active),
+            ):
+                if rows:
+                    started = time.perf_counter()
+                    execute_values(
+                        cur,
+                        prefix + statement,
+                        rows,
+                        template=USER_ROW_TEMPLATE,
+                        page_size=len(rows),
+                    )
+                    durations.append((statement, time.perf_counter() - started))
+
+        if not latest:
+            return
+        self._in_transaction(run)
+        if self.slow_queries is not None:
+            for statement, duration in durations:
+                # Not explained: the statement depends on the batch size
+                self.slow_queries.record("save_users_batch", statement, [], duration)
+
+    def mark_active(self, user_id: uuid.UUID) -> User | None:
+        return self._to_user(
+            self._run(MARK_USER_ACTIVE, (str(user_id),), fetch="fetchone")
+        )
+
+    def delete(self, user_id: uuid.UUID) -> None:
+        self._run(DELETE_USER, (str(user_id), str(user_id)))
 
     def find_by_id(self, user_id: uuid.UUID) -> User | None:
-        query = "SELECT * FROM users WHERE id = %s"
-        with self._get_connection() as conn:
-            with conn.cursor(cursor_factory=DictCursor) as cur:
-                cur.execute(query, (user_id,))
-                row = cur.fetchone()
-                if not row:
-                    return None
-                return User(
-                    id=row["id"],
-                    email=Email(row["email"]),
-                    password_hash=row["password_hash"],
-                    is_active=row["is_active"],
-                    activation_code=ActivationCode(
-                        row["activation_code"], row["code_expires_at"]
-                    ),
-                )
+        return self._to_user(
+            self._run(FIND_USER_BY_ID, (str(user_id),), fetch="fetchone")
+        )
 
     def find_by_email(self, email: Email) -> User | None:
-        query = "SELECT * FROM users WHERE email = %s"
-        with self._get_connection() as conn:
-            with conn.cursor(cursor_factory=DictCursor) as cur:
-                cur.execute(query, (email.value,))
-                row = cur.fetchone()
-                if not row:
-                    return None
-                return User(
-                    id=row["id"],
-                    email=Email(row["email"]),
-                    password_hash=row["password_hash"],
-                    is_active=row["is_active"],
-                    activation_code=ActivationCode(
-                        row["activation_code"], row["code_expires_at"]
-                    ),
-                )
+        return self._to_user(
+            self._run(FIND_USER_BY_EMAIL, (email.value,), fetch="fetchone")
+        )
+
+    def find_by_ids(self, user_ids: list[uuid.UUID]) -> list[User]:
+        if not user_ids:
+            return []
+        rows = self._run(
+            FIND_USERS_BY_IDS,
+            ([str(user_id) for user_id in user_ids],),
+            fetch="fetchall",
+        )
+        return [self._to_user(row) for row in rows]
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        is_active: Optional[bool] = None,
+        pending_expired: bool = False,
+    ) -> list[User]:
+        statement = list_users_statement(after is not None, is_active, pending_expired)
+        params = (*(after or ()), *(() if is_active is None else (is_active,)), limit)
+        rows = self._run(statement, params, fetch="fetchall")
+        return [self._to_user(row) for row in rows]
+
+    def stream_all(self, fetch_size: int = 1000) -> Iterator[User]:
+        """Streams users through a named (server-side) cursor, fetch_size rows at a time.
+        The pooled connection is held until the iteration ends or is closed."""
+        with self.pool.connection() as conn:
+            try:
+                with conn.cursor("stream_users", cursor_factory=DictCursor) as cur:
+                    cur.itersize = fetch_size
+                    cur.execute(STREAM_USERS)
+                    for row in cur:
+                        yield self._to_user(row)
+            finally:
+                if not conn.closed:
+                    conn.rollback()
+
+    @staticmethod
+    def _row(user: User) -> tuple:
+        activation_code = user.activation_code
+        return (
+            str(user.id),
+            user.email.value,
+            user.password_hash,
+            user.is_active,
+            activation_code.value if activation_code else None,
+            activation_code.expires_at if activation_code else None,
+            user.created_at,
+        )
+
+    @staticmethod
+    def _to_user(row) -> User | None:
+        if not row:
+            return None
+        return User(
+            id=row["id"],
+            email=Email(row["email"]),
+            password_hash=row["password_hash"],
+            is_active=row["is_active"],
+            activation_code=ActivationCode(
+                row["activation_code"], row["code_expires_at"]
+            ),
+            created_at=row.get("created_at"),
+        )
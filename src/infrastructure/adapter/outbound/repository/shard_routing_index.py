@@ -0,0 +1,95 @@
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from psycopg2.extras import execute_values
+
+from src.infrastructure.config.database_config import DatabaseConfig
+from .connection_pool import ConnectionPool
+
+
+class ShardRoutingIndex(ABC):
+    """Maps user ids to the shard holding them: ids are random, only emails
+    hash to a shard"""
+
+    @abstractmethod
+    def put_many(self, shards: dict[str, int]) -> None:
+        """Records the shard of each id (string form)"""
+        pass
+
+    @abstractmethod
+    def get_many(self, user_ids: list[uuid.UUID]) -> dict[str, int]:
+        """Shards of the known ids, keyed by the string form of the id"""
+        pass
+
+    @abstractmethod
+    def remove(self, user_id: uuid.UUID) -> None:
+        pass
+
+    def put(self, user_id: uuid.UUID, shard: int) -> None:
+        self.put_many({str(user_id): shard})
+
+    def get(self, user_id: uuid.UUID) -> Optional[int]:
+        return self.get_many([user_id]).get(str(user_id))
+
+
+class InMemoryShardRoutingIndex(ShardRoutingIndex):
+    def __init__(self):
+        self._shards: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def put_many(self, shards: dict[str, int]) -> None:
+        with self._lock:
+            self._shards.update(shards)
+
+    def get_many(self, user_ids: list[uuid.UUID]) -> dict[str, int]:
+        with self._lock:
+            return {
+                str(user_id): self._shards[str(user_id)]
+                for user_id in user_ids
+                if str(user_id) in self._shards
+            }
+
+    def remove(self, user_id: uuid.UUID) -> None:
+        with self._lock:
+            self._shards.pop(str(user_id), None)
+
+
+class PostgresShardRoutingIndex(ShardRoutingIndex):
+    """Routing index kept in the user_shards table of the directory database"""
+
+    def __init__(
+        self, db_config: DatabaseConfig, pool: Optional[ConnectionPool] = None
+    ):
+        self.db_config = db_config
+        self.pool = pool or ConnectionPool(db_config)
+
+    def put_many(self, shards: dict[str, int]) -> None:
+        query = """
+        INSERT INTO user_shards (user_id, shard) VALUES %s
+        ON CONFLICT (user_id) DO UPDATE SET shard = EXCLUDED.shard
+        """
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                execute_values(cur, query, list(shards.items()), page_size=len(shards))
+            conn.commit()
+
+    def get_many(self, user_ids: list[uuid.UUID]) -> dict[str, int]:
+        if not user_ids:
+            return {}
+        query = "SELECT user_id, shard FROM user_shards WHERE user_id = ANY(%s)"
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, ([str(user_id) for user_id in user_ids],))
+                rows = cur.fetchall()
+            conn.commit()
+        return {user_id: shard for user_id, shard in rows}
+
+    def remove(self, user_id: uuid.UUID) -> None:
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM user_shards WHERE user_id = %s", (str(user_id),)
+                )
+            conn.commit()
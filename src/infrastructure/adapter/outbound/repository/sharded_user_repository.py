@@ -0,0 +1,168 @@
+import hashlib
+import heapq
+import itertools
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator, Optional
+
+from src.domain.model import Email, User
+from src.domain.port import UserRepositoryPort
+from .shard_routing_index import ShardRoutingIndex
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """Jump consistent hash (Lamping & Veach): growing from n to n + 1 buckets
+    only moves 1 / (n + 1) of the keys, all of them to the new bucket"""
+    bucket, candidate = -1, 0
+    while candidate < buckets:
+        bucket = candidate
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+def shard_for_email(email: Email, shard_count: int) -> int:
+    """Stable across processes and releases, unlike hash()"""
+    normalized = email.value.strip().lower().encode("utf-8")
+    digest = hashlib.blake2b(normalized, digest_size=8).digest()
+    return jump_hash(int.from_bytes(digest, "big"), shard_count)
+
+
+@dataclass
+class RebalanceReport:
+    scanned: int = 0
+    # (source shard, target shard) -> users moved
+    moved: Counter = field(default_factory=Counter)
+
+    @property
+    def moved_count(self) -> int:
+        return sum(self.moved.values())
+
+
+class ShardedUserRepository(UserRepositoryPort):
+    """Spreads users across shards by a hash of their email. Lookups by id go
+    through the routing index, which is written before the user."""
+
+    def __init__(self, shards: list[UserRepositoryPort], index: ShardRoutingIndex):
+        if not shards:
+            raise ValueError("At least one shard is required")
+        self.shards = shards
+        self.index = index
+
+    def shard_for(self, email: Email) -> int:
+        return shard_for_email(email, len(self.shards))
+
+    def save(self, user: User) -> None:
+        shard = self.shard_for(user.email)
+        self.index.put(user.id, shard)
+        self.shards[shard].save(user)
+
+    def save_many(self, users: list[User]) -> None:
+        """One index write, then one save_many per shard"""
+        users_by_shard = defaultdict(list)
+        for user in users:
+            users_by_shard[self.shard_for(user.email)].append(user)
+        self.index.put_many(
+            {
+                str(user.id): shard
+                for shard, shard_users in users_by_shard.items()
+                for user in shard_users
+            }
+        )
+        for shard, shard_users in sorted(users_by_shard.items()):
+            self.shards[shard].save_many(shard_users)
+
+    def mark_active(self, user_id: uuid.UUID) -> Optional[User]:
+        shard = self.index.get(user_id)
+        return None if shard is None else self.shards[shard].mark_active(user_id)
+
+    def delete(self, user_id: uuid.UUID) -> None:
+        shard = self.index.get(user_id)
+        if shard is not None:
+            self.shards[shard].delete(user_id)
+            self.index.remove(user_id)
+
+    def find_by_id(self, user_id: uuid.UUID) -> Optional[User]:
+        shard = self.index.get(user_id)
+        return None if shard is None else self.shards[shard].find_by_id(user_id)
+
+    def find_by_email(self, email: Email) -> Optional[User]:
+        return self.shards[self.shard_for(email)].find_by_email(email)
+
+    def find_by_ids(self, user_ids: list[uuid.UUID]) -> list[User]:
+        """One query per shard holding some of the users"""
+        ids_by_shard = defaultdict(list)
+        for user_id, shard in self.index.get_many(user_ids).items():
+            ids_by_shard[shard].append(user_id)
+        return [
+            user
+            for shard, shard_ids in sorted(ids_by_shard.items())
+            for user in self.shards[shard].find_by_ids(shard_ids)
+        ]
+
+    def stream_all(self, fetch_size: int = 1000) -> Iterator[User]:
+        return itertools.chain.from_iterable(
+            shard.stream_all(fetch_size) for shard in self.shards
+        )
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        is_active: Optional[bool] = None,
+        pending_expired: bool = False,
+    ) -> list[User]:
+        """Merges the first page of every shard: a page never holds more than
+        limit users from a single shard"""
+        pages = [
+            shard.list_page(limit, after, is_active, pending_expired)
+            for shard in self.shards
+        ]
+        merged = heapq.merge(*pages, key=lambda user: (user.created_at, str(user.id)))
+        return list(itertools.islice(merged, limit))
+
+    def close(self) -> None:
+        for shard in self.shards:
+            shard.close()
+
+    def rebalance(
+        self, fetch_size: int = 1000, dry_run: bool = False
+    ) -> RebalanceReport:
+        """Moves every user to the shard its email hashes to, and rebuilds the
+        routing index. Meant to run offline, after appending shards. A move
+        writes the target before deleting the source, so an interrupted run
+        can simply be started again.
+
+        Shards are read in keyset pages of fetch_size users, each fetched
+        before any of its users is written: a cursor held open across the
+        moves would keep a pooled connection the writes may be waiting for."""
+        report = RebalanceReport()
+        # Users only move to appended shards: scanned first, they are not
+        # scanned again once filled
+        for source in reversed(range(len(self.shards))):
+            shard = self.shards[source]
+            for user in self._pages(shard, fetch_size):
+                report.scanned += 1
+                target = self.shard_for(user.email)
+                if target != source:
+                    report.moved[(source, target)] += 1
+                if dry_run:
+                    continue
+                if target != source:
+                    self.shards[target].save(user)
+                self.index.put(user.id, target)
+                if target != source:
+                    shard.delete(user.id)
+        return report
+
+    @staticmethod
+    def _pages(shard: UserRepositoryPort, fetch_size: int) -> Iterator[User]:
+        after = None
+        while True:
+            page = shard.list_page(fetch_size, after)
+            yield from page
+            if len(page) < fetch_size:
+                return
+            after = (page[-1].created_at, str(page[-1].id))
@@ -0,0 +1,59 @@
+import copy
+import uuid
+from datetime import datetime
+from typing import Iterator, Optional
+
+from src.domain.model import Email, User
+from src.domain.port import UserRepositoryPort
+from src.infrastructure.resilience import SingleFlight
+
+
+class SingleFlightUserRepository(UserRepositoryPort):
+    """Coalesces concurrent identical lookups (retry storms) into one query.
+    Every caller gets its own copy of the user, which services may mutate."""
+
+    def __init__(self, delegate: UserRepositoryPort):
+        self.delegate = delegate
+        self._lookups = SingleFlight()
+
+    def find_by_id(self, user_id: uuid.UUID) -> Optional[User]:
+        user = self._lookups.do(
+            ("id", str(user_id)), lambda: self.delegate.find_by_id(user_id)
+        )
+        return copy.copy(user)
+
+    def find_by_email(self, email: Email) -> Optional[User]:
+        user = self._lookups.do(
+            ("email", email.value), lambda: self.delegate.find_by_email(email)
+        )
+        return copy.copy(user)
+
+    def save(self, user: User) -> None:
+        self.delegate.save(user)
+
+    def save_many(self, users: list[User]) -> None:
+        self.delegate.save_many(users)
+
+    def mark_active(self, user_id: uuid.UUID) -> Optional[User]:
+        return self.delegate.mark_active(user_id)
+
+    def delete(self, user_id: uuid.UUID) -> None:
+        self.delegate.delete(user_id)
+
+    def find_by_ids(self, user_ids: list[uuid.UUID]) -> list[User]:
+        return self.delegate.find_by_ids(user_ids)
+
+    def stream_all(self, fetch_size: int) -> Iterator[User]:
+        return self.delegate.stream_all(fetch_size)
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        is_active: Optional[bool] = None,
+        pending_expired: bool = False,
+    ) -> list[User]:
+        return self.delegate.list_page(limit, after, is_active, pending_expired)
+
+    def close(self) -> None:
+        self.delegate.close()
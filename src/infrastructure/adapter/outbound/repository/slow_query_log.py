@@ -0,0 +1,137 @@
+import heapq
+import itertools
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from src.infrastructure.config.slow_query_config import SlowQueryConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    sql: str
+    duration_ms: float
+    # Types only: values are emails and password hashes
+    params: list[str]
+    at: float
+    plan: Optional[str] = None
+
+    @property
+    def seq_scan(self) -> bool:
+        """A lookup by email or id planned as a sequential scan lost its index"""
+        return self.plan is not None and "Seq Scan" in self.plan
+
+    def to_dict(self) -> dict:
+        return {
+            "statement": self.statement,
+            "sql": " ".join(self.sql.split()),
+            "duration_ms": self.duration_ms,
+            "params": self.params,
+            "at": self.at,
+            "plan": self.plan,
+            "seq_scan": self.seq_scan,
+        }
+
+
+_LITERAL = re.compile(r"'(?:[^']|'')*'")
+
+
+def redact_literals(plan: str) -> str:
+    """Plans quote the bound values in their conditions"""
+    return _LITERAL.sub("'?'", plan)
+
+
+def redact(params) -> list[str]:
+    return [
+        "NULL" if value is None else f"<{type(value).__name__}>" for value in params
+    ]
+
+
+@dataclass(order=True)
+class _Ranked:
+    duration_ms: float
+    sequence: int
+    query: SlowQuery = field(compare=False)
+
+
+class SlowQueryLog:
+    """Logs the statements slower than the threshold, parameters redacted, and
+    keeps the slowest ones. A sample of them is explained by a background thread,
+    one at a time, so that a burst of slow queries does not add load to a
+    database that is already struggling."""
+
+    def __init__(
+        self,
+        config: SlowQueryConfig,
+        sample: Callable[[], float] = random.random,
+    ):
+        self.config = config
+        self.sample = sample
+        self._worst: list[_Ranked] = []  # min-heap: the fastest kept query first
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._explaining = threading.Semaphore(1)
+
+    def record(
+        self,
+        statement: str,
+        sql: str,
+        params,
+        duration_seconds: float,
+        explain: Optional[Callable[[str, tuple], str]] = None,
+    ) -> None:
+        duration_ms = round(duration_seconds * 1000, 2)
+        if not self.config.enabled or duration_ms < self.config.threshold_ms:
+            return
+        query = SlowQuery(statement, sql, duration_ms, redact(params), time.time())
+        logger.warning(
+            "slow_query",
+            extra={
+                "event": "slow_query",
+                "statement": statement,
+                "duration_ms": duration_ms,
+                "params": query.params,
+            },
+        )
+        with self._lock:
+            ranked = _Ranked(duration_ms, next(self._sequence), query)
+            if len(self._worst) < self.config.max_entries:
+                heapq.heappush(self._worst, ranked)
+            elif ranked > self._worst[0]:
+                heapq.heapreplace(self._worst, ranked)
+            else:
+                return
+        if (
+            explain is not None
+            and self.sample() < self.config.explain_sample_rate
+            and self._explaining.acquire(blocking=False)
+        ):
+            threading.Thread(
+                target=self._explain,
+                args=(query, explain, tuple(params)),
+                name="explain-slow-query",
+                daemon=True,
+            ).start()
+
+    def _explain(self, query: SlowQuery, explain: Callable, params: tuple) -> None:
+        try:
+            query.plan = redact_literals(explain(query.sql, params))
+        except Exception:
+            logger.warning(
+                "Could not explain slow statement %s", query.statement, exc_info=True
+            )
+        finally:
+            self._explaining.release()
+
+    def worst(self) -> list[dict]:
+        """Slowest statements first"""
+        with self._lock:
+            ranked = sorted(self._worst, reverse=True)
+        return [entry.query.to_dict() for entry in ranked]
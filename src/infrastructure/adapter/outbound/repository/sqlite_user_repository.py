@@ -0,0 +1,311 @@
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+from src.domain.exception import EmailAlreadyExistsException
+from src.domain.model import User, Email, ActivationCode
+from src.domain.port.user_repository_port import UserRepositoryPort
+from src.infrastructure.config.sqlite_config import SqliteConfig
+
+# Same tables as docker/postgres/init.sql. Timestamps are ISO-8601 UTC text with
+# microseconds, so that they sort like the timestamps they represent.
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS users (
+        id VARCHAR(36) PRIMARY KEY,
+        email VARCHAR(255) UNIQUE NOT NULL,
+        password_hash VARCHAR(255) NOT NULL,
+        is_active BOOLEAN DEFAULT FALSE,
+        activation_code VARCHAR(4),
+        code_expires_at TEXT,
+        created_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_users_created_at_id ON users (created_at, id);
+
+    CREATE TABLE IF NOT EXISTS pending_users (
+        id VARCHAR(36) PRIMARY KEY,
+        email VARCHAR(255) UNIQUE NOT NULL,
+        password_hash VARCHAR(255) NOT NULL,
+        activation_code VARCHAR(4),
+        code_expires_at TEXT,
+        created_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_pending_users_created_at_id
+        ON pending_users (created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_pending_users_code_expires_at
+        ON pending_users (code_expires_at);
+
+    -- An email is unique across both tables, as checked by init.sql: writes are
+    -- serialized, so that the check cannot miss a concurrent registration
+    CREATE TRIGGER IF NOT EXISTS users_email_unique BEFORE INSERT ON users
+    WHEN EXISTS (SELECT 1 FROM pending_users WHERE email = NEW.email AND id <> NEW.id)
+    BEGIN SELECT RAISE(ABORT, 'email already registered'); END;
+
+    CREATE TRIGGER IF NOT EXISTS pending_users_email_unique BEFORE INSERT ON pending_users
+    WHEN EXISTS (SELECT 1 FROM users WHERE email = NEW.email AND id <> NEW.id)
+    BEGIN SELECT RAISE(ABORT, 'email already registered'); END;
+
+    CREATE VIEW IF NOT EXISTS all_users AS
+        SELECT id, email, password_hash, is_active, activation_code, code_expires_at, created_at
+        FROM users
+        UNION ALL
+        SELECT id, email, password_hash, false, activation_code, code_expires_at, created_at
+        FROM pending_users;
+
+    CREATE TABLE IF NOT EXISTS registration_funnel (
+        hour TEXT NOT NULL,
+        metric VARCHAR(64) NOT NULL,
+        value DOUBLE PRECISION NOT NULL,
+        PRIMARY KEY (hour, metric)
+    );
+"""
+
+SAVE_PENDING_USER = """
+    INSERT INTO pending_users (id, email, password_hash, activation_code, code_expires_at, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (email) DO UPDATE SET
+        password_hash = excluded.password_hash,
+        activation_code = excluded.activation_code,
+        code_expires_at = excluded.code_expires_at
+"""
+DELETE_PENDING_USER = "DELETE FROM pending_users WHERE id = ?"
+SAVE_ACTIVE_USER = """
+    INSERT INTO users (id, email, password_hash, is_active, activation_code, code_expires_at, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (email) DO UPDATE SET
+        password_hash = excluded.password_hash,
+        is_active = excluded.is_active,
+        activation_code = excluded.activation_code,
+        code_expires_at = excluded.code_expires_at
+"""
+PROMOTE_PENDING_USER = """
+    DELETE FROM pending_users WHERE id = ?
+    RETURNING id, email, password_hash, created_at
+"""
+INSERT_ACTIVATED_USER = """
+    INSERT INTO users (id, email, password_hash, is_active, activation_code, code_expires_at, created_at)
+    VALUES (?, ?, ?, true, NULL, NULL, ?)
+    RETURNING *
+"""
+DELETE_USER = "DELETE FROM users WHERE id = ?"
+FIND_USER_BY_ID = "SELECT * FROM all_users WHERE id = ?"
+FIND_USER_BY_EMAIL = "SELECT * FROM all_users WHERE email = ?"
+STREAM_USERS = "SELECT * FROM all_users"
+
+
+def list_users_query(
+    after: bool, is_active: Optional[bool], pending_expired: bool
+) -> str:
+    conditions = []
+    if after:
+        conditions.append("(created_at, id) > (?, ?)")
+    if is_active is not None:
+        conditions.append("is_active = ?")
+    if pending_expired:
+        conditions.append("NOT is_active AND code_expires_at <= ?")
+    where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+    return f"SELECT * FROM all_users {where}ORDER BY created_at, id LIMIT ?"
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _from_text(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+class SqliteUserRepository(UserRepositoryPort):
+    """Users in an embedded SQLite database in WAL mode, for single-node installs:
+    readers never block the writer, and lookups skip the network round trip.
+
+    Each thread gets its own connection, whose statement cache keeps the
+    statements below prepared. Writes run in BEGIN IMMEDIATE transactions, so
+    that concurrent writers wait on busy_timeout instead of failing mid-way."""
+
+    def __init__(self, config: SqliteConfig):
+        self.config = config
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._schema_created = False
+
+    def _connect(self) -> sqlite3.Connection:
+        Path(self.config.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.config.path,
+            timeout=self.config.busy_timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.config.cached_statements,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA synchronous = {self.config.synchronous}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.config.mmap_size)}")
+        with self._lock:
+            if not self._schema_created:
+                conn.executescript(SCHEMA)
+                self._schema_created = True
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """The connection of the calling thread, opened on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction on the connection of the calling thread"""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def save(self, user: User) -> None:
+        """Same upserts as PostgresUserRepository.save: an active user is moved
+        from pending_users to users in one transaction"""
+        try:
+            with self.transaction() as conn:
+                self._save(conn, user)
+        except sqlite3.IntegrityError as e:
+            if "email already registered" not in str(e):
+                raise
+            raise EmailAlreadyExistsException(
+                f"Email {user.email.value} already registered."
+            )
+
+    def save_many(self, users: list[User]) -> None:
+        """Saves the users in one transaction: one commit, one WAL sync"""
+        with self.transaction() as conn:
+            for user in users:
+                self._save(conn, user)
+
+    @staticmethod
+    def _save(conn: sqlite3.Connection, user: User) -> None:
+        activation_code = user.activation_code
+        code = activation_code.value if activation_code else None
+        expires_at = _to_text(activation_code.expires_at) if activation_code else None
+        created_at = _to_text(user.created_at or datetime.now(timezone.utc))
+        if not user.is_active:
+            conn.execute(
+                SAVE_PENDING_USER,
+                (
+                    str(user.id),
+                    user.email.value,
+                    user.password_hash,
+                    code,
+                    expires_at,
+                    created_at,
+                ),
+            )
+            return
+        conn.execute(DELETE_PENDING_USER, (str(user.id),))
+        conn.execute(
+            SAVE_ACTIVE_USER,
+            (
+                str(user.id),
+                user.email.value,
+                user.password_hash,
+                user.is_active,
+                code,
+                expires_at,
+                created_at,
+            ),
+        )
+
+    def mark_active(self, user_id: uuid.UUID) -> User | None:
+        with self.transaction() as conn:
+            pending = conn.execute(PROMOTE_PENDING_USER, (str(user_id),)).fetchone()
+            if pending is None:
+                return None
+            row = conn.execute(INSERT_ACTIVATED_USER, tuple(pending)).fetchone()
+        return self._to_user(row)
+
+    def delete(self, user_id: uuid.UUID) -> None:
+        with self.transaction() as conn:
+            conn.execute(DELETE_PENDING_USER, (str(user_id),))
+            conn.execute(DELETE_USER, (str(user_id),))
+
+    def find_by_id(self, user_id: uuid.UUID) -> User | None:
+        row = self.connection().execute(FIND_USER_BY_ID, (str(user_id),)).fetchone()
+        return self._to_user(row)
+
+    def find_by_email(self, email: Email) -> User | None:
+        row = self.connection().execute(FIND_USER_BY_EMAIL, (email.value,)).fetchone()
+        return self._to_user(row)
+
+    def find_by_ids(self, user_ids: list[uuid.UUID]) -> list[User]:
+        if not user_ids:
+            return []
+        placeholders = ", ".join("?" * len(user_ids))
+        rows = self.connection().execute(
+            f"SELECT * FROM all_users WHERE id IN ({placeholders})",
+            [str(user_id) for user_id in user_ids],
+        )
+        return [self._to_user(row) for row in rows]
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        is_active: Optional[bool] = None,
+        pending_expired: bool = False,
+    ) -> list[User]:
+        params = []
+        if after is not None:
+            params += [_to_text(after[0]), str(after[1])]
+        if is_active is not None:
+            params.append(is_active)
+        if pending_expired:
+            params.append(_to_text(datetime.now(timezone.utc)))
+        query = list_users_query(after is not None, is_active, pending_expired)
+        rows = self.connection().execute(query, (*params, limit))
+        return [self._to_user(row) for row in rows]
+
+    def stream_all(self, fetch_size: int = 1000) -> Iterator[User]:
+        """Streams users from a dedicated connection, whose read snapshot does not
+        hold back writes of the calling thread"""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(STREAM_USERS)
+            while rows := cursor.fetchmany(fetch_size):
+                for row in rows:
+                    yield self._to_user(row)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_user(row) -> User | None:
+        if not row:
+            return None
+        return User(
+            id=row["id"],
+            email=Email(row["email"]),
+            password_hash=row["password_hash"],
+            is_active=bool(row["is_active"]),
+            activation_code=ActivationCode(
+                row["activation_code"], _from_text(row["code_expires_at"])
+            ),
+            created_at=_from_text(row["created_at"]),
+        )
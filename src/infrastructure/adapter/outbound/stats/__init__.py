@@ -0,0 +1,13 @@
+from .funnel_rollup_store import (
+    FunnelRollupStore,
+    PostgresFunnelRollupStore,
+    SqliteFunnelRollupStore,
+)
+from .registration_funnel import RegistrationFunnel
+
+__all__ = [
+    "FunnelRollupStore",
+    "PostgresFunnelRollupStore",
+    "SqliteFunnelRollupStore",
+    "RegistrationFunnel",
+]
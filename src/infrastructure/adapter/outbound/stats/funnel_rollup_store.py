@@ -0,0 +1,160 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from psycopg2.extras import execute_values
+
+from src.infrastructure.adapter.outbound.repository import (
+    ConnectionPool,
+    SqliteUserRepository,
+)
+from src.infrastructure.config import DatabaseConfig
+
+# Pending users whose activation expired within a window: by their code, or for
+# activation links (no code), created_at plus the link lifetime
+EXPIRED_CODES = """
+    SELECT count(*) FROM pending_users
+    WHERE code_expires_at >= {0} AND code_expires_at <= {0}
+"""
+EXPIRED_LINKS = """
+    SELECT count(*) FROM pending_users
+    WHERE code_expires_at IS NULL AND created_at >= {0} AND created_at <= {0}
+"""
+
+
+class FunnelRollupStore(ABC):
+    """Hourly totals of the funnel metrics, added to by every worker"""
+
+    @abstractmethod
+    def add(self, counts: dict[datetime, Counter]) -> None:
+        """Adds the metric counts of each hour to the totals"""
+        pass
+
+    @abstractmethod
+    def totals(self, since: datetime) -> Counter:
+        """Metric totals over the hours starting at or after since"""
+        pass
+
+    @abstractmethod
+    def expired_registrations(
+        self, since: datetime, until: datetime, link_ttl: timedelta
+    ) -> int:
+        """Registrations still pending whose code or link expired between since
+        and until: derived from the users, not counted as it happens, since no
+        event marks an expiry"""
+        pass
+
+
+class PostgresFunnelRollupStore(FunnelRollupStore):
+    """Rollup in the registration_funnel table: one row per hour and metric, so
+    that a window of statistics reads a few hundred rows at most"""
+
+    def __init__(
+        self,
+        db_config: DatabaseConfig,
+        pool: Optional[ConnectionPool] = None,
+        user_pools: tuple[ConnectionPool, ...] = (),
+    ):
+        self.db_config = db_config
+        self.pool = pool or ConnectionPool(db_config)
+        # Where pending_users are: the shards when users are sharded
+        self.user_pools = user_pools or (self.pool,)
+
+    def add(self, counts: dict[datetime, Counter]) -> None:
+        rows = [
+            (hour, metric, value)
+            for hour, metrics in counts.items()
+            for metric, value in metrics.items()
+        ]
+        if not rows:
+            return
+        query = """
+        INSERT INTO registration_funnel (hour, metric, value) VALUES %s
+        ON CONFLICT (hour, metric) DO UPDATE
+            SET value = registration_funnel.value + EXCLUDED.value
+        """
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                execute_values(cur, query, rows, page_size=len(rows))
+            conn.commit()
+
+    def totals(self, since: datetime) -> Counter:
+        query = """
+        SELECT metric, SUM(value) FROM registration_funnel
+        WHERE hour >= %s GROUP BY metric
+        """
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (since,))
+                rows = cur.fetchall()
+            conn.commit()
+        return Counter({metric: float(value) for metric, value in rows})
+
+    def expired_registrations(
+        self, since: datetime, until: datetime, link_ttl: timedelta
+    ) -> int:
+        expired = 0
+        for pool in self.user_pools:
+            with pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(EXPIRED_CODES.format("%s"), (since, until))
+                    expired += cur.fetchone()[0]
+                    cur.execute(
+                        EXPIRED_LINKS.format("%s"),
+                        (since - link_ttl, until - link_ttl),
+                    )
+                    expired += cur.fetchone()[0]
+                conn.commit()
+        return expired
+
+
+class SqliteFunnelRollupStore(FunnelRollupStore):
+    """Rollup in the registration_funnel table of the SQLite database, shared by
+    the workers of the node like the users"""
+
+    def __init__(self, repository: SqliteUserRepository):
+        self.repository = repository
+
+    def add(self, counts: dict[datetime, Counter]) -> None:
+        rows = [
+            (_to_text(hour), metric, value)
+            for hour, metrics in counts.items()
+            for metric, value in metrics.items()
+        ]
+        if not rows:
+            return
+        query = """
+        INSERT INTO registration_funnel (hour, metric, value) VALUES (?, ?, ?)
+        ON CONFLICT (hour, metric) DO UPDATE
+            SET value = registration_funnel.value + excluded.value
+        """
+        with self.repository.transaction() as conn:
+            conn.executemany(query, rows)
+
+    def totals(self, since: datetime) -> Counter:
+        query = """
+        SELECT metric, SUM(value) FROM registration_funnel
+        WHERE hour >= ? GROUP BY metric
+        """
+        rows = self.repository.connection().execute(query, (_to_text(since),))
+        return Counter({metric: float(value) for metric, value in rows})
+
+    def expired_registrations(
+        self, since: datetime, until: datetime, link_ttl: timedelta
+    ) -> int:
+        conn = self.repository.connection()
+        codes = conn.execute(
+            EXPIRED_CODES.format("?"), (_to_text(since), _to_text(until))
+        )
+        links = conn.execute(
+            EXPIRED_LINKS.format("?"),
+            (_to_text(since - link_ttl), _to_text(until - link_ttl)),
+        )
+        return codes.fetchone()[0] + links.fetchone()[0]
+
+
+def _to_text(value: datetime) -> str:
+    """As SqliteUserRepository stores timestamps: ISO-8601 UTC text, which sorts
+    like the timestamps"""
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
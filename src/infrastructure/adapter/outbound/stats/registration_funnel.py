@@ -0,0 +1,159 @@
+import logging
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from src.domain.port import RegistrationStatsPort
+from src.infrastructure.config import FunnelStatsConfig
+from .funnel_rollup_store import FunnelRollupStore
+
+logger = logging.getLogger(__name__)
+
+REGISTERED, ACTIVATED = "registered", "activated"
+EXPIRED_ATTEMPTS = "expired_attempts"
+LATENCY_SUM = "activation_seconds_sum"
+PERCENTILES = (50, 90, 99)
+
+
+def latency_metric(bound: Optional[float]) -> str:
+    """Metric of the latency bucket with upper bound bound (None: +Inf)"""
+    return f"activation_seconds_le_{'inf' if bound is None else f'{bound:g}'}"
+
+
+class RegistrationFunnel(RegistrationStatsPort):
+    """Counts registrations, activations and expired activation attempts, and the
+    activation latencies in a fixed-bucket histogram. Counts are kept per hour in
+    memory, and a background thread adds them to the rollup store every
+    flush_interval_seconds, so that recording an event never touches the database
+    and reading the statistics only reads the rollup.
+
+    Expired registrations are the exception: nothing happens when a code or link
+    expires, so they are counted from the pending users when reading. link_ttl
+    is the lifetime of activation links, which pending users do not store."""
+
+    def __init__(
+        self,
+        store: FunnelRollupStore,
+        config: FunnelStatsConfig = FunnelStatsConfig(),
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        link_ttl: timedelta = timedelta(minutes=15),
+    ):
+        self.store = store
+        self.config = config
+        self._now = now
+        self.link_ttl = link_ttl
+        self._pending: dict[datetime, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    def record_registered(self) -> None:
+        self._count({REGISTERED: 1})
+
+    def record_activated(self, latency: timedelta) -> None:
+        seconds = max(0.0, latency.total_seconds())
+        bound = next(
+            (
+                bound
+                for bound in self.config.latency_buckets_seconds
+                if seconds <= bound
+            ),
+            None,
+        )
+        self._count({ACTIVATED: 1, LATENCY_SUM: seconds, latency_metric(bound): 1})
+
+    def record_expired(self) -> None:
+        self._count({EXPIRED_ATTEMPTS: 1})
+
+    def _hour(self) -> datetime:
+        return self._now().replace(minute=0, second=0, microsecond=0)
+
+    def _count(self, metrics: dict) -> None:
+        hour = self._hour()
+        with self._lock:
+            self._pending[hour].update(metrics)
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run, name="funnel-flush", daemon=True
+                )
+                self._flusher.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.config.flush_interval_seconds):
+            self.flush()
+
+    def flush(self) -> None:
+        """Adds the counts of this worker to the rollup. They are kept for the next
+        flush when the store is unavailable."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(Counter)
+        if not pending:
+            return
+        try:
+            self.store.add(pending)
+        except Exception:
+            logger.warning("Funnel counters not flushed yet", exc_info=True)
+            with self._lock:
+                for hour, metrics in pending.items():
+                    self._pending[hour].update(metrics)
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    def summary(self, hours: Optional[int] = None) -> dict:
+        """Funnel over the last hours (the current one included): the rollup of
+        every worker, plus the counts this worker has not flushed yet. Expired
+        registrations are those whose code or link expired in the window and
+        that are still pending."""
+        hours = hours or self.config.default_window_hours
+        now = self._now()
+        since = self._hour() - timedelta(hours=hours - 1)
+        totals = self.store.totals(since)
+        expired = self.store.expired_registrations(since, now, self.link_ttl)
+        with self._lock:
+            for hour, metrics in self._pending.items():
+                if hour >= since:
+                    totals.update(metrics)
+        registered, activated = int(totals[REGISTERED]), int(totals[ACTIVATED])
+        return {
+            "since": since.isoformat(),
+            "hours": hours,
+            "registered": registered,
+            "activated": activated,
+            "expired": expired,
+            "expired_attempts": int(totals[EXPIRED_ATTEMPTS]),
+            "activation_rate": (
+                round(activated / registered, 4) if registered else None
+            ),
+            "activation_latency": self._latency(totals, activated),
+        }
+
+    def _latency(self, totals: Counter, activated: int) -> dict:
+        bounds = [*self.config.latency_buckets_seconds, None]
+        buckets = [
+            {
+                "le": "+Inf" if bound is None else bound,
+                "count": int(totals[latency_metric(bound)]),
+            }
+            for bound in bounds
+        ]
+        latency = {
+            "mean_seconds": (
+                round(totals[LATENCY_SUM] / activated, 3) if activated else None
+            ),
+            "buckets": buckets,
+        }
+        for percentile in PERCENTILES:
+            # Upper bound of the bucket holding the percentile
+            latency[f"p{percentile}_seconds"] = None
+            seen = 0
+            for bucket in buckets:
+                seen += bucket["count"]
+                if activated and seen * 100 >= activated * percentile:
+                    latency[f"p{percentile}_seconds"] = bucket["le"]
+                    break
+        return latency
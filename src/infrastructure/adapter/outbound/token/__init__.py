@@ -0,0 +1,3 @@
+from .hmac_activation_token_signer import HmacActivationTokenSigner
+
+__all__ = ["HmacActivationTokenSigner"]
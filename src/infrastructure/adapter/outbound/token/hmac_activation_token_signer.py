@@ -0,0 +1,60 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import uuid
+from datetime import datetime, timezone
+
+from src.domain.exception import (
+    ExpiredActivationCodeException,
+    InvalidActivationCodeException,
+)
+from src.domain.port import ActivationTokenPort
+
+
+class HmacActivationTokenSigner(ActivationTokenPort):
+    """Activation tokens carrying the user id and expiry, signed with HMAC-SHA256.
+
+    Tokens look like "<key id>.<payload>.<signature>". New tokens are signed with the
+    signing key, while every configured key still verifies: rotate by adding a new
+    signing key and dropping the previous one once its tokens have expired.
+    """
+
+    def __init__(self, keys: dict[str, bytes], signing_key_id: str):
+        if signing_key_id not in keys:
+            raise ValueError(f"Unknown signing key id: {signing_key_id}")
+        if any("." in key_id for key_id in keys):
+            raise ValueError("Key ids cannot contain '.'")
+        self.keys = keys
+        self.signing_key_id = signing_key_id
+
+    def issue(self, user_id: uuid.UUID, expires_at: datetime) -> str:
+        payload = _encode(f"{user_id}:{int(expires_at.timestamp())}".encode())
+        signed = f"{self.signing_key_id}.{payload}"
+        return f"{signed}.{_encode(self._sign(self.signing_key_id, signed))}"
+
+    def verify(self, token: str) -> uuid.UUID:
+        try:
+            key_id, payload, signature = token.split(".")
+            if key_id not in self.keys or not hmac.compare_digest(
+                _decode(signature), self._sign(key_id, f"{key_id}.{payload}")
+            ):
+                raise InvalidActivationCodeException("Invalid activation token.")
+            user_id, expires_at = _decode(payload).decode().split(":")
+            user_id, expires_at = uuid.UUID(user_id), int(expires_at)
+        except (ValueError, binascii.Error):
+            raise InvalidActivationCodeException("Invalid activation token.")
+        if datetime.now(timezone.utc).timestamp() > expires_at:
+            raise ExpiredActivationCodeException("Activation token has expired.")
+        return user_id
+
+    def _sign(self, key_id: str, signed: str) -> bytes:
+        return hmac.new(self.keys[key_id], signed.encode(), hashlib.sha256).digest()
+
+
+def _encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(encoded: str) -> bytes:
+    return base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
@@ -0,0 +1,112 @@
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StageCosts:
+    """Seconds per operation, measured on the host that will serve the API"""
+
+    bcrypt_hash: float
+    bcrypt_verify: float
+    db_lookup: float
+    db_upsert: float
+    smtp_send: float
+
+
+@dataclass(frozen=True)
+class Deployment:
+    workers: int
+    threadpool_size: int
+    db_pool_size: int
+    cpus: int
+    # DatabaseConfig.backend: SQLite has no pool, and one writer at a time
+    backend: str = "postgres"
+
+
+@dataclass(frozen=True)
+class Flow:
+    """What one request of an endpoint spends in each stage"""
+
+    name: str
+    # bcrypt, which releases the GIL: runs in parallel up to the CPU count
+    cpu_seconds: float
+    # A pooled connection is held for the duration of each statement
+    db_seconds: float
+    smtp_seconds: float
+    # The part of db_seconds spent writing
+    db_write_seconds: float = 0.0
+
+    @property
+    def thread_seconds(self) -> float:
+        """Synchronous endpoints hold a threadpool thread for the whole request"""
+        return self.cpu_seconds + self.db_seconds + self.smtp_seconds
+
+
+@dataclass(frozen=True)
+class FlowCapacity:
+    flow: Flow
+    # Requests per second each stage sustains, from the most limiting one
+    limits: list[tuple[str, float]]
+
+    @property
+    def bottleneck(self) -> str:
+        return self.limits[0][0]
+
+    @property
+    def max_rate(self) -> float:
+        return self.limits[0][1]
+
+
+def flows(costs: StageCosts, email_in_request: bool = True) -> list[Flow]:
+    """The endpoints of user_controller. Registration looks the email up, hashes
+    the password, saves the user and sends the email (queued instead with the
+    email scheduler). Activation with a code checks the Basic credentials (lookup
+    and bcrypt verify), reads the user and saves it; with a link, it only marks
+    the user active."""
+    return [
+        Flow(
+            "register",
+            costs.bcrypt_hash,
+            costs.db_lookup + costs.db_upsert,
+            costs.smtp_send if email_in_request else 0.0,
+            costs.db_upsert,
+        ),
+        Flow(
+            "activate (code)",
+            costs.bcrypt_verify,
+            2 * costs.db_lookup + costs.db_upsert,
+            0.0,
+            costs.db_upsert,
+        ),
+        Flow("activate (link)", 0.0, costs.db_upsert, 0.0, costs.db_upsert),
+    ]
+
+
+def _rate(slots: int, seconds: float) -> float:
+    return slots / seconds if seconds > 0 else math.inf
+
+
+def capacity(flow: Flow, deployment: Deployment) -> FlowCapacity:
+    """Sustainable requests per second of a flow, alone on the deployment: each
+    stage is a pool of slots (cores, connections, threads) busy for the time the
+    flow spends in it, so it sustains slots / seconds requests per second.
+
+    With SQLite, each thread has its own connection, but the database file takes
+    one writer at a time, across all workers: writes are a single slot."""
+    threads = deployment.workers * deployment.threadpool_size
+    limits = [
+        ("cpu (bcrypt)", _rate(min(deployment.cpus, threads), flow.cpu_seconds)),
+        ("threadpool", _rate(threads, flow.thread_seconds)),
+    ]
+    if deployment.backend == "sqlite":
+        limits.append(("database writes", _rate(1, flow.db_write_seconds)))
+    else:
+        limits.append(
+            (
+                "database pool",
+                _rate(deployment.workers * deployment.db_pool_size, flow.db_seconds),
+            )
+        )
+    # A stage the flow does not use does not limit it
+    limits = [limit for limit in limits if limit[1] != math.inf]
+    return FlowCapacity(flow, sorted(limits, key=lambda limit: limit[1]))
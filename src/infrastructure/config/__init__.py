@@ -1,4 +1,37 @@
+from .activation_config import ActivationConfig
+from .admin_config import AdminConfig
+from .circuit_breaker_config import CircuitBreakerConfig
 from .database_config import DatabaseConfig
+from .deadline_config import DeadlineConfig
+from .email_scheduler_config import EmailSchedulerConfig
+from .funnel_stats_config import FunnelStatsConfig
+from .group_commit_config import GroupCommitConfig
+from .idempotency_config import IdempotencyConfig
+from .internal_api_config import InternalApiConfig
+from .logging_config import LoggingConfig
+from .profiling_config import ProfilingConfig
+from .server_config import ServerConfig
+from .sharding_config import ShardingConfig
+from .slow_query_config import SlowQueryConfig
 from .smtp_config import SmtpConfig
+from .sqlite_config import SqliteConfig
 
-__all__ = ["DatabaseConfig", "SmtpConfig"]
+__all__ = [
+    "ActivationConfig",
+    "AdminConfig",
+    "CircuitBreakerConfig",
+    "DatabaseConfig",
+    "DeadlineConfig",
+    "EmailSchedulerConfig",
+    "FunnelStatsConfig",
+    "GroupCommitConfig",
+    "IdempotencyConfig",
+    "InternalApiConfig",
+    "LoggingConfig",
+    "ProfilingConfig",
+    "ServerConfig",
+    "ShardingConfig",
+    "SlowQueryConfig",
+    "SmtpConfig",
+    "SqliteConfig",
+]
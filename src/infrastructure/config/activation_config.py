@@ -0,0 +1,33 @@
+import os
+from dataclasses import dataclass, field
+
+
+def _parse_keys(raw: str) -> dict[str, bytes]:
+    """Parses "key_id:secret,key_id:secret" into the signing keys"""
+    keys = {}
+    for entry in filter(None, (item.strip() for item in raw.split(","))):
+        key_id, _, secret = entry.partition(":")
+        keys[key_id] = secret.encode()
+    return keys
+
+
+@dataclass
+class ActivationConfig:
+    """Configuration of the activation flow: 4-digit codes or signed links"""
+
+    mode: str = field(default_factory=lambda: os.getenv("ACTIVATION_MODE", "code"))
+    # The first key signs new tokens, all of them verify (for rotation)
+    token_keys: dict[str, bytes] = field(
+        default_factory=lambda: _parse_keys(os.getenv("ACTIVATION_TOKEN_KEYS", ""))
+    )
+    token_ttl_seconds: int = 15 * 60
+
+    def __post_init__(self):
+        if self.mode not in ("code", "token"):
+            raise ValueError(f"Unknown activation mode: {self.mode}")
+        if self.mode == "token" and not self.token_keys:
+            raise ValueError("The token activation mode requires ACTIVATION_TOKEN_KEYS")
+
+    @property
+    def signing_key_id(self) -> str:
+        return next(iter(self.token_keys))
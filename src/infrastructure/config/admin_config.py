@@ -0,0 +1,11 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class AdminConfig:
+    """Configuration for the admin API, disabled while no token is set"""
+
+    api_token: str = field(default_factory=lambda: os.getenv("ADMIN_API_TOKEN", ""))
+    max_batch_lookup: int = 100
+    export_fetch_size: int = 1000
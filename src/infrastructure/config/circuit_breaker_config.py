@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Configuration of the circuit breaker guarding the SMTP email sender"""
+
+    enabled: bool = True
+    # Outcomes of the last window_size calls decide whether the circuit opens
+    window_size: int = 20
+    minimum_calls: int = 5
+    failure_rate_threshold: float = 0.5
+    # Calls slower than slow_call_seconds count against slow_call_rate_threshold
+    slow_call_seconds: float = 2.0
+    slow_call_rate_threshold: float = 0.5
+    open_seconds: float = 30.0
+    half_open_max_calls: int = 1
+    fallback: str = "raise"  # "raise" or "queue"
+    retry_queue_size: int = 1000
+    retry_interval_seconds: float = 5.0
+
+    def __post_init__(self):
+        if self.fallback not in ("raise", "queue"):
+            raise ValueError(f"Unknown circuit breaker fallback: {self.fallback}")
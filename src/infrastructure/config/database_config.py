@@ -1,12 +1,31 @@
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 
 
 @dataclass
 class DatabaseConfig:
     """Configuration for the database connection"""
 
-    host: str = "postgres"
-    database: str = "user_registration"
-    user: str = "postgres"
-    password: str = "password"
-    port: int = 5432
+    # "postgres", or "sqlite" for single-node installs (see SqliteConfig)
+    backend: str = field(default_factory=lambda: os.getenv("DB_BACKEND", "postgres"))
+    host: str = field(default_factory=lambda: os.getenv("DB_HOST", "postgres"))
+    database: str = field(
+        default_factory=lambda: os.getenv("DB_NAME", "user_registration")
+    )
+    user: str = field(default_factory=lambda: os.getenv("DB_USER", "postgres"))
+    password: str = field(default_factory=lambda: os.getenv("DB_PASSWORD", "password"))
+    port: int = field(default_factory=lambda: int(os.getenv("DB_PORT", "5432")))
+    min_pool_size: int = field(
+        default_factory=lambda: int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+    )
+    # Per process: the production server derives it from the max_connections budget
+    max_pool_size: int = field(
+        default_factory=lambda: int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    )
+    pool_acquire_timeout: float = 5.0
+    # Disable behind a transaction-mode pooler (e.g. PgBouncer), where
+    # consecutive transactions may not run on the same server session
+    prepared_statements: bool = field(
+        default_factory=lambda: os.getenv("DB_PREPARED_STATEMENTS", "true").lower()
+        == "true"
+    )
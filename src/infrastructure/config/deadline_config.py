@@ -0,0 +1,45 @@
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Optional
+
+
+@dataclass
+class DeadlineConfig:
+    """Time budgets of the API requests, per "METHOD /path/{template}" route.
+    Clients may shorten them with the header, never extend them."""
+
+    default_seconds: Optional[float] = 10.0
+    route_seconds: dict[str, Optional[float]] = field(
+        default_factory=lambda: {
+            "POST /api/v1/users/register": 5.0,
+            "POST /api/v1/users/{user_id}/activate": 3.0,
+            "GET /api/v1/users/activate": 3.0,
+            "POST /internal/v1/users/register": 5.0,
+            "POST /internal/v1/users/activate": 3.0,
+            # Streams every user: bounded by the client instead
+            "GET /api/v1/admin/users/export": None,
+        }
+    )
+    header: str = "X-Request-Timeout"
+
+    @cached_property
+    def _routes(self) -> list[tuple[str, re.Pattern, Optional[float]]]:
+        routes = []
+        for route, seconds in self.route_seconds.items():
+            method, path = route.split(" ", 1)
+            pattern = re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(path))
+            routes.append((method, re.compile(pattern + "$"), seconds))
+        return routes
+
+    def budget_for(
+        self, method: str, path: str, requested: Optional[float] = None
+    ) -> Optional[float]:
+        budget = self.default_seconds
+        for route_method, pattern, seconds in self._routes:
+            if route_method == method and pattern.match(path):
+                budget = seconds
+                break
+        if requested is None or requested <= 0:
+            return budget
+        return requested if budget is None else min(budget, requested)
@@ -0,0 +1,24 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class EmailSchedulerConfig:
+    """Configuration of the email send scheduler (ScheduledEmailSender)"""
+
+    enabled: bool = field(
+        default_factory=lambda: os.getenv("EMAIL_SCHEDULER", "false").lower() == "true"
+    )
+    # Token bucket of each recipient domain: emails per second, and burst
+    per_domain_rate: float = 5.0
+    per_domain_burst: int = 10
+    # Rates of the domains throttling harder (or allowing more) than the default
+    domain_rates: dict[str, float] = field(default_factory=dict)
+    workers: int = 4
+    max_queued: int = 10000
+    # A failed email is retried after retry_delay_seconds, unless it would have
+    # expired by then, in the lane behind fresh emails
+    retry_delay_seconds: float = 5.0
+    max_attempts: int = 3
+    # How long close() waits for the queued emails to be sent
+    drain_timeout_seconds: float = 5.0
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class FunnelStatsConfig:
+    """Configuration of the registration funnel counters (RegistrationFunnel)"""
+
+    # Counters are added to the hourly rollup every flush_interval_seconds: the
+    # statistics of a worker lag by that much, and are lost past it on a crash
+    flush_interval_seconds: float = 10.0
+    # Upper bounds of the activation latency histogram buckets, plus +Inf
+    latency_buckets_seconds: tuple[float, ...] = (5, 10, 20, 30, 45, 60, 300, 900)
+    default_window_hours: int = 24
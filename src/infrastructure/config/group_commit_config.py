@@ -0,0 +1,15 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class GroupCommitConfig:
+    """Configuration of the group commit of user saves (GroupCommitUserRepository)"""
+
+    enabled: bool = field(
+        default_factory=lambda: os.getenv("GROUP_COMMIT", "false").lower() == "true"
+    )
+    # A batch is written once it holds max_batch_size saves, or max_delay_seconds
+    # after its first save: the latency a save may gain, at most
+    max_batch_size: int = 128
+    max_delay_seconds: float = 0.002
@@ -0,0 +1,32 @@
+import os
+import secrets
+from dataclasses import dataclass, field
+
+
+@dataclass
+class IdempotencyConfig:
+    """Configuration for the Idempotency-Key handling of the API"""
+
+    # "memory" or "postgres"
+    backend: str = field(
+        default_factory=lambda: os.getenv("IDEMPOTENCY_BACKEND", "memory")
+    )
+    # HMAC key of the stored request fingerprints, which cover passwords. Without
+    # it, a random key per process: enough for the in-memory store only.
+    fingerprint_key: bytes = field(
+        default_factory=lambda: os.getenv("IDEMPOTENCY_FINGERPRINT_KEY", "").encode()
+    )
+    max_entries: int = 10_000
+    ttl_seconds: int = 24 * 60 * 60
+    # Bounded by the request deadline as well
+    wait_timeout_seconds: float = 30.0
+    poll_interval_seconds: float = 0.05
+
+    def __post_init__(self):
+        if not self.fingerprint_key:
+            if self.backend == "postgres":
+                raise ValueError(
+                    "The postgres idempotency backend requires "
+                    "IDEMPOTENCY_FINGERPRINT_KEY"
+                )
+            self.fingerprint_key = secrets.token_bytes(32)
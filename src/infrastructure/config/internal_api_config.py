@@ -0,0 +1,14 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class InternalApiConfig:
+    """Configuration of the MessagePack API of internal services, disabled while
+    no token is set"""
+
+    api_token: str = field(default_factory=lambda: os.getenv("INTERNAL_API_TOKEN", ""))
+    max_batch_size: int = 100
+    # Items of a batch run concurrently, on the threadpool of the synchronous
+    # endpoints: a batch never takes more than batch_concurrency of its threads
+    batch_concurrency: int = 8
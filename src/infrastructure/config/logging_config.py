@@ -0,0 +1,18 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class LoggingConfig:
+    """Configuration of the structured (JSON) logs, written by a background thread"""
+
+    level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    # Records beyond queue_size are dropped (and counted) instead of blocking requests
+    queue_size: int = 10_000
+    batch_size: int = 256
+    flush_interval_seconds: float = 0.5
+    access_log: bool = True
+    # Share of the successful requests logged, per "METHOD /path/{template}" route
+    access_log_sample_rates: dict[str, float] = field(
+        default_factory=lambda: {"GET /live": 0.01, "GET /ready": 0.01}
+    )
@@ -0,0 +1,22 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ProfilingConfig:
+    """Configuration of the allocation profiling exposed by the admin memory endpoints"""
+
+    # Frames kept per allocation: sites are attributed to the innermost frame of
+    # the application, FastAPI, psycopg2 or the email modules
+    tracemalloc_frames: int = 10
+    # Snapshots kept per worker, oldest dropped first: each holds every trace
+    max_snapshots: int = 5
+    # Share of the requests counting the instances they create of tracked_types
+    allocation_sample_rate: float = field(
+        default_factory=lambda: float(os.getenv("ALLOCATION_SAMPLE_RATE", "0"))
+    )
+    tracked_types: tuple[str, ...] = (
+        "src.domain.model.User",
+        "src.domain.model.ActivationCode",
+        "psycopg2.extras.DictRow",
+    )
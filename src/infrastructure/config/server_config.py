@@ -0,0 +1,67 @@
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+def available_cpus(cgroup_cpu_max: Path = Path("/sys/fs/cgroup/cpu.max")) -> int:
+    """CPUs this process may use: the container CPU quota when there is one,
+    otherwise the CPUs of its affinity mask"""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    cpus = cpus or os.cpu_count() or 1
+    try:
+        quota, period = cgroup_cpu_max.read_text().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+
+@dataclass
+class ServerConfig:
+    """Configuration of the production HTTP server (gunicorn + uvicorn workers)"""
+
+    host: str = field(default_factory=lambda: os.getenv("HOST", "0.0.0.0"))
+    port: int = field(default_factory=lambda: _env_int("PORT", 8080))
+    # 0 sizes the workers from the available CPUs: registration is bound by bcrypt
+    workers: int = field(default_factory=lambda: _env_int("WEB_CONCURRENCY", 0))
+    # Keep above the idle timeout of the load balancer in front of the app
+    keepalive: int = field(default_factory=lambda: _env_int("KEEPALIVE", 75))
+    backlog: int = field(default_factory=lambda: _env_int("BACKLOG", 2048))
+    # Threads running the synchronous endpoints, per worker
+    threadpool_size: int = field(
+        default_factory=lambda: _env_int("THREADPOOL_SIZE", 40)
+    )
+    timeout: int = field(default_factory=lambda: _env_int("WORKER_TIMEOUT", 30))
+    graceful_timeout: int = field(
+        default_factory=lambda: _env_int("GRACEFUL_TIMEOUT", 30)
+    )
+    # Postgres max_connections, minus what other clients (psql, CLIs, replication) need
+    db_max_connections: int = field(
+        default_factory=lambda: _env_int("DB_MAX_CONNECTIONS", 100)
+    )
+    db_reserved_connections: int = field(
+        default_factory=lambda: _env_int("DB_RESERVED_CONNECTIONS", 10)
+    )
+
+    @property
+    def worker_count(self) -> int:
+        return self.workers if self.workers > 0 else available_cpus()
+
+    @property
+    def db_pool_size_per_worker(self) -> int:
+        """Largest pool keeping workers x pool within the max_connections budget.
+        A worker never needs more connections than threads able to use them."""
+        budget = self.db_max_connections - self.db_reserved_connections
+        pool_size = min(self.threadpool_size, budget // self.worker_count)
+        if pool_size < 1:
+            raise ValueError(
+                f"{self.worker_count} workers exceed the budget of {budget} "
+                "database connections"
+            )
+        return pool_size
@@ -0,0 +1,42 @@
+import dataclasses
+import os
+from dataclasses import dataclass, field
+
+from .database_config import DatabaseConfig
+
+
+def _split(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+@dataclass
+class ShardingConfig:
+    """Hash-sharding of users across Postgres databases. Disabled without shards:
+    users then live in the database of DatabaseConfig."""
+
+    # "host[:port][/database]" per shard. Keep the order and only append: the
+    # position of a shard is what emails hash to (rebalance after appending).
+    shards: list[str] = field(
+        default_factory=lambda: _split(os.getenv("DB_SHARDS", ""))
+    )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.shards)
+
+    def shard_configs(self, base: DatabaseConfig) -> list[DatabaseConfig]:
+        """One configuration per shard, sharing the credentials and pool sizes
+        of the base configuration"""
+        configs = []
+        for shard in self.shards:
+            address, _, database = shard.partition("/")
+            host, _, port = address.partition(":")
+            configs.append(
+                dataclasses.replace(
+                    base,
+                    host=host,
+                    port=int(port) if port else base.port,
+                    database=database or base.database,
+                )
+            )
+        return configs
@@ -0,0 +1,18 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SlowQueryConfig:
+    """Configuration of the slow-query log of the Postgres user repository"""
+
+    enabled: bool = True
+    threshold_ms: float = field(
+        default_factory=lambda: float(os.getenv("SLOW_QUERY_MS", "200"))
+    )
+    # Share of the slow queries explained in a background thread: reads under
+    # EXPLAIN (ANALYZE, BUFFERS) in a rolled back transaction, writes plain EXPLAIN
+    explain_sample_rate: float = 0.1
+    explain_timeout_ms: int = 10_000
+    # Slowest queries kept for the admin endpoint
+    max_entries: int = 20
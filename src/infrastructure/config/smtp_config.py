@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
+from typing import Optional
 
 
 @dataclass
@@ -8,4 +10,19 @@ class SmtpConfig:
     host: str = "smtp"
     port: int = 1025
     timeout: int = 10
+    # SMTP sessions kept open between emails, and opened ahead by the warm-up
+    max_idle_sessions: int = 2
+    # A session idle for longer is checked with NOOP before reuse: servers close
+    # idle sessions after a timeout of their own
+    idle_check_seconds: float = 30.0
+    # Concurrent connections of the asyncio sender, each pipelining its commands
+    max_connections: int = 4
     sender_email: str = "noreply@spookymotion.com"
+    default_locale: str = "en"
+    template_directory: Optional[str] = None
+    activation_link_url: str = field(
+        default_factory=lambda: os.getenv(
+            "ACTIVATION_LINK_URL",
+            "http://localhost:8080/api/v1/users/activate?token=",
+        )
+    )
@@ -0,0 +1,17 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SqliteConfig:
+    """Configuration of the embedded SQLite database (DB_BACKEND=sqlite)"""
+
+    path: str = field(default_factory=lambda: os.getenv("SQLITE_PATH", "data/users.db"))
+    # How long a write waits for the lock held by another writer (thread or worker)
+    busy_timeout_seconds: float = 5.0
+    # NORMAL only syncs the WAL at checkpoints: a power loss may lose the last
+    # commits, never corrupt the database. FULL syncs every commit.
+    synchronous: str = "NORMAL"
+    # Prepared statements kept per connection
+    cached_statements: int = 64
+    mmap_size: int = 256 * 1024 * 1024
@@ -0,0 +1,38 @@
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from src.domain.exception import DeadlineExceededException
+
+# Monotonic time by which the current request must be answered
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(seconds: Optional[float]) -> Token:
+    """Starts the time budget of the current request (None: no deadline)"""
+    return _deadline.set(None if seconds is None else time.monotonic() + seconds)
+
+
+def reset_deadline(token: Token) -> None:
+    _deadline.reset(token)
+
+
+def time_left() -> Optional[float]:
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def bounded_timeout(default: Optional[float]) -> Optional[float]:
+    """The default timeout, shortened to the time left before the deadline.
+    Raises once the budget is exhausted, so that no call starts without time."""
+    left = time_left()
+    if left is None:
+        return default
+    if left <= 0:
+        raise DeadlineExceededException("Request deadline exceeded.")
+    return left if default is None else min(default, left)
+
+
+def deadline_exceeded() -> bool:
+    left = time_left()
+    return left is not None and left <= 0
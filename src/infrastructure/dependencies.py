@@ -1,46 +1,316 @@
+import hashlib
+import secrets
+from datetime import timedelta
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status, Security
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi.security import (
+    HTTPAuthorizationCredentials,
+    HTTPBasic,
+    HTTPBasicCredentials,
+    HTTPBearer,
+)
 from passlib.context import CryptContext
 
-from src.application.service import RegisterUserService, ActivateUserService
+from src.application.service import (
+    RegisterUserService,
+    ActivateUserService,
+    LookupUsersService,
+    ExportUsersService,
+    ListUsersService,
+)
 from src.domain.model import Email, User
+from src.domain.port import (
+    ActivationTokenPort,
+    EmailSenderPort,
+    IdempotencyStorePort,
+    UserRepositoryPort,
+)
 from src.infrastructure.adapter.outbound import (
+    CircuitBreakerEmailSender,
     PostgresUserRepository,
     MailhogEmailSender,
+    ScheduledEmailSender,
+    InMemoryIdempotencyStore,
+    PostgresIdempotencyStore,
 )
-from src.infrastructure.config import DatabaseConfig, SmtpConfig
+from src.infrastructure.adapter.outbound.repository import (
+    ConnectionPool,
+    GroupCommitUserRepository,
+    PostgresShardRoutingIndex,
+    ShardedUserRepository,
+    SingleFlightUserRepository,
+    SlowQueryLog,
+    SqliteUserRepository,
+)
+from src.infrastructure.adapter.outbound.stats import (
+    PostgresFunnelRollupStore,
+    SqliteFunnelRollupStore,
+    RegistrationFunnel,
+)
+from src.infrastructure.adapter.outbound.token import HmacActivationTokenSigner
+from src.infrastructure.config import (
+    ActivationConfig,
+    AdminConfig,
+    CircuitBreakerConfig,
+    DatabaseConfig,
+    EmailSchedulerConfig,
+    FunnelStatsConfig,
+    GroupCommitConfig,
+    IdempotencyConfig,
+    InternalApiConfig,
+    ProfilingConfig,
+    ShardingConfig,
+    SlowQueryConfig,
+    SmtpConfig,
+    SqliteConfig,
+)
+from src.infrastructure.observability import AllocationProfiler
+from src.infrastructure.resilience import SingleFlight
+from src.infrastructure.warm_up import WarmUp
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_password_checks = SingleFlight()
+
 
+@lru_cache(maxsize=None)
+def get_connection_pool() -> ConnectionPool:
+    """Process-wide pool, so that connections outlive a single request"""
+    return ConnectionPool(DatabaseConfig())
 
-def get_user_repository():
-    return PostgresUserRepository(DatabaseConfig())
 
+@lru_cache(maxsize=None)
+def get_shard_pools() -> tuple[ConnectionPool, ...]:
+    """One process-wide pool per shard, none when sharding is disabled"""
+    configs = ShardingConfig().shard_configs(DatabaseConfig())
+    return tuple(ConnectionPool(config) for config in configs)
 
-def get_email_sender():
-    return MailhogEmailSender(SmtpConfig())
+
+@lru_cache(maxsize=None)
+def get_slow_query_log() -> SlowQueryLog:
+    return SlowQueryLog(SlowQueryConfig())
+
+
+def build_user_repository(
+    directory_pool: ConnectionPool,
+    shard_pools: tuple[ConnectionPool, ...] = (),
+    slow_queries: Optional[SlowQueryLog] = None,
+) -> UserRepositoryPort:
+    """Users of the directory database, or sharded across the shard databases,
+    with the routing index in the directory database"""
+    if not shard_pools:
+        return PostgresUserRepository(
+            directory_pool.db_config, directory_pool, slow_queries
+        )
+    return ShardedUserRepository(
+        [
+            PostgresUserRepository(pool.db_config, pool, slow_queries)
+            for pool in shard_pools
+        ],
+        PostgresShardRoutingIndex(directory_pool.db_config, directory_pool),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_sqlite_user_repository() -> SqliteUserRepository:
+    """Process-wide, so that each thread keeps its connection across requests"""
+    return SqliteUserRepository(SqliteConfig())
+
+
+@lru_cache(maxsize=None)
+def get_user_repository() -> UserRepositoryPort:
+    """Shared, so that concurrent identical lookups are coalesced"""
+    if DatabaseConfig().backend == "sqlite":
+        repository = get_sqlite_user_repository()
+    else:
+        repository = build_user_repository(
+            get_connection_pool(), get_shard_pools(), get_slow_query_log()
+        )
+    group_commit = GroupCommitConfig()
+    if group_commit.enabled:
+        repository = GroupCommitUserRepository(repository, group_commit)
+    return SingleFlightUserRepository(repository)
+
+
+@lru_cache(maxsize=None)
+def get_email_sender() -> EmailSenderPort:
+    """Shared, so that the circuit breaker sees the outcome of every email and the
+    scheduler shapes all of them"""
+    sender = MailhogEmailSender(SmtpConfig())
+    config = CircuitBreakerConfig()
+    if config.enabled:
+        sender = CircuitBreakerEmailSender(sender, config)
+    scheduler = EmailSchedulerConfig()
+    if scheduler.enabled:
+        sender = ScheduledEmailSender(sender, scheduler)
+    return sender
+
+
+@lru_cache(maxsize=None)
+def get_idempotency_store() -> IdempotencyStorePort:
+    """Shared across requests so that concurrent duplicates see each other"""
+    config = IdempotencyConfig()
+    if config.backend == "postgres":
+        return PostgresIdempotencyStore(DatabaseConfig(), config, get_connection_pool())
+    return InMemoryIdempotencyStore(config)
+
+
+@lru_cache(maxsize=None)
+def get_registration_funnel() -> RegistrationFunnel:
+    """Per worker process: each worker adds its counts to the shared rollup"""
+    if DatabaseConfig().backend == "sqlite":
+        store = SqliteFunnelRollupStore(get_sqlite_user_repository())
+    else:
+        store = PostgresFunnelRollupStore(
+            DatabaseConfig(), get_connection_pool(), get_shard_pools()
+        )
+    link_ttl = timedelta(seconds=get_activation_config().token_ttl_seconds)
+    return RegistrationFunnel(store, FunnelStatsConfig(), link_ttl=link_ttl)
+
+
+@lru_cache(maxsize=None)
+def get_activation_config() -> ActivationConfig:
+    return ActivationConfig()
+
+
+@lru_cache(maxsize=None)
+def get_activation_token_signer() -> Optional[ActivationTokenPort]:
+    """Token verification stays available in "code" mode while keys are configured,
+    so that links already sent keep working when switching modes"""
+    config = get_activation_config()
+    if not config.token_keys:
+        return None
+    return HmacActivationTokenSigner(config.token_keys, config.signing_key_id)
 
 
 def get_register_service(
     user_repository=Depends(get_user_repository), email_sender=Depends(get_email_sender)
 ) -> RegisterUserService:
+    config = get_activation_config()
     return RegisterUserService(
-        user_repository=user_repository, email_sender=email_sender
+        user_repository=user_repository,
+        email_sender=email_sender,
+        activation_tokens=(
+            get_activation_token_signer() if config.mode == "token" else None
+        ),
+        activation_token_ttl=timedelta(seconds=config.token_ttl_seconds),
+        stats=get_registration_funnel(),
     )
 
 
 def get_activate_service(
     user_repository=Depends(get_user_repository),
 ) -> ActivateUserService:
-    return ActivateUserService(user_repository=user_repository)
+    return ActivateUserService(
+        user_repository=user_repository,
+        activation_tokens=get_activation_token_signer(),
+        stats=get_registration_funnel(),
+    )
+
+
+def get_lookup_service(
+    user_repository=Depends(get_user_repository),
+) -> LookupUsersService:
+    return LookupUsersService(user_repository=user_repository)
+
+
+def get_export_service(
+    user_repository=Depends(get_user_repository),
+) -> ExportUsersService:
+    return ExportUsersService(user_repository=user_repository)
+
+
+def get_list_service(
+    user_repository=Depends(get_user_repository),
+) -> ListUsersService:
+    return ListUsersService(user_repository=user_repository)
+
+
+@lru_cache(maxsize=None)
+def get_admin_config() -> AdminConfig:
+    return AdminConfig()
+
+
+@lru_cache(maxsize=None)
+def get_allocation_profiler() -> AllocationProfiler:
+    """Per worker process, as are the traces of tracemalloc"""
+    return AllocationProfiler(ProfilingConfig())
+
+
+@lru_cache(maxsize=None)
+def get_internal_api_config() -> InternalApiConfig:
+    return InternalApiConfig()
+
+
+def verify_internal_service(
+    credentials: HTTPAuthorizationCredentials = Security(HTTPBearer()),
+    config: InternalApiConfig = Depends(get_internal_api_config),
+) -> None:
+    if not config.api_token or not secrets.compare_digest(
+        credentials.credentials.encode(), config.api_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid internal service token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+def verify_admin(
+    credentials: HTTPAuthorizationCredentials = Security(HTTPBearer()),
+    admin_config: AdminConfig = Depends(get_admin_config),
+) -> None:
+    if not admin_config.api_token or not secrets.compare_digest(
+        credentials.credentials.encode(), admin_config.api_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@lru_cache(maxsize=None)
+def get_warm_up() -> WarmUp:
+    """Initializes what the first requests of a worker would otherwise pay for"""
+    return WarmUp(
+        [
+            # Loads the passlib bcrypt backend and its self-tests
+            ("bcrypt", lambda: pwd_context.hash("warm-up")),
+            ("database", _warm_up_database),
+            *(
+                (f"database_shard_{index}", pool.prefill)
+                for index, pool in enumerate(get_shard_pools())
+            ),
+        ],
+        # Registration keeps working while the mail server is down (queue
+        # fallback): it must not keep the worker out of the load balancer
+        best_effort=[("smtp", lambda: get_email_sender().warm_up())],
+    )
+
+
+def _warm_up_database() -> None:
+    if DatabaseConfig().backend == "sqlite":
+        # Creates the schema and maps the file
+        get_sqlite_user_repository().connection()
+    else:
+        get_connection_pool().prefill()
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Identical concurrent checks share one bcrypt run. The key is a digest, so
+    that plain passwords are not kept as dictionary keys."""
+    key = hashlib.sha256(f"{password_hash}\0{password}".encode()).digest()
+    return _password_checks.do(key, lambda: pwd_context.verify(password, password_hash))
 
 
 def verify_credentials(
     credentials: HTTPBasicCredentials = Security(HTTPBasic()),
-    user_repository: PostgresUserRepository = Depends(get_user_repository),
+    user_repository: UserRepositoryPort = Depends(get_user_repository),
 ) -> User:
     user = user_repository.find_by_email(Email(credentials.username))
-    if not user or not pwd_context.verify(credentials.password, user.password_hash):
+    if not user or not verify_password(credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
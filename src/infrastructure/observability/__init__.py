@@ -0,0 +1,34 @@
+import logging
+
+from src.infrastructure.config import LoggingConfig
+from .access_log_middleware import AccessLogMiddleware
+from .allocation_profiler import AllocationProfiler
+from .allocation_sampling_middleware import AllocationSamplingMiddleware
+from .batching_queue_handler import BatchingQueueHandler
+from .json_formatter import JsonFormatter
+
+
+def configure_logging(config: LoggingConfig = LoggingConfig()) -> BatchingQueueHandler:
+    """Routes every log record to a background JSON writer. Called once per worker
+    process: the writer thread would not survive a fork."""
+    handler = BatchingQueueHandler(
+        queue_size=config.queue_size,
+        batch_size=config.batch_size,
+        flush_interval_seconds=config.flush_interval_seconds,
+    )
+    handler.setFormatter(JsonFormatter())
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(config.level)
+    handler.start()
+    return handler
+
+
+__all__ = [
+    "AccessLogMiddleware",
+    "AllocationProfiler",
+    "AllocationSamplingMiddleware",
+    "BatchingQueueHandler",
+    "JsonFormatter",
+    "configure_logging",
+]
@@ -0,0 +1,63 @@
+import logging
+import random
+import time
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.config import LoggingConfig
+
+logger = logging.getLogger("access")
+
+
+class AccessLogMiddleware:
+    """Logs one structured record per request. Successful requests of the
+    high-volume routes are sampled; errors are always logged."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        config: LoggingConfig = LoggingConfig(),
+        sample: Callable[[], float] = random.random,
+    ):
+        self.app = app
+        self.config = config
+        self.sample = sample
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.config.access_log:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._log(scope, status_code, time.perf_counter() - started)
+
+    def _log(self, scope: Scope, status_code: int, duration: float) -> None:
+        # Route template set by the router, so that ids do not split the routes
+        route = getattr(scope.get("route"), "path", scope["path"])
+        key = f"{scope['method']} {route}"
+        rate = self.config.access_log_sample_rates.get(key, 1.0)
+        if status_code < 500 and rate < 1.0 and self.sample() >= rate:
+            return
+        logger.info(
+            "request",
+            extra={
+                "method": scope["method"],
+                "route": route,
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 2),
+                "sample_rate": rate,
+            },
+        )
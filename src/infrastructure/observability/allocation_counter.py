@@ -0,0 +1,43 @@
+import functools
+import importlib
+from collections import Counter
+from contextvars import ContextVar, Token
+from typing import Optional
+
+_counts: ContextVar[Optional[Counter]] = ContextVar("allocation_counts", default=None)
+
+
+def start_counting() -> Token:
+    """Counts the tracked instances created by the current request from now on"""
+    return _counts.set(Counter())
+
+
+def stop_counting(token: Token) -> Counter:
+    counts = _counts.get()
+    _counts.reset(token)
+    return counts or Counter()
+
+
+def track_instances(cls: type) -> None:
+    """Counts the instances of cls created while a request is counting. Outside
+    sampled requests, a construction only costs one context variable lookup."""
+    if getattr(cls.__init__, "__allocation_tracked__", False):
+        return
+    original = cls.__init__
+    name = cls.__name__
+
+    @functools.wraps(original)
+    def __init__(self, *args, **kwargs):
+        counts = _counts.get()
+        if counts is not None:
+            counts[name] += 1
+        original(self, *args, **kwargs)
+
+    __init__.__allocation_tracked__ = True
+    cls.__init__ = __init__
+
+
+def track_types(dotted_paths: tuple[str, ...]) -> None:
+    for path in dotted_paths:
+        module, _, name = path.rpartition(".")
+        track_instances(getattr(importlib.import_module(module), name))
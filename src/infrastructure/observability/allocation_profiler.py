@@ -0,0 +1,191 @@
+import itertools
+import os
+import threading
+import time
+import tracemalloc
+from collections import Counter, OrderedDict, defaultdict
+from typing import Iterable, Optional
+
+from src.infrastructure.config import ProfilingConfig
+
+# First match wins, from the innermost frame outwards
+MODULE_GROUPS = (
+    ("domain", ("/src/domain/",)),
+    ("application", ("/src/application/",)),
+    ("repository", ("/adapter/outbound/repository/", "/psycopg2/", "/sqlite3/")),
+    ("email", ("/adapter/outbound/email/", "/smtplib.py", "/email/")),
+    (
+        "fastapi",
+        ("/fastapi/", "/starlette/", "/pydantic/", "/uvicorn/", "/anyio/"),
+    ),
+)
+
+_IGNORED_TRACES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+def module_group(traceback: tracemalloc.Traceback) -> tuple[str, str]:
+    """Group and site (file:line) of an allocation: the innermost frame in a
+    known module, or the innermost frame when none is"""
+    frames = list(traceback)[::-1]  # innermost first
+    for frame in frames:
+        filename = frame.filename.replace("\\", "/")
+        for group, patterns in MODULE_GROUPS:
+            if any(pattern in filename for pattern in patterns):
+                return group, _site(frame)
+    return "other", _site(frames[0]) if frames else "unknown"
+
+
+def _site(frame: tracemalloc.Frame) -> str:
+    filename = frame.filename
+    for marker in ("site-packages/", os.getcwd() + os.sep):
+        if marker in filename:
+            filename = filename.split(marker, 1)[1]
+            break
+    return f"{filename}:{frame.lineno}"
+
+
+def _by_group(
+    entries: Iterable[tuple[tracemalloc.Traceback, int, int]], limit: int
+) -> list[dict]:
+    sizes: Counter = Counter()
+    counts: Counter = Counter()
+    sites: dict[str, Counter] = defaultdict(Counter)
+    site_counts: Counter = Counter()
+    for traceback, size, count in entries:
+        group, site = module_group(traceback)
+        sizes[group] += size
+        counts[group] += count
+        sites[group][site] += size
+        site_counts[site] += count
+    return [
+        {
+            "group": group,
+            "size_bytes": sizes[group],
+            "count": counts[group],
+            "top_sites": [
+                {"site": site, "size_bytes": size, "count": site_counts[site]}
+                for site, size in sorted(
+                    sites[group].items(), key=lambda item: -abs(item[1])
+                )[:limit]
+            ],
+        }
+        for group in sorted(sizes, key=lambda group: -abs(sizes[group]))
+    ]
+
+
+class AllocationProfiler:
+    """tracemalloc on demand: traces are only collected between start() and
+    stop(), as tracing slows allocations down and holds memory of its own.
+    Also aggregates the per-request allocation counts of sampled requests."""
+
+    def __init__(self, config: ProfilingConfig = ProfilingConfig()):
+        self.config = config
+        self._snapshots: OrderedDict[int, tuple[float, tracemalloc.Snapshot]] = (
+            OrderedDict()
+        )
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._sampled_requests: Counter = Counter()
+        self._request_allocations: dict[str, Counter] = defaultdict(Counter)
+
+    def start(self, frames: Optional[int] = None) -> dict:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames or self.config.tracemalloc_frames)
+        return self.status()
+
+    def stop(self) -> dict:
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+        return self.status()
+
+    def status(self) -> dict:
+        tracing = tracemalloc.is_tracing()
+        traced, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        with self._lock:
+            snapshots = list(self._snapshots)
+        return {
+            "pid": os.getpid(),
+            "tracing": tracing,
+            "frames": tracemalloc.get_traceback_limit() if tracing else 0,
+            "traced_bytes": traced,
+            "peak_bytes": peak,
+            "snapshots": snapshots,
+        }
+
+    def take_snapshot(self) -> dict:
+        if not tracemalloc.is_tracing():
+            raise ValueError("tracemalloc is not tracing: start it first.")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+        taken_at = time.time()
+        with self._lock:
+            snapshot_id = next(self._ids)
+            self._snapshots[snapshot_id] = (taken_at, snapshot)
+            while len(self._snapshots) > self.config.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return {
+            "id": snapshot_id,
+            "taken_at": taken_at,
+            "traced_bytes": sum(trace.size for trace in snapshot.traces),
+        }
+
+    def top(self, snapshot_id: int, limit: int = 10) -> dict:
+        """Memory held at snapshot time, by module group and allocation site"""
+        _, snapshot = self._snapshot(snapshot_id)
+        stats = snapshot.statistics("traceback")
+        return {
+            "snapshot": snapshot_id,
+            "groups": _by_group(
+                ((stat.traceback, stat.size, stat.count) for stat in stats), limit
+            ),
+        }
+
+    def diff(self, base_id: int, snapshot_id: int, limit: int = 10) -> dict:
+        """Growth between two snapshots, by module group and allocation site"""
+        base_taken_at, base = self._snapshot(base_id)
+        taken_at, snapshot = self._snapshot(snapshot_id)
+        stats = snapshot.compare_to(base, "traceback")
+        return {
+            "base": base_id,
+            "snapshot": snapshot_id,
+            "seconds_between": round(taken_at - base_taken_at, 3),
+            "groups": _by_group(
+                (
+                    (stat.traceback, stat.size_diff, stat.count_diff)
+                    for stat in stats
+                    if stat.size_diff or stat.count_diff
+                ),
+                limit,
+            ),
+        }
+
+    def _snapshot(self, snapshot_id: int) -> tuple[float, tracemalloc.Snapshot]:
+        with self._lock:
+            if snapshot_id not in self._snapshots:
+                raise KeyError(f"No snapshot with id: {snapshot_id}")
+            return self._snapshots[snapshot_id]
+
+    def record_request(self, route: str, counts: Counter) -> None:
+        with self._lock:
+            self._sampled_requests[route] += 1
+            self._request_allocations[route].update(counts)
+
+    def request_allocations(self) -> dict:
+        """Average instances of the tracked types created per sampled request"""
+        with self._lock:
+            return {
+                route: {
+                    "sampled_requests": requests,
+                    "per_request": {
+                        name: round(total / requests, 2)
+                        for name, total in sorted(
+                            self._request_allocations[route].items()
+                        )
+                    },
+                }
+                for route, requests in sorted(self._sampled_requests.items())
+            }
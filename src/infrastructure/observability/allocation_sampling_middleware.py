@@ -0,0 +1,53 @@
+import logging
+import random
+from typing import Callable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.config import ProfilingConfig
+from .allocation_counter import start_counting, stop_counting, track_types
+from .allocation_profiler import AllocationProfiler
+
+logger = logging.getLogger("allocations")
+
+
+class AllocationSamplingMiddleware:
+    """Counts the User, ActivationCode, DictRow... instances created by a sample of
+    the requests, per route. A regression (rows fetched twice, users copied per
+    lookup) shows up as a higher count per request."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        profiler: AllocationProfiler,
+        config: ProfilingConfig = ProfilingConfig(),
+        sample: Callable[[], float] = random.random,
+    ):
+        self.app = app
+        self.profiler = profiler
+        self.config = config
+        self.sample = sample
+        if config.allocation_sample_rate > 0:
+            track_types(config.tracked_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or self.config.allocation_sample_rate <= 0
+            or self.sample() >= self.config.allocation_sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        token = start_counting()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            counts = stop_counting(token)
+            route = getattr(scope.get("route"), "path", scope["path"])
+            key = f"{scope['method']} {route}"
+            self.profiler.record_request(key, counts)
+            logger.info(
+                "request_allocations",
+                extra={"route": key, "allocations": dict(counts)},
+            )
@@ -0,0 +1,100 @@
+import logging
+import queue
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+_STOP = object()
+
+
+class BatchingQueueHandler(logging.Handler):
+    """Hands records over to a background writer without ever blocking the caller.
+    The writer formats them and writes them in batches, one write per batch.
+    Records arriving while the queue is full are dropped and counted."""
+
+    def __init__(
+        self,
+        stream: TextIO = sys.stdout,
+        queue_size: int = 10_000,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 0.5,
+    ):
+        super().__init__()
+        self.stream = stream
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._writer = threading.Thread(
+            target=self._write, name="log-writer", daemon=True
+        )
+        self._writer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            # Unsynchronized on purpose: an approximate count never blocks
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Stops the writer once every queued record is written"""
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join()
+            self._writer = None
+        super().close()
+
+    def _write(self) -> None:
+        while True:
+            batch, stopping = self._next_batch()
+            lines = [self._format(record) for record in batch]
+            if self.dropped != self._reported_dropped:
+                lines.append(self._format(self._dropped_record()))
+            if lines:
+                self.stream.write("\n".join(lines) + "\n")
+                self.stream.flush()
+            if stopping:
+                return
+
+    def _next_batch(self) -> tuple[list[logging.LogRecord], bool]:
+        """Waits for a record, then takes what else arrives within the flush interval"""
+        batch = []
+        flush_at = None
+        while len(batch) < self.batch_size:
+            timeout = (
+                None if flush_at is None else max(0.0, flush_at - time.monotonic())
+            )
+            try:
+                record = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if record is _STOP:
+                return batch, True
+            batch.append(record)
+            if flush_at is None:
+                flush_at = time.monotonic() + self.flush_interval_seconds
+        return batch, False
+
+    def _format(self, record: logging.LogRecord) -> str:
+        try:
+            return self.format(record)
+        except Exception:
+            return f'{{"level": "ERROR", "message": "Unformattable log record from {record.name}"}}'
+
+    def _dropped_record(self) -> logging.LogRecord:
+        dropped, self._reported_dropped = self.dropped, self.dropped
+        return logging.makeLogRecord(
+            {
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": "log_records_dropped",
+                "dropped_total": dropped,
+            }
+        )
@@ -0,0 +1,5 @@
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .single_flight import SingleFlight
+from .token_bucket import TokenBucket
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "SingleFlight", "TokenBucket"]
@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, TypeVar
+
+from src.infrastructure.config import CircuitBreakerConfig
+
+T = TypeVar("T")
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """Fails fast while the guarded dependency keeps failing or answering slowly.
+    Once open for open_seconds, a few trial calls decide whether it closes again."""
+
+    def __init__(
+        self,
+        config: CircuitBreakerConfig = CircuitBreakerConfig(),
+        clock: Callable[[], float] = time.monotonic,
+        ignored: tuple[type[Exception], ...] = (),
+    ):
+        self.config = config
+        self._clock = clock
+        # Errors telling nothing about the dependency health (caller budget, ...)
+        self.ignored = ignored
+        # (failed, slow) outcomes of the most recent calls
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=config.window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def call(self, function: Callable[[], T]) -> T:
+        if not self._allow():
+            raise CircuitOpenError("circuit open")
+        started = self._clock()
+        try:
+            result = function()
+        except self.ignored:
+            self._release_trial()
+            raise
+        except Exception:
+            self._record(failed=True, duration=self._clock() - started)
+            raise
+        self._record(failed=False, duration=self._clock() - started)
+        return result
+
+    def _current_state(self) -> str:
+        if (
+            self._state == OPEN
+            and self._clock() - self._opened_at >= self.config.open_seconds
+        ):
+            self._state, self._trial_calls = HALF_OPEN, 0
+        return self._state
+
+    def _allow(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if (
+                state == HALF_OPEN
+                and self._trial_calls < self.config.half_open_max_calls
+            ):
+                self._trial_calls += 1
+                return True
+            return False
+
+    def _release_trial(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN and self._trial_calls:
+                self._trial_calls -= 1
+
+    def _record(self, failed: bool, duration: float) -> None:
+        slow = duration >= self.config.slow_call_seconds
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if failed or slow:
+                    self._open()
+                else:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                return
+            if self._state == OPEN:
+                # Late outcome of a call started before the circuit opened
+                return
+            self._outcomes.append((failed, slow))
+            if len(self._outcomes) < self.config.minimum_calls:
+                return
+            calls = len(self._outcomes)
+            failure_rate = sum(failed for failed, _ in self._outcomes) / calls
+            slow_call_rate = sum(slow for _, slow in self._outcomes) / calls
+            if (
+                failure_rate >= self.config.failure_rate_threshold
+                or slow_call_rate >= self.config.slow_call_rate_threshold
+            ):
+                self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
@@ -0,0 +1,66 @@
+import copy
+import threading
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+from src.domain.exception import DeadlineExceededException
+from src.infrastructure.deadline import bounded_timeout
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one execution and its outcome.
+    Nothing is cached: a call arriving after the execution ended runs again.
+
+    Followers wait within their own request deadline. The execution runs under
+    the leader's deadline: when it runs out, the followers do not inherit that
+    failure, one of them runs the function again with its own budget."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+            if leader:
+                break
+            if not call.done.wait(bounded_timeout(None)):
+                raise DeadlineExceededException("Request deadline exceeded.")
+            if isinstance(call.error, DeadlineExceededException):
+                continue
+            if call.error is not None:
+                _raise_own_copy(call.error)
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+def _raise_own_copy(error: BaseException) -> None:
+    """Raises a copy of the shared error, chained from it: raising the same
+    instance in several threads would mix their tracebacks"""
+    try:
+        own = copy.copy(error)
+    except Exception:
+        raise error
+    raise own from error
@@ -0,0 +1,45 @@
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Allows rate operations per second on average, and bursts of up to burst
+    operations. Not thread-safe: callers hold their own lock."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0 or burst < 1:
+            raise ValueError("A token bucket needs a positive rate and a burst of 1+")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def wait_seconds(self) -> float:
+        """Time until a token is available, 0 when one already is"""
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+    @property
+    def full(self) -> bool:
+        self._refill()
+        return self._tokens >= self.burst
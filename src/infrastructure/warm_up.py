@@ -0,0 +1,81 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WarmUp:
+    """Runs the lazy initializations of a worker (crypto backends, database and SMTP
+    sessions) before it reports ready. Failed steps are retried until they succeed.
+
+    Best-effort steps run once the worker is ready, and only once: they warm up
+    a dependency the worker can serve without (the SMTP server, whose emails may
+    be queued while it is down)."""
+
+    def __init__(
+        self,
+        steps: list[tuple[str, Callable[[], None]]],
+        retry_interval_seconds: float = 1.0,
+        best_effort: list[tuple[str, Callable[[], None]]] = (),
+    ):
+        self.steps = steps
+        self.best_effort = list(best_effort)
+        self.retry_interval_seconds = retry_interval_seconds
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._pending = [name for name, _ in steps]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    @property
+    def pending(self) -> list[str]:
+        return list(self._pending)
+
+    def run(self) -> None:
+        for name, step in self.steps:
+            while not self._stopped.is_set():
+                started = time.perf_counter()
+                try:
+                    step()
+                except Exception:
+                    logger.warning(
+                        "Warm-up step %s failed, retrying", name, exc_info=True
+                    )
+                    self._stopped.wait(self.retry_interval_seconds)
+                    continue
+                logger.info(
+                    "Warm-up step %s done in %.3fs", name, time.perf_counter() - started
+                )
+                self._pending.remove(name)
+                break
+        if self._pending:
+            return
+        self._ready.set()
+        for name, step in self.best_effort:
+            if self._stopped.is_set():
+                return
+            try:
+                step()
+            except Exception:
+                logger.warning(
+                    "Best-effort warm-up step %s failed", name, exc_info=True
+                )
+            else:
+                logger.info("Best-effort warm-up step %s done", name)
+
+    def start(self) -> threading.Thread:
+        """Warms up in the background, so that liveness probes answer meanwhile"""
+        self._thread = threading.Thread(target=self.run, name="warm-up", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stops retrying and waits for the step in progress to finish"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
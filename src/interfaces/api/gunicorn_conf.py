@@ -0,0 +1,25 @@
+"""Production server settings, sized from the host and the Postgres connection budget.
+
+Usage: gunicorn -c python:src.interfaces.api.gunicorn_conf src.interfaces.api.main:app
+"""
+
+import os
+
+from src.infrastructure.config import ServerConfig
+
+server_config = ServerConfig()
+
+# Read by DatabaseConfig in every worker: workers x pool never exceeds the budget
+os.environ.setdefault("DB_POOL_MAX_SIZE", str(server_config.db_pool_size_per_worker))
+
+bind = f"{server_config.host}:{server_config.port}"
+workers = server_config.worker_count
+worker_class = "uvicorn_worker.UvicornWorker"
+# Imports the application once in the master, workers share it copy-on-write.
+# Connections are opened lazily, so none is inherited across the fork.
+preload_app = True
+keepalive = server_config.keepalive
+backlog = server_config.backlog
+timeout = server_config.timeout
+graceful_timeout = server_config.graceful_timeout
+accesslog = None
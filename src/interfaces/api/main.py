@@ -1,11 +1,84 @@
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI
 
-from src.infrastructure.adapter.inbound import api_router
+from src.infrastructure.adapter.inbound import (
+    api_router,
+    admin_router,
+    funnel_router,
+    health_router,
+    memory_router,
+    msgpack_router,
+    slow_query_router,
+    DeadlineMiddleware,
+    deadline_exceeded_handler,
+)
+from src.domain.exception import DeadlineExceededException
+from src.infrastructure.config import (
+    DeadlineConfig,
+    LoggingConfig,
+    ProfilingConfig,
+    ServerConfig,
+)
+from src.infrastructure.dependencies import (
+    get_allocation_profiler,
+    get_connection_pool,
+    get_email_sender,
+    get_registration_funnel,
+    get_shard_pools,
+    get_user_repository,
+    get_warm_up,
+)
+from src.infrastructure.observability import (
+    AccessLogMiddleware,
+    AllocationSamplingMiddleware,
+    configure_logging,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_handler = configure_logging(LoggingConfig())
+    # Synchronous endpoints run in this pool, one thread per in-flight request
+    to_thread.current_default_thread_limiter().total_tokens = (
+        ServerConfig().threadpool_size
+    )
+    warm_up = get_warm_up()
+    warm_up.start()
+    yield
+    warm_up.stop()
+    # Commits the pending group-commit batch before the pools close
+    get_user_repository().close()
+    # Last flush of the funnel counters, before the pools close
+    get_registration_funnel().close()
+    get_connection_pool().close()
+    for pool in get_shard_pools():
+        pool.close()
+    get_email_sender().close()
+    log_handler.close()
+
 
 app = FastAPI(
     title="Spooky User Sign Up API",
     description="API to register and activate a user.",
     version="1.0.0",
+    lifespan=lifespan,
+)
+
+app.add_middleware(DeadlineMiddleware, config=DeadlineConfig())
+app.add_middleware(AccessLogMiddleware, config=LoggingConfig())
+app.add_middleware(
+    AllocationSamplingMiddleware,
+    profiler=get_allocation_profiler(),
+    config=ProfilingConfig(),
 )
+app.add_exception_handler(DeadlineExceededException, deadline_exceeded_handler)
 
 app.include_router(api_router)
+app.include_router(admin_router)
+app.include_router(health_router)
+app.include_router(memory_router)
+app.include_router(slow_query_router)
+app.include_router(funnel_router)
+app.include_router(msgpack_router)
@@ -0,0 +1,168 @@
+"""Measures the stage costs of the API on this host and models its capacity.
+
+Run it on a host like the production ones, against the configured database and
+SMTP server (probe users are deleted afterwards, probe emails go to example.invalid):
+docker compose run --rm app python -m src.interfaces.cli.capacity_plan --workers 4
+
+The model covers bcrypt, the database and the SMTP send, not the HTTP and
+framework overhead: treat its rates as upper bounds.
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from src.domain.model import ActivationCode, Email, User
+from src.infrastructure.adapter.outbound.email import MailhogEmailSender
+from src.infrastructure.capacity_model import (
+    Deployment,
+    StageCosts,
+    capacity,
+    flows,
+)
+from src.infrastructure.config import (
+    DatabaseConfig,
+    EmailSchedulerConfig,
+    ServerConfig,
+    SmtpConfig,
+)
+from src.infrastructure.config.server_config import available_cpus
+from src.infrastructure.dependencies import (
+    get_connection_pool,
+    get_shard_pools,
+    get_user_repository,
+    pwd_context,
+)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    server_config = ServerConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=server_config.worker_count)
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=server_config.threadpool_size,
+        help="threadpool size per worker",
+    )
+    parser.add_argument(
+        "--db-pool",
+        type=int,
+        default=None,
+        help="database connections per worker (default: as gunicorn_conf sizes it)",
+    )
+    parser.add_argument(
+        "--cpus", type=int, default=None, help="CPUs of the host (default: this one)"
+    )
+    parser.add_argument(
+        "--samples", type=int, default=20, help="measurements per stage (median)"
+    )
+    parser.add_argument(
+        "--smtp-seconds",
+        type=float,
+        default=None,
+        help="SMTP send cost to use instead of sending probe emails",
+    )
+    return parser.parse_args(argv)
+
+
+def measure(operation: Callable[[int], None], samples: int) -> float:
+    """Median duration of operation(i), after one untimed warm-up call"""
+    operation(-1)
+    durations = []
+    for i in range(samples):
+        started = time.perf_counter()
+        operation(i)
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def measure_stages(samples: int, smtp_seconds: Optional[float] = None) -> StageCosts:
+    # bcrypt is the slowest stage by far: a few samples are enough
+    bcrypt_samples = max(1, min(samples, 5))
+    password_hash = pwd_context.hash("capacity-probe")
+    bcrypt_hash = measure(lambda i: pwd_context.hash("capacity-probe"), bcrypt_samples)
+    bcrypt_verify = measure(
+        lambda i: pwd_context.verify("capacity-probe", password_hash), bcrypt_samples
+    )
+
+    repository = get_user_repository()
+    probes = [
+        User(
+            id=uuid.uuid4(),
+            email=Email(f"capacity-probe-{uuid.uuid4().hex[:12]}@example.invalid"),
+            password_hash=password_hash,
+            activation_code=ActivationCode.generate_activation_code(),
+            created_at=datetime.now(timezone.utc),
+        )
+        for _ in range(samples + 1)
+    ]
+    try:
+        db_upsert = measure(lambda i: repository.save(probes[i]), samples)
+        db_lookup = measure(
+            lambda i: repository.find_by_email(probes[i].email), samples
+        )
+    finally:
+        for probe in probes:
+            repository.delete(probe.id)
+        repository.close()
+        get_connection_pool().close()
+        for pool in get_shard_pools():
+            pool.close()
+
+    if smtp_seconds is None:
+        sender = MailhogEmailSender(SmtpConfig())
+        try:
+            smtp_seconds = measure(
+                lambda i: sender.send_activation_email(
+                    Email("capacity-probe@example.invalid"), "0000"
+                ),
+                samples,
+            )
+        finally:
+            sender.close()
+
+    return StageCosts(bcrypt_hash, bcrypt_verify, db_lookup, db_upsert, smtp_seconds)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    server_config = ServerConfig(workers=args.workers, threadpool_size=args.threads)
+    deployment = Deployment(
+        workers=args.workers,
+        threadpool_size=args.threads,
+        db_pool_size=args.db_pool or server_config.db_pool_size_per_worker,
+        cpus=args.cpus or available_cpus(),
+        backend=DatabaseConfig().backend,
+    )
+
+    costs = measure_stages(args.samples, args.smtp_seconds)
+    print(f"Stage costs (median of {args.samples}):")
+    for stage, seconds in vars(costs).items():
+        print(f"  {stage:<14} {seconds * 1000:9.2f} ms")
+    database = (
+        "SQLite, one writer at a time"
+        if deployment.backend == "sqlite"
+        else f"{deployment.db_pool_size} database connections per worker"
+    )
+    print(
+        f"\n{deployment.workers} workers x {deployment.threadpool_size} threads, "
+        f"{database}, {deployment.cpus} CPUs"
+    )
+
+    email_in_request = not EmailSchedulerConfig().enabled
+    for flow in flows(costs, email_in_request):
+        result = capacity(flow, deployment)
+        print(
+            f"\n{flow.name:<16} {result.max_rate:9.1f} req/s, "
+            f"bottleneck: {result.bottleneck}"
+        )
+        for stage, rate in result.limits:
+            print(f"  {stage:<14} {rate:9.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
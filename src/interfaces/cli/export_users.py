@@ -0,0 +1,46 @@
+"""Streams the users table, without secrets, as NDJSON or CSV.
+
+Usage: python -m src.interfaces.cli.export_users --format csv --output users.csv
+"""
+
+import argparse
+import sys
+
+from src.application.service import EXPORT_FORMATS, ExportUsersService
+from src.infrastructure.adapter.outbound.repository import ConnectionPool
+from src.infrastructure.config import AdminConfig, DatabaseConfig, ShardingConfig
+from src.infrastructure.dependencies import build_user_repository
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument(
+        "--fetch-size",
+        type=int,
+        default=AdminConfig().export_fetch_size,
+        help="rows fetched per round trip by the server-side cursor",
+    )
+    parser.add_argument("--output", help="output file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    db_config = DatabaseConfig()
+    shard_configs = ShardingConfig().shard_configs(db_config)
+    pools = [ConnectionPool(config) for config in (db_config, *shard_configs)]
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        service = ExportUsersService(build_user_repository(pools[0], tuple(pools[1:])))
+        for chunk in service.export(args.format, args.fetch_size):
+            output.write(chunk)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        for pool in pools:
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Moves users to the shard their email hashes to, after shards were appended.
+
+Run it offline (application stopped), with DB_SHARDS listing every shard:
+python -m src.interfaces.cli.rebalance_shards --dry-run
+"""
+
+import argparse
+
+from src.infrastructure.adapter.outbound.repository import ConnectionPool
+from src.infrastructure.config import AdminConfig, DatabaseConfig, ShardingConfig
+from src.infrastructure.dependencies import build_user_repository
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--fetch-size",
+        type=int,
+        default=AdminConfig().export_fetch_size,
+        help="users read per page while scanning a shard",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="only count the users to move"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    db_config = DatabaseConfig()
+    shard_configs = ShardingConfig().shard_configs(db_config)
+    if not shard_configs:
+        raise SystemExit("Sharding is disabled: set DB_SHARDS")
+
+    pools = [ConnectionPool(config) for config in (db_config, *shard_configs)]
+    try:
+        repository = build_user_repository(pools[0], tuple(pools[1:]))
+        report = repository.rebalance(args.fetch_size, args.dry_run)
+    finally:
+        for pool in pools:
+            pool.close()
+
+    action = "to move" if args.dry_run else "moved"
+    print(f"{report.scanned} users scanned, {report.moved_count} {action}")
+    for (source, target), count in sorted(report.moved.items()):
+        print(f"  shard {source} -> shard {target}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Email-path throughput, in messages per second, against the in-process SMTP sink.
+
+Usage: python -m tests.benchmark.email_throughput [--messages 500] [--latency 0.002]
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.domain.model import Email
+from src.infrastructure.adapter.outbound.email import (
+    AsyncSmtpEmailSender,
+    MailhogEmailSender,
+)
+from src.infrastructure.config import SmtpConfig
+from tests.support import SmtpSink
+
+
+def bench_sync(config: SmtpConfig, messages: int, threads: int) -> float:
+    sender = MailhogEmailSender(config)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(
+            executor.map(
+                lambda i: sender.send_activation_email(
+                    Email(f"user{i}@spookymotion.com"), "1234"
+                ),
+                range(messages),
+            )
+        )
+    elapsed = time.perf_counter() - started
+    sender.close()
+    return messages / elapsed
+
+
+def bench_async(config: SmtpConfig, messages: int) -> float:
+    async def main() -> float:
+        sender = AsyncSmtpEmailSender(config)
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                sender.send_activation_email(Email(f"user{i}@spookymotion.com"), "1234")
+                for i in range(messages)
+            )
+        )
+        elapsed = time.perf_counter() - started
+        await sender.close()
+        return messages / elapsed
+
+    return asyncio.run(main())
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument(
+        "--latency", type=float, default=0.002, help="sink delay per round trip (s)"
+    )
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--connections", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    with SmtpSink(latency=args.latency) as sink:
+        base = dict(host=sink.host, port=sink.port, max_connections=args.connections)
+        scenarios = {
+            "smtplib, connection per email": lambda: bench_sync(
+                SmtpConfig(**base, max_idle_sessions=0), args.messages, 1
+            ),
+            "smtplib, reused session": lambda: bench_sync(
+                SmtpConfig(**base, max_idle_sessions=1), args.messages, 1
+            ),
+            f"smtplib, {args.threads} threads": lambda: bench_sync(
+                SmtpConfig(**base, max_idle_sessions=args.threads),
+                args.messages,
+                args.threads,
+            ),
+            f"asyncio, pipelined, {args.connections} connections": lambda: bench_async(
+                SmtpConfig(**base), args.messages
+            ),
+        }
+        print(f"{args.messages} messages, {args.latency * 1000:.1f} ms per round trip")
+        for name, run in scenarios.items():
+            sink.clear()
+            rate = run()
+            assert len(sink.messages) == args.messages
+            print(f"{name:<45} {rate:>10.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
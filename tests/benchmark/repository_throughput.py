@@ -0,0 +1,93 @@
+"""User repository throughput, in operations per second, SQLite against Postgres.
+
+Usage: python -m tests.benchmark.repository_throughput [--users 2000] [--threads 8]
+
+Postgres is read from the DB_* variables (docker compose up postgres) and
+skipped when it cannot be reached.
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import psycopg2
+
+from src.domain.model import ActivationCode, Email, User
+from src.domain.port import UserRepositoryPort
+from src.infrastructure.adapter.outbound.repository import (
+    ConnectionPool,
+    PostgresUserRepository,
+    SqliteUserRepository,
+)
+from src.infrastructure.config import DatabaseConfig, SqliteConfig
+
+
+def run(operation, items: list, threads: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(operation, items))
+    return len(items) / (time.perf_counter() - started)
+
+
+def bench(repository: UserRepositoryPort, users: list[User], threads: int) -> dict:
+    return {
+        "save": run(repository.save, users, threads),
+        "find_by_email": run(
+            lambda user: repository.find_by_email(user.email), users, threads
+        ),
+        "find_by_id": run(lambda user: repository.find_by_id(user.id), users, threads),
+        "mark_active": run(
+            lambda user: repository.mark_active(user.id), users, threads
+        ),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    run_id = uuid.uuid4().hex[:8]
+    users = [
+        User(
+            id=uuid.uuid4(),
+            email=Email(f"bench-{run_id}-{i}@spookymotion.com"),
+            password_hash="hashed_password",
+            activation_code=ActivationCode.generate_activation_code(),
+        )
+        for i in range(args.users)
+    ]
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite = SqliteUserRepository(SqliteConfig(path=str(Path(directory) / "u.db")))
+        results["sqlite (WAL)"] = bench(sqlite, users, args.threads)
+        sqlite.close()
+
+    db_config = DatabaseConfig(max_pool_size=args.threads)
+    pool = ConnectionPool(db_config)
+    try:
+        postgres = PostgresUserRepository(db_config, pool)
+        results["postgres"] = bench(postgres, users, args.threads)
+        for user in users:
+            postgres.delete(user.id)
+    except psycopg2.OperationalError as error:
+        print(f"postgres skipped: {str(error).strip()}")
+    finally:
+        pool.close()
+
+    print(f"{args.users} users, {args.threads} threads")
+    operations = list(next(iter(results.values())))
+    print(f"{'':<15}" + "".join(f"{name:>15}" for name in operations))
+    for backend, rates in results.items():
+        print(
+            f"{backend:<15}" + "".join(f"{rates[name]:>13.0f}/s" for name in operations)
+        )
+
+
+if __name__ == "__main__":
+    main()
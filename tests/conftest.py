@@ -0,0 +1,10 @@
+import pytest
+
+from tests.support import SmtpSink
+
+
+@pytest.fixture
+def smtp_sink():
+    """In-process SMTP server recording the messages it receives"""
+    with SmtpSink() as sink:
+        yield sink
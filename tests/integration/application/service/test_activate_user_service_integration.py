@@ -0,0 +1,50 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.application.service import ActivateUserService
+from src.domain.exception import UserAlreadyActiveException, UserNotFoundException
+from src.domain.model import Email, User
+from src.infrastructure.adapter.outbound.repository import PostgresUserRepository
+from src.infrastructure.adapter.outbound.token import HmacActivationTokenSigner
+
+
+class TestActivateUserServiceWithPostgres:
+    """Activation links against Postgres: the token gives a uuid.UUID user id"""
+
+    @pytest.fixture
+    def signer(self):
+        return HmacActivationTokenSigner({"2025-01": b"secret"}, "2025-01")
+
+    @pytest.fixture
+    def service(self, initialized_db, signer):
+        return ActivateUserService(PostgresUserRepository(initialized_db), signer)
+
+    def token_for(self, signer, user_id: uuid.UUID) -> str:
+        return signer.issue(user_id, datetime.now(timezone.utc) + timedelta(minutes=15))
+
+    def test_second_click_reports_user_already_active(self, service, signer):
+        # Given
+        user_id = uuid.uuid4()
+        service.user_repository.save(
+            User(
+                id=user_id,
+                email=Email("second-click@spookymotion.com"),
+                password_hash="hashed_password",
+            )
+        )
+        token = self.token_for(signer, user_id)
+        service.activate_with_token(token)
+
+        # When / Then
+        with pytest.raises(UserAlreadyActiveException):
+            service.activate_with_token(token)
+
+    def test_token_of_deleted_user_reports_user_not_found(self, service, signer):
+        # Given
+        token = self.token_for(signer, uuid.uuid4())
+
+        # When / Then
+        with pytest.raises(UserNotFoundException):
+            service.activate_with_token(token)
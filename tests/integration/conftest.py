@@ -1,6 +1,7 @@
 import os
 import subprocess
 import time
+from pathlib import Path
 
 import psycopg2
 import pytest
@@ -9,6 +10,8 @@ import requests
 from src.infrastructure.adapter.outbound.email import MailhogEmailSender
 from src.infrastructure.config import DatabaseConfig, SmtpConfig
 
+INIT_SQL = Path(__file__).parents[2] / "docker" / "postgres" / "init.sql"
+
 
 def check_environment():
     """Check if Docker is available and working properly"""
@@ -55,17 +58,20 @@ def check_environment():
         print(f"Docker environment is ready (using {use_compose})")
         return use_compose
     except Exception as e:
-        pytest.exit(
+        pytest.skip(
             f"Docker environment not available: {str(e)}\n"
             "Please ensure Docker Desktop or Rancher Desktop is running properly."
         )
 
 
-compose_cmd = check_environment()
+@pytest.fixture(scope="session")
+def compose_cmd():
+    """Checked only by the tests needing containers, so that the others run without Docker"""
+    return check_environment()
 
 
 @pytest.fixture(scope="session")
-def docker_compose():
+def docker_compose(compose_cmd):
     """Manage test containers using docker-compose with cross-platform compatibility"""
     print("\n> Starting test containers...")
 
@@ -182,19 +188,9 @@ def initialized_db(db_config):
                     connect_timeout=5,
                 )
                 with conn.cursor() as cur:
-                    cur.execute("DROP TABLE IF EXISTS users")
-                    cur.execute(
-                        """
-                        CREATE TABLE users (
-                            id VARCHAR(36) PRIMARY KEY,
-                            email VARCHAR(255) UNIQUE NOT NULL,
-                            password_hash VARCHAR(255) NOT NULL,
-                            is_active BOOLEAN DEFAULT FALSE,
-                            activation_code VARCHAR(4),
-                            code_expires_at TIMESTAMPTZ
-                        )
-                    """
-                    )
+                    cur.execute("DROP VIEW IF EXISTS all_users")
+                    cur.execute("DROP TABLE IF EXISTS users, pending_users")
+                    cur.execute(INIT_SQL.read_text())
                 conn.commit()
                 print("> Database initialized successfully")
                 return db_config
@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+
+from src.domain.model import Email
+from src.domain.port import EmailDeliveryException
+from src.infrastructure.adapter.outbound.email import (
+    AsyncSmtpEmailSender,
+    CircuitBreakerEmailSender,
+    EmailRetryQueue,
+    MailhogEmailSender,
+)
+from src.infrastructure.config import CircuitBreakerConfig, SmtpConfig
+
+
+class TestEmailSendersWithSmtpSink:
+    """Email adapters against the in-process SMTP sink, without Docker"""
+
+    @pytest.fixture
+    def smtp_config(self, smtp_sink):
+        return SmtpConfig(
+            host=smtp_sink.host,
+            port=smtp_sink.port,
+            sender_email="noreply@spookymotion.com",
+            timeout=2,
+        )
+
+    def test_send_activation_email(self, smtp_sink, smtp_config):
+        # Given
+        email_sender = MailhogEmailSender(smtp_config)
+
+        # When
+        email_sender.send_activation_email(Email("user@spookymotion.com"), "9192")
+        email_sender.close()
+
+        # Then
+        assert len(smtp_sink.messages) == 1
+        message = smtp_sink.messages[0].message
+        assert message["To"] == "user@spookymotion.com"
+        assert message["From"] == "noreply@spookymotion.com"
+        assert message["Subject"] == "Activate Your Account"
+        assert (
+            "Your activation code is: 9192"
+            in message.get_body(("plain",)).get_content()
+        )
+
+    def test_sync_and_async_senders_produce_the_same_message(
+        self, smtp_sink, smtp_config
+    ):
+        # Given
+        sync_sender = MailhogEmailSender(smtp_config)
+        async_sender = AsyncSmtpEmailSender(smtp_config)
+
+        async def send_async():
+            await async_sender.send_activation_link(
+                Email("user@spookymotion.com"), "token"
+            )
+            await async_sender.close()
+
+        # When
+        sync_sender.send_activation_link(Email("user@spookymotion.com"), "token")
+        sync_sender.close()
+        asyncio.run(send_async())
+
+        # Then
+        sync_message, async_message = smtp_sink.messages
+        assert sync_message.data == async_message.data
+
+    def test_temporary_failure_raises(self, smtp_sink, smtp_config):
+        # Given
+        smtp_sink.fail_next(code=451, text="Mailbox busy")
+        email_sender = MailhogEmailSender(smtp_config)
+
+        # When / Then
+        with pytest.raises(EmailDeliveryException, match="Mailbox busy"):
+            email_sender.send_activation_email(Email("user@spookymotion.com"), "1")
+        assert smtp_sink.messages == []
+
+    def test_slow_server_opens_circuit(self, smtp_sink, smtp_config):
+        # Given
+        smtp_sink.latency = 0.05
+        email_sender = CircuitBreakerEmailSender(
+            MailhogEmailSender(smtp_config),
+            CircuitBreakerConfig(
+                window_size=2, minimum_calls=2, slow_call_seconds=0.1, open_seconds=60
+            ),
+        )
+        for i in range(2):
+            email_sender.send_activation_email(Email(f"u{i}@spookymotion.com"), "1")
+
+        # When
+        started = time.perf_counter()
+        with pytest.raises(EmailDeliveryException, match="temporarily unavailable"):
+            email_sender.send_activation_email(Email("late@spookymotion.com"), "1")
+
+        # Then
+        assert time.perf_counter() - started < 0.05
+        assert len(smtp_sink.messages) == 2
+        email_sender.close()
+
+    def test_queued_email_is_delivered_once_server_recovers(
+        self, smtp_sink, smtp_config
+    ):
+        # Given
+        smtp_sink.fail_next(code=421, text="Service not available")
+        retry_queue = EmailRetryQueue(max_size=10)
+        email_sender = CircuitBreakerEmailSender(
+            MailhogEmailSender(smtp_config),
+            CircuitBreakerConfig(fallback="queue"),
+            retry_queue=retry_queue,
+        )
+
+        # When
+        email_sender.send_activation_email(Email("user@spookymotion.com"), "9192")
+        sent = retry_queue.drain()
+
+        # Then
+        assert sent == 1
+        assert smtp_sink.messages[0].recipients == ["user@spookymotion.com"]
+        email_sender.close()
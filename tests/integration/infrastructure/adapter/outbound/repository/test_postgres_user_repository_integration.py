@@ -1,9 +1,16 @@
 import uuid
 from datetime import timedelta
+from pathlib import Path
 
+import psycopg2
+import pytest
+
+from src.domain.exception import EmailAlreadyExistsException
 from src.domain.model import User, Email, ActivationCode
 from src.infrastructure.adapter.outbound.repository import PostgresUserRepository
 
+INIT_SQL = Path(__file__).parents[6] / "docker" / "postgres" / "init.sql"
+
 
 class TestPostgresUserRepository:
     """Integration tests for PostgresUserRepository"""
@@ -87,3 +94,122 @@ class TestPostgresUserRepository:
 
         # Then
         assert result is None
+
+    def test_find_by_id_with_uuid(self, initialized_db):
+        """Should find a user by a uuid.UUID id, as the services pass it"""
+        # Given
+        user_id = uuid.uuid4()
+        repository = PostgresUserRepository(initialized_db)
+        repository.save(
+            User(
+                id=user_id,
+                email=Email("find-by-id@spookymotion.com"),
+                password_hash="hashed_password",
+            )
+        )
+
+        # When
+        found_user = repository.find_by_id(user_id)
+        missing_user = repository.find_by_id(uuid.uuid4())
+
+        # Then
+        assert found_user is not None
+        assert found_user.id == str(user_id)
+        assert missing_user is None
+
+    def test_save_many_upserts_pending_and_active_users(self, initialized_db):
+        """Should write a batch of pending and active users in one transaction"""
+        # Given
+        repository = PostgresUserRepository(initialized_db)
+        pending = User(
+            id=uuid.uuid4(),
+            email=Email("batch-pending@spookymotion.com"),
+            password_hash="hashed_password",
+            activation_code=ActivationCode.generate_activation_code(),
+        )
+        activated = User(
+            id=uuid.uuid4(),
+            email=Email("batch-active@spookymotion.com"),
+            password_hash="hashed_password",
+            activation_code=ActivationCode.generate_activation_code(),
+        )
+        repository.save(activated)
+        activated.is_active = True
+        activated.activation_code = None
+
+        # When
+        repository.save_many([pending, activated])
+
+        # Then
+        assert repository.find_by_email(pending.email).is_active is False
+        assert repository.find_by_email(activated.email).is_active is True
+        assert repository.find_by_email(activated.email).activation_code.value is None
+
+    def test_email_is_unique_across_pending_and_active_users(self, initialized_db):
+        """Should reject a pending user whose email an active user already has"""
+        # Given
+        repository = PostgresUserRepository(initialized_db)
+        active = User(
+            id=uuid.uuid4(),
+            email=Email("both-tables@spookymotion.com"),
+            password_hash="hashed_password",
+            is_active=True,
+        )
+        repository.save(active)
+
+        # When / Then
+        with pytest.raises(EmailAlreadyExistsException):
+            repository.save(
+                User(
+                    id=uuid.uuid4(),
+                    email=Email("both-tables@spookymotion.com"),
+                    password_hash="other_password",
+                    activation_code=ActivationCode.generate_activation_code(),
+                )
+            )
+        assert repository.find_by_email(active.email).id == str(active.id)
+
+    def test_init_sql_migrates_a_database_from_before_the_split(self, initialized_db):
+        """Should add created_at and move unactivated users to pending_users"""
+        # Given
+        user_id = str(uuid.uuid4())
+        conn = psycopg2.connect(
+            dbname=initialized_db.database,
+            user=initialized_db.user,
+            password=initialized_db.password,
+            host=initialized_db.host,
+            port=initialized_db.port,
+        )
+        try:
+            with conn.cursor() as cur:
+                cur.execute("DROP VIEW IF EXISTS all_users")
+                cur.execute("DROP TABLE IF EXISTS users, pending_users")
+                cur.execute(
+                    """
+                    CREATE TABLE users (
+                        id VARCHAR(36) PRIMARY KEY,
+                        email VARCHAR(255) UNIQUE NOT NULL,
+                        password_hash VARCHAR(255) NOT NULL,
+                        is_active BOOLEAN DEFAULT FALSE,
+                        activation_code VARCHAR(4),
+                        code_expires_at TIMESTAMPTZ
+                    )
+                    """
+                )
+                cur.execute(
+                    "INSERT INTO users (id, email, password_hash) VALUES (%s, %s, %s)",
+                    (user_id, "legacy@spookymotion.com", "hashed_password"),
+                )
+
+                # When
+                cur.execute(INIT_SQL.read_text())
+            conn.commit()
+        finally:
+            conn.close()
+
+        # Then
+        repository = PostgresUserRepository(initialized_db)
+        assert repository.find_by_email(Email("legacy@spookymotion.com")) is not None
+        activated = repository.mark_active(uuid.UUID(user_id))
+        assert activated is not None
+        assert activated.is_active is True
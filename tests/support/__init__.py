@@ -0,0 +1,10 @@
+from .in_memory_funnel_rollup_store import InMemoryFunnelRollupStore
+from .in_memory_user_repository import InMemoryUserRepository
+from .smtp_sink import ReceivedMessage, SmtpSink
+
+__all__ = [
+    "InMemoryFunnelRollupStore",
+    "InMemoryUserRepository",
+    "ReceivedMessage",
+    "SmtpSink",
+]
@@ -0,0 +1,33 @@
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+from src.infrastructure.adapter.outbound.stats import FunnelRollupStore
+
+
+class InMemoryFunnelRollupStore(FunnelRollupStore):
+    """Process-local rollup, for tests. The expiry times of the pending
+    registrations are listed in expirations."""
+
+    def __init__(self):
+        self._hours: dict[datetime, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+        self.expirations: list[datetime] = []
+
+    def add(self, counts: dict[datetime, Counter]) -> None:
+        with self._lock:
+            for hour, metrics in counts.items():
+                self._hours[hour].update(metrics)
+
+    def totals(self, since: datetime) -> Counter:
+        totals: Counter = Counter()
+        with self._lock:
+            for hour, metrics in self._hours.items():
+                if hour >= since:
+                    totals.update(metrics)
+        return totals
+
+    def expired_registrations(
+        self, since: datetime, until: datetime, link_ttl: timedelta
+    ) -> int:
+        return sum(since <= expires_at <= until for expires_at in self.expirations)
@@ -0,0 +1,88 @@
+import copy
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+from src.domain.model import Email, User
+from src.domain.port import UserRepositoryPort
+
+
+class InMemoryUserRepository(UserRepositoryPort):
+    """Process-local repository with the semantics of PostgresUserRepository
+    (upsert by email, single-write activation), for tests"""
+
+    def __init__(self):
+        self._users: dict[str, User] = {}
+        self._ids_by_email: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def save(self, user: User) -> None:
+        with self._lock:
+            existing_id = self._ids_by_email.get(user.email.value)
+            existing = self._users.get(existing_id) if existing_id else None
+            stored = copy.copy(user)
+            if existing is not None:
+                stored.id, stored.created_at = existing.id, existing.created_at
+            stored.created_at = stored.created_at or datetime.now(timezone.utc)
+            self._users[str(stored.id)] = stored
+            self._ids_by_email[stored.email.value] = str(stored.id)
+
+    def mark_active(self, user_id: uuid.UUID) -> Optional[User]:
+        with self._lock:
+            user = self._users.get(str(user_id))
+            if user is None or user.is_active:
+                return None
+            user.is_active, user.activation_code = True, None
+            return copy.copy(user)
+
+    def delete(self, user_id: uuid.UUID) -> None:
+        with self._lock:
+            user = self._users.pop(str(user_id), None)
+            if user is not None:
+                del self._ids_by_email[user.email.value]
+
+    def find_by_id(self, user_id: uuid.UUID) -> Optional[User]:
+        with self._lock:
+            return copy.copy(self._users.get(str(user_id)))
+
+    def find_by_email(self, email: Email) -> Optional[User]:
+        with self._lock:
+            user_id = self._ids_by_email.get(email.value)
+            return copy.copy(self._users.get(user_id)) if user_id else None
+
+    def find_by_ids(self, user_ids: list[uuid.UUID]) -> list[User]:
+        with self._lock:
+            users = (self._users.get(str(user_id)) for user_id in user_ids)
+            return [copy.copy(user) for user in users if user is not None]
+
+    def stream_all(self, fetch_size: int = 1000) -> Iterator[User]:
+        with self._lock:
+            users = [copy.copy(user) for user in self._users.values()]
+        return iter(users)
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        is_active: Optional[bool] = None,
+        pending_expired: bool = False,
+    ) -> list[User]:
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            users = [
+                copy.copy(user)
+                for user in self._users.values()
+                if (after is None or (user.created_at, str(user.id)) > after)
+                and (is_active is None or user.is_active == is_active)
+                and (
+                    not pending_expired
+                    or (
+                        not user.is_active
+                        and user.activation_code is not None
+                        and user.activation_code.expires_at <= now
+                    )
+                )
+            ]
+        users.sort(key=lambda user: (user.created_at, str(user.id)))
+        return users[:limit]
@@ -0,0 +1,202 @@
+import asyncio
+import email
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from email import policy
+from email.message import EmailMessage
+from typing import Optional
+
+
+@dataclass
+class ReceivedMessage:
+    sender: str
+    recipients: list[str]
+    data: bytes
+
+    @property
+    def message(self) -> EmailMessage:
+        return email.message_from_bytes(self.data, policy=policy.default)
+
+
+@dataclass
+class _Transaction:
+    sender: Optional[str] = None
+    recipients: list[str] = field(default_factory=list)
+
+
+class _SmtpSession(asyncio.Protocol):
+    """Server side of one SMTP connection. Every batch of commands read at once
+    (pipelined) is answered at once, after the sink latency (one round trip)."""
+
+    def __init__(self, sink: "SmtpSink"):
+        self.sink = sink
+        self.buffer = b""
+        self.in_data = False
+        self.closing = False
+        self.transaction = _Transaction()
+        self.outgoing: asyncio.Queue = asyncio.Queue()
+        self.writer_task: Optional[asyncio.Task] = None
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.sink.connections += 1
+        self.writer_task = asyncio.get_running_loop().create_task(self._write())
+        self._reply([b"220 sink ESMTP"])
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if self.writer_task is not None:
+            self.writer_task.cancel()
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        replies = []
+        while not self.closing:
+            if self.in_data:
+                end = self.buffer.find(b"\r\n.\r\n")
+                if end < 0:
+                    break
+                body, self.buffer = self.buffer[: end + 2], self.buffer[end + 5 :]
+                self.in_data = False
+                replies.append(self._end_of_data(body))
+            else:
+                line, separator, self.buffer = self.buffer.partition(b"\r\n")
+                if not separator:
+                    self.buffer = line
+                    break
+                replies.append(self._command(line.decode(errors="replace")))
+        if replies:
+            self._reply(replies)
+
+    def _command(self, line: str) -> bytes:
+        verb, _, argument = line.partition(" ")
+        verb = verb.upper()
+        if verb in ("EHLO", "HELO"):
+            extensions = ["PIPELINING"] if self.sink.pipelining else []
+            lines = ["sink", *extensions, "8BITMIME"]
+            return "\r\n".join(
+                f"250{'-' if i < len(lines) - 1 else ' '}{text}"
+                for i, text in enumerate(lines)
+            ).encode()
+        if verb == "MAIL":
+            self.transaction = _Transaction(sender=_address(argument))
+            return b"250 OK"
+        if verb == "RCPT":
+            recipient = _address(argument)
+            if self.transaction.sender is None:
+                return b"503 MAIL first"
+            if recipient in self.sink.rejected_recipients:
+                return b"550 No such user"
+            self.transaction.recipients.append(recipient)
+            return b"250 OK"
+        if verb == "DATA":
+            if not self.transaction.recipients:
+                return b"554 No valid recipients"
+            self.in_data = True
+            return b"354 End data with <CR><LF>.<CR><LF>"
+        if verb == "RSET":
+            self.transaction = _Transaction()
+            return b"250 OK"
+        if verb == "NOOP":
+            return b"250 OK"
+        if verb == "QUIT":
+            self.closing = True
+            return b"221 Bye"
+        return b"500 Unknown command"
+
+    def _end_of_data(self, body: bytes) -> bytes:
+        transaction, self.transaction = self.transaction, _Transaction()
+        if self.sink.failures:
+            code, text = self.sink.failures.popleft()
+            return f"{code} {text}".encode()
+        data = b"\r\n".join(
+            line[1:] if line.startswith(b"..") else line for line in body.split(b"\r\n")
+        )
+        self.sink.messages.append(
+            ReceivedMessage(transaction.sender, transaction.recipients, data)
+        )
+        return b"250 Queued"
+
+    def _reply(self, replies: list[bytes]) -> None:
+        due = asyncio.get_running_loop().time() + self.sink.latency
+        self.outgoing.put_nowait((due, b"".join(r + b"\r\n" for r in replies)))
+
+    async def _write(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due, payload = await self.outgoing.get()
+            await asyncio.sleep(max(0.0, due - loop.time()))
+            if self.transport.is_closing():
+                return
+            self.transport.write(payload)
+            if self.closing and self.outgoing.empty():
+                self.transport.close()
+                return
+
+
+def _address(argument: str) -> str:
+    return argument.partition(":")[2].split(" ")[0].strip("<>")
+
+
+class SmtpSink:
+    """SMTP server running in-process on localhost, in a background event loop.
+    It records the messages it accepts, and can delay replies (latency per round
+    trip) or fail the next messages to test slow or failing mail servers."""
+
+    def __init__(self, pipelining: bool = True, latency: float = 0.0):
+        self.pipelining = pipelining
+        self.latency = latency
+        self.messages: list[ReceivedMessage] = []
+        self.rejected_recipients: set[str] = set()
+        self.failures: deque[tuple[int, str]] = deque()
+        self.connections = 0
+        self.host = "127.0.0.1"
+        self.port = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SmtpSink":
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="smtp-sink", daemon=True
+        )
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(
+            self._loop.create_server(lambda: _SmtpSession(self), self.host, 0),
+            self._loop,
+        ).result()
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    def stop(self) -> None:
+        async def shutdown():
+            self._server.close()
+            tasks = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def fail_next(
+        self, count: int = 1, code: int = 451, text: str = "Temporary failure"
+    ) -> None:
+        """Rejects the next messages at the end of DATA"""
+        self.failures.extend([(code, text)] * count)
+
+    def clear(self) -> None:
+        self.messages.clear()
+
+    def __enter__(self) -> "SmtpSink":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
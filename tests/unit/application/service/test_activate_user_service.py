@@ -1,4 +1,5 @@
-from datetime import timedelta
+import logging
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
 import pytest
@@ -12,7 +13,11 @@ from src.domain.exception import (
     UserNotFoundException,
 )
 from src.domain.model import User, Email, ActivationCode
-from src.domain.port import UserRepositoryPort
+from src.domain.port import (
+    ActivationTokenPort,
+    RegistrationStatsPort,
+    UserRepositoryPort,
+)
 
 
 class TestActivateUserService:
@@ -148,3 +153,117 @@ class TestActivateUserService:
         assert "Database error" in str(exception.value)
         mock_user_repository.find_by_id.assert_called_once_with(test_user.id)
         mock_user_repository.save.assert_called_once_with(test_user)
+
+    def test_activate_with_token_success(self, mock_user_repository, test_user):
+        """Should activate the token's user with a single repository write"""
+        # Given
+        activation_tokens = MagicMock(spec=ActivationTokenPort)
+        activation_tokens.verify.return_value = test_user.id
+        test_user.is_active = True
+        mock_user_repository.mark_active.return_value = test_user
+        service = ActivateUserService(mock_user_repository, activation_tokens)
+
+        # When
+        result = service.activate_with_token("token")
+
+        # Then
+        assert result is test_user
+        activation_tokens.verify.assert_called_once_with("token")
+        mock_user_repository.mark_active.assert_called_once_with(test_user.id)
+        mock_user_repository.find_by_id.assert_not_called()
+        mock_user_repository.save.assert_not_called()
+
+    def test_activate_with_token_of_active_user(self, mock_user_repository, test_user):
+        """Should raise UserAlreadyActiveException when no pending user matched"""
+        # Given
+        activation_tokens = MagicMock(spec=ActivationTokenPort)
+        activation_tokens.verify.return_value = test_user.id
+        mock_user_repository.mark_active.return_value = None
+        mock_user_repository.find_by_id.return_value = test_user
+        service = ActivateUserService(mock_user_repository, activation_tokens)
+
+        # When/Then
+        with pytest.raises(UserAlreadyActiveException):
+            service.activate_with_token("token")
+
+    def test_activate_with_token_of_unknown_user(self, mock_user_repository):
+        """Should raise UserNotFoundException when the user no longer exists"""
+        # Given
+        user_id = uuid.uuid4()
+        activation_tokens = MagicMock(spec=ActivationTokenPort)
+        activation_tokens.verify.return_value = user_id
+        mock_user_repository.mark_active.return_value = None
+        mock_user_repository.find_by_id.return_value = None
+        service = ActivateUserService(mock_user_repository, activation_tokens)
+
+        # When/Then
+        with pytest.raises(UserNotFoundException):
+            service.activate_with_token("token")
+
+    def test_activate_with_token_when_disabled(
+        self, activate_user_service, mock_user_repository
+    ):
+        """Should reject tokens when no token signer is configured"""
+        with pytest.raises(InvalidActivationCodeException):
+            activate_user_service.activate_with_token("token")
+        mock_user_repository.mark_active.assert_not_called()
+
+    def test_activation_outcomes_are_logged(
+        self, activate_user_service, mock_user_repository, test_user, caplog
+    ):
+        # Given
+        mock_user_repository.find_by_id.return_value = test_user
+
+        # When
+        with caplog.at_level(logging.INFO):
+            with pytest.raises(InvalidActivationCodeException):
+                activate_user_service.activate_user(test_user.id, "0000")
+            activate_user_service.activate_user(test_user.id, "1234")
+
+        # Then
+        failed, activated = caplog.records
+        assert failed.getMessage() == "user_activation_failed"
+        assert failed.reason == "InvalidActivationCodeException"
+        assert activated.getMessage() == "user_activated"
+        assert activated.user_id == str(test_user.id)
+
+    def test_activation_latency_is_counted(self, mock_user_repository, test_user):
+        """Should count the activation with the time since registration"""
+        # Given
+        stats = MagicMock(spec=RegistrationStatsPort)
+        test_user.created_at = datetime.now(timezone.utc) - timedelta(seconds=30)
+        mock_user_repository.find_by_id.return_value = test_user
+        service = ActivateUserService(mock_user_repository, stats=stats)
+
+        # When
+        service.activate_user(test_user.id, "1234")
+
+        # Then
+        (latency,) = stats.record_activated.call_args.args
+        assert timedelta(seconds=30) <= latency < timedelta(seconds=35)
+        stats.record_expired.assert_not_called()
+
+    def test_expired_activations_are_counted(self, mock_user_repository, test_user):
+        """Should count activations attempted with an expired code or link"""
+        # Given
+        stats = MagicMock(spec=RegistrationStatsPort)
+        activation_tokens = MagicMock(spec=ActivationTokenPort)
+        activation_tokens.verify.side_effect = ExpiredActivationCodeException(
+            "Activation token has expired."
+        )
+        test_user.activation_code = ActivationCode(
+            value="1234",
+            expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+        )
+        mock_user_repository.find_by_id.return_value = test_user
+        service = ActivateUserService(mock_user_repository, activation_tokens, stats)
+
+        # When
+        with pytest.raises(ExpiredActivationCodeException):
+            service.activate_user(test_user.id, "1234")
+        with pytest.raises(ExpiredActivationCodeException):
+            service.activate_with_token("token")
+
+        # Then
+        assert stats.record_expired.call_count == 2
+        stats.record_activated.assert_not_called()
@@ -0,0 +1,94 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.service import ExportUsersService
+from src.domain.model import User, Email, ActivationCode
+from src.domain.port import UserRepositoryPort
+
+
+class TestExportUsersService:
+    """Unit tests for ExportUsersService"""
+
+    @pytest.fixture
+    def users(self):
+        expires_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        return [
+            User(
+                id=uuid.UUID("6548f7ca-6e09-45dc-b417-56632df142f1"),
+                email=Email("pending@spookymotion.com"),
+                password_hash="secret_hash",
+                is_active=False,
+                activation_code=ActivationCode("1234", expires_at),
+            ),
+            User(
+                id=uuid.UUID("0e4c9d8a-3a43-4f0e-9a0f-7f0f5c1a9e11"),
+                email=Email("active@spookymotion.com"),
+                password_hash="secret_hash",
+                is_active=True,
+            ),
+        ]
+
+    @pytest.fixture
+    def mock_user_repository(self, users):
+        """Create a mock user repository streaming the test users"""
+        repository = MagicMock(spec=UserRepositoryPort)
+        repository.stream_all.side_effect = lambda fetch_size: iter(users)
+        return repository
+
+    def test_export_ndjson_without_secrets(self, mock_user_repository):
+        # Given
+        service = ExportUsersService(mock_user_repository)
+
+        # When
+        output = "".join(service.export("ndjson", fetch_size=10))
+
+        # Then
+        rows = [json.loads(line) for line in output.splitlines()]
+        assert rows == [
+            {
+                "id": "6548f7ca-6e09-45dc-b417-56632df142f1",
+                "email": "pending@spookymotion.com",
+                "is_active": False,
+                "code_expires_at": "2025-01-01 00:00:00+00:00",
+            },
+            {
+                "id": "0e4c9d8a-3a43-4f0e-9a0f-7f0f5c1a9e11",
+                "email": "active@spookymotion.com",
+                "is_active": True,
+                "code_expires_at": None,
+            },
+        ]
+        assert "secret_hash" not in output and "1234" not in output
+        mock_user_repository.stream_all.assert_called_once_with(10)
+
+    def test_export_csv(self, mock_user_repository):
+        # Given
+        service = ExportUsersService(mock_user_repository)
+
+        # When
+        output = "".join(service.export("csv", fetch_size=10))
+
+        # Then
+        assert output.splitlines() == [
+            "id,email,is_active,code_expires_at",
+            "6548f7ca-6e09-45dc-b417-56632df142f1,pending@spookymotion.com,False,2025-01-01 00:00:00+00:00",
+            "0e4c9d8a-3a43-4f0e-9a0f-7f0f5c1a9e11,active@spookymotion.com,True,",
+        ]
+
+    def test_export_flushes_first_row_then_chunks(self, mock_user_repository):
+        # Given
+        service = ExportUsersService(mock_user_repository, chunk_rows=10)
+
+        # When
+        chunks = list(service.export("ndjson", fetch_size=10))
+
+        # Then
+        assert [chunk.count("\n") for chunk in chunks] == [1, 1]
+
+    def test_export_rejects_unknown_format(self, mock_user_repository):
+        with pytest.raises(ValueError):
+            list(ExportUsersService(mock_user_repository).export("xml", 10))
@@ -0,0 +1,76 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.service import ListUsersService
+from src.domain.model import User, Email
+from src.domain.port import UserRepositoryPort
+
+
+class TestListUsersService:
+    """Unit tests for ListUsersService"""
+
+    @pytest.fixture
+    def mock_user_repository(self):
+        """Create a mock user repository"""
+        return MagicMock(spec=UserRepositoryPort)
+
+    @pytest.fixture
+    def list_users_service(self, mock_user_repository):
+        return ListUsersService(mock_user_repository)
+
+    @pytest.fixture
+    def users(self):
+        created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        return [
+            User(
+                id=str(uuid.uuid4()),
+                email=Email(f"user{i}@spookymotion.com"),
+                password_hash="hash",
+                created_at=created_at + timedelta(seconds=i),
+            )
+            for i in range(3)
+        ]
+
+    def test_list_first_page_returns_continuation_cursor(
+        self, list_users_service, mock_user_repository, users
+    ):
+        # Given
+        mock_user_repository.list_page.return_value = users
+
+        # When
+        page = list_users_service.list_users(limit=2, is_active=False)
+
+        # Then
+        assert page.users == users[:2]
+        assert ListUsersService.decode_cursor(page.next_cursor) == (
+            users[1].created_at,
+            users[1].id,
+        )
+        mock_user_repository.list_page.assert_called_once_with(3, None, False, False)
+
+    def test_list_next_page_continues_after_cursor(
+        self, list_users_service, mock_user_repository, users
+    ):
+        # Given
+        cursor = ListUsersService.encode_cursor(users[1])
+        mock_user_repository.list_page.return_value = users[2:]
+
+        # When
+        page = list_users_service.list_users(
+            limit=2, cursor=cursor, pending_expired=True
+        )
+
+        # Then
+        assert page.users == users[2:]
+        assert page.next_cursor is None
+        mock_user_repository.list_page.assert_called_once_with(
+            3, (users[1].created_at, users[1].id), None, True
+        )
+
+    def test_list_rejects_tampered_cursor(self, list_users_service):
+        with pytest.raises(ValueError) as exception:
+            list_users_service.list_users(limit=2, cursor="not-a-cursor")
+        assert "Invalid cursor" in str(exception.value)
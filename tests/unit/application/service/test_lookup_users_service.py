@@ -0,0 +1,42 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.service import LookupUsersService
+from src.domain.model import User, Email
+from src.domain.port import UserRepositoryPort
+
+
+class TestLookupUsersService:
+    """Unit tests for LookupUsersService"""
+
+    @pytest.fixture
+    def mock_user_repository(self):
+        """Create a mock user repository"""
+        return MagicMock(spec=UserRepositoryPort)
+
+    @pytest.fixture
+    def lookup_users_service(self, mock_user_repository):
+        return LookupUsersService(mock_user_repository)
+
+    def test_find_users_in_requested_order(
+        self, lookup_users_service, mock_user_repository
+    ):
+        """Should return the found users in request order, skipping unknown ids"""
+        # Given
+        first_id, second_id, unknown_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        first = User(str(first_id), Email("first@spookymotion.com"), "hash")
+        second = User(str(second_id), Email("second@spookymotion.com"), "hash")
+        mock_user_repository.find_by_ids.return_value = [second, first]
+
+        # When
+        result = lookup_users_service.find_users(
+            [first_id, unknown_id, second_id, first_id]
+        )
+
+        # Then
+        assert result == [first, second]
+        mock_user_repository.find_by_ids.assert_called_once_with(
+            [first_id, unknown_id, second_id]
+        )
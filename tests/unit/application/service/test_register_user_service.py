@@ -1,3 +1,4 @@
+import logging
 import uuid
 from unittest.mock import MagicMock
 
@@ -6,7 +7,12 @@ import pytest
 from src.application.service.register_user_service import RegisterUserService
 from src.domain.exception import EmailAlreadyExistsException
 from src.domain.model import User, Email, ActivationCode
-from src.domain.port import UserRepositoryPort, EmailSenderPort
+from src.domain.port import (
+    ActivationTokenPort,
+    EmailSenderPort,
+    RegistrationStatsPort,
+    UserRepositoryPort,
+)
 
 
 class TestRegisterUserService:
@@ -56,12 +62,15 @@ class TestRegisterUserService:
         assert result.email.value == "test@spookymotion.com"
         assert result.is_active is False
         assert result.activation_code.value is not None
+        assert result.created_at is not None
         mock_user_repository.find_by_email.assert_called_once_with(
             Email("test@spookymotion.com")
         )
         mock_user_repository.save.assert_called_once()
         mock_email_sender.send_activation_email.assert_called_once_with(
-            Email("test@spookymotion.com"), result.activation_code.value
+            Email("test@spookymotion.com"),
+            result.activation_code.value,
+            expires_at=result.activation_code.expires_at,
         )
 
     def test_register_user_with_existing_email(
@@ -95,3 +104,70 @@ class TestRegisterUserService:
         mock_user_repository.find_by_email.assert_not_called()
         mock_user_repository.save.assert_not_called()
         mock_email_sender.send_activation_email.assert_not_called()
+
+    def test_register_user_with_activation_link(
+        self, mock_user_repository, mock_email_sender
+    ):
+        """Should send a signed activation link instead of storing a code"""
+        # Given
+        activation_tokens = MagicMock(spec=ActivationTokenPort)
+        activation_tokens.issue.return_value = "signed-token"
+        mock_user_repository.find_by_email.return_value = None
+        service = RegisterUserService(
+            mock_user_repository, mock_email_sender, activation_tokens
+        )
+
+        # When
+        result = service.register_user("test@spookymotion.com", "password123")
+
+        # Then
+        assert result.activation_code is None
+        mock_user_repository.save.assert_called_once_with(result)
+        activation_tokens.issue.assert_called_once_with(
+            result.id, result.created_at + service.activation_token_ttl
+        )
+        mock_email_sender.send_activation_link.assert_called_once_with(
+            Email("test@spookymotion.com"),
+            "signed-token",
+            expires_at=result.created_at + service.activation_token_ttl,
+        )
+        mock_email_sender.send_activation_email.assert_not_called()
+
+    def test_registration_outcomes_are_logged(
+        self, register_user_service, mock_user_repository, test_user, caplog
+    ):
+        # Given
+        mock_user_repository.find_by_email.side_effect = [test_user, None]
+
+        # When
+        with caplog.at_level(logging.INFO):
+            with pytest.raises(EmailAlreadyExistsException):
+                register_user_service.register_user("test@spookymotion.com", "pwd")
+            user = register_user_service.register_user("new@spookymotion.com", "pwd")
+
+        # Then
+        failed, registered = caplog.records
+        assert failed.getMessage() == "user_registration_failed"
+        assert failed.reason == "EmailAlreadyExistsException"
+        assert registered.getMessage() == "user_registered"
+        assert registered.user_id == str(user.id)
+        assert "new@spookymotion.com" not in registered.__dict__.values()
+
+    def test_registrations_are_counted(
+        self, mock_user_repository, mock_email_sender, test_user
+    ):
+        """Should count successful registrations only"""
+        # Given
+        stats = MagicMock(spec=RegistrationStatsPort)
+        service = RegisterUserService(
+            mock_user_repository, mock_email_sender, stats=stats
+        )
+        mock_user_repository.find_by_email.side_effect = [test_user, None]
+
+        # When
+        with pytest.raises(EmailAlreadyExistsException):
+            service.register_user("test@spookymotion.com", "pwd")
+        service.register_user("new@spookymotion.com", "pwd")
+
+        # Then
+        stats.record_registered.assert_called_once_with()
@@ -0,0 +1,132 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.application.dto.request import LookupUsersRequest
+from src.application.service import (
+    ExportUsersService,
+    ListUsersService,
+    LookupUsersService,
+    UserPage,
+)
+from src.domain.model import User, Email
+from src.infrastructure.adapter.inbound.api import (
+    export_users,
+    list_users,
+    lookup_users,
+    slow_queries,
+)
+from src.infrastructure.adapter.outbound.repository import SlowQueryLog
+from src.infrastructure.config import AdminConfig, SlowQueryConfig
+from src.infrastructure.dependencies import verify_admin
+
+
+class TestAdminController:
+    def test_list_users_success(self):
+        # Given
+        user_id = uuid.uuid4()
+        mock_service = MagicMock(spec=ListUsersService)
+        mock_service.list_users.return_value = UserPage(
+            users=[User(user_id, Email("test@spookymotion.com"), "hashed_password")],
+            next_cursor="next",
+        )
+
+        # When
+        result = list_users(50, "cursor", True, False, mock_service)
+
+        # Then
+        assert [user.id for user in result.items] == [user_id]
+        assert result.next_cursor == "next"
+        mock_service.list_users.assert_called_once_with(50, "cursor", True, False)
+
+    def test_list_users_with_invalid_cursor(self):
+        # Given
+        mock_service = MagicMock(spec=ListUsersService)
+        mock_service.list_users.side_effect = ValueError("Invalid cursor: x")
+
+        # When/Then
+        with pytest.raises(HTTPException) as exception:
+            list_users(50, "x", None, False, mock_service)
+        assert exception.value.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_lookup_users_success(self):
+        # Given
+        user_id = uuid.uuid4()
+        mock_service = MagicMock(spec=LookupUsersService)
+        mock_service.find_users.return_value = [
+            User(user_id, Email("test@spookymotion.com"), "hashed_password", True)
+        ]
+
+        # When
+        result = lookup_users(
+            LookupUsersRequest(ids=[user_id]), mock_service, AdminConfig()
+        )
+
+        # Then
+        assert [user.id for user in result] == [user_id]
+        assert result[0].is_active is True
+        mock_service.find_users.assert_called_once_with([user_id])
+
+    def test_lookup_users_rejects_too_many_ids(self):
+        # Given
+        mock_service = MagicMock(spec=LookupUsersService)
+        request = LookupUsersRequest(ids=[uuid.uuid4() for _ in range(3)])
+
+        # When/Then
+        with pytest.raises(HTTPException) as exception:
+            lookup_users(request, mock_service, AdminConfig(max_batch_lookup=2))
+        assert exception.value.status_code == status.HTTP_400_BAD_REQUEST
+        mock_service.find_users.assert_not_called()
+
+    def test_export_users_streams_service_chunks(self):
+        # Given
+        mock_service = MagicMock(spec=ExportUsersService)
+        mock_service.export.return_value = iter(["id,email\n"])
+
+        # When
+        response = export_users("csv", None, mock_service, AdminConfig())
+
+        # Then
+        assert response.media_type == "text/csv"
+        mock_service.export.assert_called_once_with("csv", 1000)
+
+    def test_verify_admin_rejects_wrong_token(self):
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="bad")
+
+        with pytest.raises(HTTPException) as exception:
+            verify_admin(credentials, AdminConfig(api_token="secret"))
+        assert exception.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_verify_admin_is_disabled_without_token(self):
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="")
+
+        with pytest.raises(HTTPException) as exception:
+            verify_admin(credentials, AdminConfig(api_token=""))
+        assert exception.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_verify_admin_accepts_configured_token(self):
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials="secret"
+        )
+
+        assert verify_admin(credentials, AdminConfig(api_token="secret")) is None
+
+
+class TestSlowQueryController:
+    def test_slow_queries(self):
+        # Given
+        slow_query_log = MagicMock(spec=SlowQueryLog)
+        slow_query_log.config = SlowQueryConfig(threshold_ms=150)
+        slow_query_log.worst.return_value = [{"statement": "find_user_by_email"}]
+
+        # When
+        result = slow_queries(slow_query_log)
+
+        # Then
+        assert result == {
+            "threshold_ms": 150,
+            "queries": [{"statement": "find_user_by_email"}],
+        }
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+from src.domain.exception import DeadlineExceededException
+from src.infrastructure.adapter.inbound.api import (
+    DeadlineMiddleware,
+    deadline_exceeded_handler,
+)
+from src.infrastructure.config import DeadlineConfig
+from src.infrastructure.deadline import time_left
+
+
+def budget_seen_by_endpoint(method, path, headers=()):
+    seen = []
+
+    async def endpoint(scope, receive, send):
+        seen.append(time_left())
+
+    middleware = DeadlineMiddleware(endpoint, DeadlineConfig())
+    scope = {"type": "http", "method": method, "path": path, "headers": headers}
+    asyncio.run(middleware(scope, None, None))
+    return seen[0]
+
+
+class TestDeadlineMiddleware:
+    def test_route_budget_applies(self):
+        # Given
+        path = f"/api/v1/users/{'a' * 36}/activate"
+
+        # When
+        budget = budget_seen_by_endpoint("POST", path)
+
+        # Then
+        assert 2.9 < budget <= 3.0
+
+    def test_default_budget_for_other_routes(self):
+        # Given
+        path = "/ready"
+
+        # When
+        budget = budget_seen_by_endpoint("GET", path)
+
+        # Then
+        assert 9.9 < budget <= 10.0
+
+    def test_client_header_shortens_budget(self):
+        # Given
+        headers = [(b"x-request-timeout", b"0.5")]
+
+        # When
+        budget = budget_seen_by_endpoint("POST", "/api/v1/users/register", headers)
+
+        # Then
+        assert 0.4 < budget <= 0.5
+
+    def test_client_header_cannot_extend_budget(self):
+        # Given
+        headers = [(b"x-request-timeout", b"60")]
+
+        # When
+        budget = budget_seen_by_endpoint("POST", "/api/v1/users/register", headers)
+
+        # Then
+        assert budget <= 5.0
+
+    def test_route_without_budget(self):
+        # Given
+        path = "/api/v1/admin/users/export"
+
+        # When
+        budget = budget_seen_by_endpoint("GET", path)
+
+        # Then
+        assert budget is None
+
+    def test_deadline_is_reset_after_request(self):
+        # Given
+        path = "/api/v1/users/register"
+
+        # When
+        budget_seen_by_endpoint("POST", path)
+
+        # Then
+        assert time_left() is None
+
+    def test_exceeded_deadline_returns_504(self):
+        # Given
+        exception = DeadlineExceededException("Request deadline exceeded.")
+
+        # When
+        response = asyncio.run(deadline_exceeded_handler(None, exception))
+
+        # Then
+        assert response.status_code == 504
+        assert json.loads(response.body) == {"detail": "Request deadline exceeded."}
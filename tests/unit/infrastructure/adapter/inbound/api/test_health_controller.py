@@ -0,0 +1,34 @@
+import json
+from unittest.mock import MagicMock
+
+from src.infrastructure.adapter.inbound.api import live, ready
+
+
+class TestHealthController:
+    def test_live(self):
+        assert live() == {"status": "alive"}
+
+    def test_not_ready_while_warming_up(self):
+        # Given
+        warm_up = MagicMock(ready=False, pending=["database", "smtp"])
+
+        # When
+        response = ready(warm_up)
+
+        # Then
+        assert response.status_code == 503
+        assert json.loads(response.body) == {
+            "status": "warming_up",
+            "pending": ["database", "smtp"],
+        }
+
+    def test_ready_after_warm_up(self):
+        # Given
+        warm_up = MagicMock(ready=True)
+
+        # When
+        response = ready(warm_up)
+
+        # Then
+        assert response.status_code == 200
+        assert json.loads(response.body) == {"status": "ready"}
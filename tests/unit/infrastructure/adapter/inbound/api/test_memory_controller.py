@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.infrastructure.adapter.inbound.api import (
+    snapshot_diff,
+    snapshot_top,
+    start_tracemalloc,
+    take_snapshot,
+)
+from src.infrastructure.observability import AllocationProfiler
+
+
+class TestMemoryController:
+    def test_start_tracemalloc(self):
+        # Given
+        profiler = MagicMock(spec=AllocationProfiler)
+        profiler.start.return_value = {"tracing": True}
+
+        # When
+        result = start_tracemalloc(25, profiler)
+
+        # Then
+        assert result == {"tracing": True}
+        profiler.start.assert_called_once_with(25)
+
+    def test_snapshot_while_not_tracing(self):
+        # Given
+        profiler = MagicMock(spec=AllocationProfiler)
+        profiler.take_snapshot.side_effect = ValueError("tracemalloc is not tracing")
+
+        # When / Then
+        with pytest.raises(HTTPException) as exception:
+            take_snapshot(profiler)
+        assert exception.value.status_code == status.HTTP_409_CONFLICT
+
+    def test_unknown_snapshot(self):
+        # Given
+        profiler = MagicMock(spec=AllocationProfiler)
+        profiler.top.side_effect = KeyError("No snapshot with id: 7")
+        profiler.diff.side_effect = KeyError("No snapshot with id: 7")
+
+        # When / Then
+        with pytest.raises(HTTPException) as top_exception:
+            snapshot_top(7, 10, profiler)
+        with pytest.raises(HTTPException) as diff_exception:
+            snapshot_diff(7, 1, 10, profiler)
+        assert top_exception.value.status_code == status.HTTP_404_NOT_FOUND
+        assert diff_exception.value.detail == "No snapshot with id: 7"
@@ -0,0 +1,233 @@
+import asyncio
+import uuid
+from unittest.mock import MagicMock
+
+import msgpack
+import pytest
+from fastapi import HTTPException, Request, status
+
+from src.application.service import ActivateUserService, RegisterUserService
+from src.domain.exception import (
+    DeadlineExceededException,
+    EmailAlreadyExistsException,
+)
+from src.domain.model import Email, User
+from src.infrastructure.adapter.inbound.api import (
+    activate_user_msgpack,
+    activate_users_msgpack,
+    register_user_msgpack,
+    register_users_msgpack,
+)
+from src.infrastructure.adapter.inbound.api.msgpack_controller import (
+    msgpack_batch,
+    msgpack_body,
+)
+from src.infrastructure.config import InternalApiConfig
+
+USER_ID = uuid.UUID("6548f7ca-6e09-45dc-b417-56632df142f1")
+
+
+def request_with(body: bytes, content_type: str = "application/msgpack") -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-type", content_type.encode())],
+    }
+    return Request(scope, receive)
+
+
+class TestMessagePackController:
+    @pytest.fixture
+    def register_service(self):
+        service = MagicMock(spec=RegisterUserService)
+        service.register_user.side_effect = lambda email, password: User(
+            USER_ID, Email(email), "hashed_password"
+        )
+        return service
+
+    def test_body_is_decoded(self):
+        # Given
+        request = request_with(msgpack.packb({"email": "test@spookymotion.com"}))
+
+        # When
+        body = asyncio.run(msgpack_body(request))
+
+        # Then
+        assert body == {"email": "test@spookymotion.com"}
+
+    def test_other_content_types_are_rejected(self):
+        with pytest.raises(HTTPException) as exception:
+            asyncio.run(msgpack_body(request_with(b"{}", "application/json")))
+        assert exception.value.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    def test_malformed_body_is_rejected(self):
+        with pytest.raises(HTTPException) as exception:
+            asyncio.run(msgpack_body(request_with(b"\xc1")))
+        assert exception.value.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_register_user(self, register_service):
+        # When
+        response = register_user_msgpack(
+            {"email": "test@spookymotion.com", "password": "password123"},
+            register_service,
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.media_type == "application/msgpack"
+        assert msgpack.unpackb(response.body) == {
+            "id": str(USER_ID),
+            "email": "test@spookymotion.com",
+            "is_active": False,
+        }
+        register_service.register_user.assert_called_once_with(
+            "test@spookymotion.com", "password123"
+        )
+
+    def test_register_user_with_missing_field(self, register_service):
+        # When
+        response = register_user_msgpack({"email": "a@b.com"}, register_service)
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert msgpack.unpackb(response.body) == {
+            "detail": "Expected a map with string fields: email, password"
+        }
+        register_service.register_user.assert_not_called()
+
+    def test_register_user_deadline_exceeded_is_not_a_bad_request(
+        self, register_service
+    ):
+        # Given
+        register_service.register_user.side_effect = DeadlineExceededException(
+            "Request deadline exceeded."
+        )
+
+        # When / Then
+        with pytest.raises(DeadlineExceededException):
+            register_user_msgpack(
+                {"email": "a@b.com", "password": "p"}, register_service
+            )
+
+    def test_activate_user(self):
+        # Given
+        service = MagicMock(spec=ActivateUserService)
+        service.activate_user.return_value = User(
+            USER_ID, Email("test@spookymotion.com"), "hashed_password", True
+        )
+
+        # When
+        response = activate_user_msgpack(
+            {"user_id": str(USER_ID), "activation_code": "1234"}, service
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert msgpack.unpackb(response.body)["is_active"] is True
+        service.activate_user.assert_called_once_with(USER_ID, "1234")
+
+    def test_activate_user_with_invalid_id(self):
+        # Given
+        service = MagicMock(spec=ActivateUserService)
+
+        # When
+        response = activate_user_msgpack(
+            {"user_id": "not-a-uuid", "activation_code": "1234"}, service
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        service.activate_user.assert_not_called()
+
+    def test_register_batch_returns_one_result_per_item(self, register_service):
+        # Given
+        def register_user(email, password):
+            if email == "taken@spookymotion.com":
+                raise EmailAlreadyExistsException(f"Email {email} already registered.")
+            return User(USER_ID, Email(email), "hashed_password")
+
+        register_service.register_user.side_effect = register_user
+        items = [
+            {"email": "new@spookymotion.com", "password": "p"},
+            {"email": "taken@spookymotion.com", "password": "p"},
+        ]
+
+        # When
+        response = asyncio.run(
+            register_users_msgpack(items, register_service, InternalApiConfig())
+        )
+
+        # Then
+        assert msgpack.unpackb(response.body) == [
+            {
+                "status": 201,
+                "body": {
+                    "id": str(USER_ID),
+                    "email": "new@spookymotion.com",
+                    "is_active": False,
+                },
+            },
+            {
+                "status": 400,
+                "body": {"detail": "Email taken@spookymotion.com already registered."},
+            },
+        ]
+
+    def test_register_batch_registers_a_repeated_email_once(self, register_service):
+        # Given
+        items = [
+            {"email": "new@spookymotion.com", "password": "p"},
+            {"email": "other@spookymotion.com", "password": "p"},
+            {"email": " New@SpookyMotion.com", "password": "q"},
+        ]
+
+        # When
+        response = asyncio.run(
+            register_users_msgpack(items, register_service, InternalApiConfig())
+        )
+
+        # Then
+        results = msgpack.unpackb(response.body)
+        assert [result["status"] for result in results] == [201, 201, 409]
+        assert results[2]["body"] == {"detail": "Email already in this batch."}
+        assert sorted(
+            call.args[0] for call in register_service.register_user.call_args_list
+        ) == ["new@spookymotion.com", "other@spookymotion.com"]
+
+    def test_batch_items_past_deadline_fail_alone(self):
+        # Given
+        service = MagicMock(spec=ActivateUserService)
+        service.activate_user.side_effect = [
+            User(USER_ID, Email("test@spookymotion.com"), "hashed_password", True),
+            DeadlineExceededException("Request deadline exceeded."),
+        ]
+        items = [
+            {"user_id": str(USER_ID), "activation_code": "1234"},
+            {"user_id": str(USER_ID), "activation_code": "5678"},
+        ]
+
+        # When
+        response = asyncio.run(
+            activate_users_msgpack(
+                items, service, InternalApiConfig(batch_concurrency=1)
+            )
+        )
+
+        # Then
+        results = msgpack.unpackb(response.body)
+        assert [result["status"] for result in results] == [200, 504]
+
+    def test_batch_size_is_bounded(self):
+        # Given
+        config = InternalApiConfig(max_batch_size=2)
+
+        # When / Then
+        with pytest.raises(HTTPException) as too_large:
+            msgpack_batch([{}, {}, {}], config)
+        with pytest.raises(HTTPException) as not_an_array:
+            msgpack_batch({"email": "a@b.com"}, config)
+        assert too_large.value.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+        assert not_an_array.value.status_code == status.HTTP_400_BAD_REQUEST
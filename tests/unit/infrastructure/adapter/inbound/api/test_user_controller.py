@@ -6,8 +6,14 @@ from fastapi import HTTPException, status
 
 from src.application.dto.request import ActivateUserRequest, RegisterUserRequest
 from src.application.service import ActivateUserService
+from src.domain.exception import DeadlineExceededException
 from src.domain.model import User, Email
-from src.infrastructure.adapter.inbound.api import register_user, activate_user
+from src.infrastructure.adapter.inbound.api import (
+    register_user,
+    activate_user,
+    activate_user_with_token,
+)
+from src.infrastructure.adapter.outbound.idempotency import InMemoryIdempotencyStore
 
 
 class TestUserController:
@@ -46,6 +52,20 @@ class TestUserController:
             register_user(request, mock_service)
         assert exception.value.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_register_user_deadline_exceeded_is_not_a_bad_request(self):
+        # Given
+        mock_service = MagicMock()
+        mock_service.register_user.side_effect = DeadlineExceededException(
+            "Request deadline exceeded."
+        )
+        request = RegisterUserRequest(
+            email="test@spookymotion.com", password="password123"
+        )
+
+        # When/Then
+        with pytest.raises(DeadlineExceededException):
+            register_user(request, mock_service)
+
     @patch("src.infrastructure.dependencies.get_activate_service")
     @patch("src.infrastructure.dependencies.verify_credentials")
     def test_activate_user_success(self, mock_verify_credentials, mock_get_service):
@@ -133,3 +153,105 @@ class TestUserController:
             activate_user(another_user_id, request, mock_service, mock_user)
         assert exception.value.status_code == status.HTTP_403_FORBIDDEN
         assert str(exception.value.detail) == "You can only activate your own account."
+
+    def test_activate_user_with_token_success(self):
+        # Given
+        user_id = uuid.uuid4()
+        mock_service = MagicMock(spec=ActivateUserService)
+        mock_service.activate_with_token.return_value = User(
+            user_id, Email("test@spookymotion.com"), "hashed_password", True, None
+        )
+
+        # When
+        result = activate_user_with_token("token", mock_service)
+
+        # Then
+        assert result.id == user_id
+        assert result.is_active is True
+        mock_service.activate_with_token.assert_called_once_with("token")
+
+    def test_activate_user_with_invalid_token(self):
+        # Given
+        mock_service = MagicMock(spec=ActivateUserService)
+        mock_service.activate_with_token.side_effect = ValueError(
+            "Invalid activation token."
+        )
+
+        # When/Then
+        with pytest.raises(HTTPException) as exception:
+            activate_user_with_token("token", mock_service)
+        assert exception.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert str(exception.value.detail) == "Invalid activation token."
+
+    def test_register_user_replays_response_for_same_idempotency_key(self):
+        # Given
+        mock_service = MagicMock()
+        mock_service.register_user.return_value = User(
+            uuid.uuid4(), Email("test@spookymotion.com"), "hashed_password", False, None
+        )
+        store = InMemoryIdempotencyStore()
+        request = RegisterUserRequest(
+            email="test@spookymotion.com", password="password123"
+        )
+
+        # When
+        first = register_user(request, mock_service, "key", store)
+        replayed = register_user(request, mock_service, "key", store)
+
+        # Then
+        mock_service.register_user.assert_called_once()
+        assert replayed.status_code == status.HTTP_201_CREATED
+        assert replayed.headers["Idempotent-Replayed"] == "true"
+        assert b'"email":"test@spookymotion.com"' in replayed.body
+        assert str(first.id).encode() in replayed.body
+
+    def test_register_user_rejects_reused_idempotency_key(self):
+        # Given
+        mock_service = MagicMock()
+        mock_service.register_user.return_value = User(
+            uuid.uuid4(), Email("test@spookymotion.com"), "hashed_password", False, None
+        )
+        store = InMemoryIdempotencyStore()
+        register_user(
+            RegisterUserRequest(email="test@spookymotion.com", password="password123"),
+            mock_service,
+            "key",
+            store,
+        )
+
+        # When/Then
+        with pytest.raises(HTTPException) as exception:
+            register_user(
+                RegisterUserRequest(email="other@spookymotion.com", password="pass"),
+                mock_service,
+                "key",
+                store,
+            )
+        assert exception.value.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    def test_register_user_failure_releases_idempotency_key(self):
+        # Given
+        mock_service = MagicMock()
+        mock_service.register_user.side_effect = [
+            ValueError("SMTP error"),
+            User(
+                uuid.uuid4(),
+                Email("test@spookymotion.com"),
+                "hashed_password",
+                False,
+                None,
+            ),
+        ]
+        store = InMemoryIdempotencyStore()
+        request = RegisterUserRequest(
+            email="test@spookymotion.com", password="password123"
+        )
+        with pytest.raises(HTTPException):
+            register_user(request, mock_service, "key", store)
+
+        # When
+        response = register_user(request, mock_service, "key", store)
+
+        # Then
+        assert response.email == "test@spookymotion.com"
+        assert mock_service.register_user.call_count == 2
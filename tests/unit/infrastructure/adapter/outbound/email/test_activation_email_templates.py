@@ -0,0 +1,53 @@
+import email
+from email import policy
+
+import pytest
+
+from src.infrastructure.adapter.outbound.email import ActivationEmailTemplates
+from src.infrastructure.adapter.outbound.email.activation_email_templates import (
+    compile_template,
+)
+
+
+class TestActivationEmailTemplates:
+    @pytest.fixture
+    def templates(self):
+        return ActivationEmailTemplates.load("noreply@spookymotion.com")
+
+    def test_templates_are_compiled_once_per_process(self, templates):
+        assert ActivationEmailTemplates.load("noreply@spookymotion.com") is templates
+
+    def test_unknown_locale_falls_back_to_default(self, templates):
+        assert templates.resolve("de-DE") is templates.compiled["en"]
+        assert templates.resolve("fr_CA") is templates.compiled["fr"]
+        assert templates.resolve(None) is templates.compiled["en"]
+
+    def test_render_escapes_values_per_part(self):
+        # Given
+        template = compile_template(
+            subject="Subject",
+            text="Hi ${recipient}",
+            html_body="<p>Hi ${recipient}</p>",
+            sender_email="noreply@spookymotion.com",
+        )
+
+        # When
+        raw_message = template.render(recipient="a=b<c>@spookymotion.com")
+
+        # Then
+        message = email.message_from_bytes(raw_message, policy=policy.default)
+        assert b"\r\nTo: a=b<c>@spookymotion.com\r\n" in raw_message
+        assert message.get_body(("plain",)).get_content().strip() == (
+            "Hi a=b<c>@spookymotion.com"
+        )
+        assert message.get_body(("html",)).get_content().strip() == (
+            "<p>Hi a=b&lt;c&gt;@spookymotion.com</p>"
+        )
+
+    def test_render_rejects_header_injection(self, templates):
+        with pytest.raises(ValueError):
+            templates.render(
+                None,
+                recipient="test@spookymotion.com\r\nBcc: other@spookymotion.com",
+                activation_code="1234",
+            )
@@ -0,0 +1,172 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.domain.model import Email
+from src.domain.port import EmailDeliveryException
+from src.infrastructure.adapter.outbound.email import AsyncSmtpEmailSender
+from src.infrastructure.adapter.outbound.email.async_smtp_email_sender import (
+    SmtpConnection,
+    SmtpReplyError,
+)
+from src.infrastructure.config import SmtpConfig
+
+
+def send_all(smtp_sink, scenario):
+    async def main():
+        sender = AsyncSmtpEmailSender(
+            SmtpConfig(
+                host=smtp_sink.host, port=smtp_sink.port, timeout=5, max_connections=2
+            )
+        )
+        try:
+            return await scenario(sender)
+        finally:
+            await sender.close()
+
+    return asyncio.run(main())
+
+
+class TestAsyncSmtpEmailSender:
+    @pytest.mark.parametrize("pipelining", [True, False])
+    def test_send_activation_email(self, smtp_sink, pipelining):
+        # Given
+        smtp_sink.pipelining = pipelining
+
+        # When
+        send_all(
+            smtp_sink,
+            lambda sender: sender.send_activation_email(
+                Email("test@spookymotion.com"), "1234"
+            ),
+        )
+
+        # Then
+        received = smtp_sink.messages[0]
+        assert received.sender == "noreply@spookymotion.com"
+        assert received.recipients == ["test@spookymotion.com"]
+        assert received.message["To"] == "test@spookymotion.com"
+        assert (
+            "Your activation code is: 1234"
+            in received.message.get_body(("plain",)).get_content()
+        )
+
+    def test_concurrent_sends_share_a_few_connections(self, smtp_sink):
+        # Given
+        async def scenario(sender):
+            await asyncio.gather(
+                *(
+                    sender.send_activation_link(
+                        Email(f"user{i}@spookymotion.com"), f"token{i}"
+                    )
+                    for i in range(10)
+                )
+            )
+
+        # When
+        send_all(smtp_sink, scenario)
+
+        # Then
+        assert len(smtp_sink.messages) == 10
+        assert smtp_sink.connections <= 2
+
+    def test_rejected_recipient_raises(self, smtp_sink):
+        # Given
+        smtp_sink.rejected_recipients.add("ghost@spookymotion.com")
+
+        # When / Then
+        with pytest.raises(EmailDeliveryException, match="550 No such user"):
+            send_all(
+                smtp_sink,
+                lambda sender: sender.send_activation_email(
+                    Email("ghost@spookymotion.com"), "1234"
+                ),
+            )
+        assert smtp_sink.messages == []
+
+    def test_send_activation_email_with_expiry(self, smtp_sink):
+        # Given
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=15)
+
+        # When
+        send_all(
+            smtp_sink,
+            lambda sender: sender.send_activation_email(
+                Email("test@spookymotion.com"), "1234", expires_at=expires_at
+            ),
+        )
+
+        # Then
+        assert smtp_sink.messages[0].recipients == ["test@spookymotion.com"]
+
+    def test_failed_message_does_not_break_following_sends(self, smtp_sink):
+        # Given
+        smtp_sink.fail_next()
+
+        async def scenario(sender):
+            with pytest.raises(EmailDeliveryException, match="451"):
+                await sender.send_activation_email(Email("a@spookymotion.com"), "1")
+            await sender.send_activation_email(Email("b@spookymotion.com"), "2")
+
+        # When
+        send_all(smtp_sink, scenario)
+
+        # Then
+        assert [m.recipients for m in smtp_sink.messages] == [["b@spookymotion.com"]]
+
+    def test_unreachable_server_raises(self):
+        # Given
+        sender = AsyncSmtpEmailSender(SmtpConfig(host="127.0.0.1", port=1, timeout=1))
+
+        # When / Then
+        with pytest.raises(EmailDeliveryException):
+            asyncio.run(
+                sender.send_activation_email(Email("test@spookymotion.com"), "1234")
+            )
+
+    @pytest.mark.parametrize(
+        "dropped",
+        [
+            ConnectionResetError("SMTP connection closed"),
+            SmtpReplyError(421, ["Idle timeout, closing connection"]),
+        ],
+    )
+    def test_retry_after_idle_period_opens_new_session(self, dropped):
+        # Given
+        sender = AsyncSmtpEmailSender(SmtpConfig(timeout=5))
+        stale_sessions = [MagicMock(spec=SmtpConnection) for _ in range(2)]
+        for stale in stale_sessions:
+            stale.send = AsyncMock(side_effect=dropped)
+        sender._idle = list(stale_sessions)
+        fresh = MagicMock(spec=SmtpConnection)
+        fresh.send = AsyncMock()
+
+        # When
+        with patch.object(
+            SmtpConnection, "open", AsyncMock(return_value=fresh)
+        ) as open_connection:
+            asyncio.run(
+                sender.send_activation_email(Email("test@spookymotion.com"), "1234")
+            )
+
+        # Then
+        open_connection.assert_awaited_once()
+        fresh.send.assert_awaited_once()
+        assert sum(stale.send.await_count for stale in stale_sessions) == 1
+
+    def test_rejection_on_reused_session_is_not_retried(self):
+        # Given
+        sender = AsyncSmtpEmailSender(SmtpConfig(timeout=5))
+        idle = MagicMock(spec=SmtpConnection)
+        idle.send = AsyncMock(side_effect=SmtpReplyError(550, ["No such user"]))
+        sender._idle = [idle]
+
+        # When / Then
+        with patch.object(SmtpConnection, "open", AsyncMock()) as open_connection:
+            with pytest.raises(EmailDeliveryException):
+                asyncio.run(
+                    sender.send_activation_email(Email("test@spookymotion.com"), "1")
+                )
+        open_connection.assert_not_awaited()
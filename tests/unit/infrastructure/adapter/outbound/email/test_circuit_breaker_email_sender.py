@@ -0,0 +1,135 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.exception import DeadlineExceededException
+from src.domain.model import Email
+from src.domain.port import EmailDeliveryException, EmailSenderPort
+from src.infrastructure.adapter.outbound.email import (
+    CircuitBreakerEmailSender,
+    EmailRetryQueue,
+    MailhogEmailSender,
+)
+from src.infrastructure.config import CircuitBreakerConfig, SmtpConfig
+from src.infrastructure.deadline import reset_deadline, set_deadline
+from src.infrastructure.resilience import CircuitBreaker
+from src.infrastructure.resilience.circuit_breaker import CLOSED, OPEN
+
+
+class TestCircuitBreakerEmailSender:
+    @pytest.fixture
+    def delegate(self):
+        return MagicMock(spec=EmailSenderPort)
+
+    @pytest.fixture
+    def config(self):
+        return CircuitBreakerConfig(window_size=2, minimum_calls=2, open_seconds=60)
+
+    def test_send_delegates_while_closed(self, delegate, config):
+        # Given
+        sender = CircuitBreakerEmailSender(delegate, config)
+
+        # When
+        sender.send_activation_email(Email("test@spookymotion.com"), "1234", "fr")
+
+        # Then
+        delegate.send_activation_email.assert_called_once_with(
+            Email("test@spookymotion.com"), "1234", "fr", None
+        )
+
+    def test_open_circuit_fails_fast(self, delegate, config):
+        # Given
+        delegate.send_activation_email.side_effect = EmailDeliveryException("down")
+        sender = CircuitBreakerEmailSender(delegate, config)
+        for _ in range(2):
+            with pytest.raises(EmailDeliveryException):
+                sender.send_activation_email(Email("test@spookymotion.com"), "1234")
+
+        # When
+        with pytest.raises(EmailDeliveryException) as exception:
+            sender.send_activation_email(Email("test@spookymotion.com"), "1234")
+
+        # Then
+        assert str(exception.value) == "Email delivery is temporarily unavailable"
+        assert delegate.send_activation_email.call_count == 2
+
+    def test_queue_fallback_defers_failed_emails(self, delegate, config):
+        # Given
+        retry_queue = EmailRetryQueue(max_size=10)
+        delegate.send_activation_link.side_effect = [OSError("refused"), None]
+        sender = CircuitBreakerEmailSender(delegate, config, retry_queue=retry_queue)
+
+        # When
+        sender.send_activation_link(Email("test@spookymotion.com"), "token")
+
+        # Then
+        assert len(retry_queue) == 1
+        assert retry_queue.drain() == 1
+        assert delegate.send_activation_link.call_count == 2
+        retry_queue.stop()
+
+    def test_queued_emails_wait_for_circuit_to_close(self, delegate, config):
+        # Given
+        breaker = CircuitBreaker(config)
+        breaker._open()
+        retry_queue = EmailRetryQueue(max_size=10)
+        sender = CircuitBreakerEmailSender(delegate, config, breaker, retry_queue)
+        sender.send_activation_email(Email("test@spookymotion.com"), "1234")
+
+        # When
+        sent = retry_queue.drain()
+
+        # Then
+        assert sent == 0
+        assert breaker.state == OPEN
+        delegate.send_activation_email.assert_not_called()
+        retry_queue.stop()
+
+    def test_full_retry_queue_raises(self, delegate, config):
+        # Given
+        delegate.send_activation_email.side_effect = EmailDeliveryException("down")
+        retry_queue = EmailRetryQueue(max_size=0)
+        sender = CircuitBreakerEmailSender(delegate, config, retry_queue=retry_queue)
+
+        # When / Then
+        with pytest.raises(EmailDeliveryException, match="queue is full"):
+            sender.send_activation_email(Email("test@spookymotion.com"), "1234")
+
+    def test_sends_timing_out_at_the_deadline_open_the_circuit(self, smtp_sink, config):
+        # Given
+        smtp_sink.latency = 0.3
+        sender = CircuitBreakerEmailSender(
+            MailhogEmailSender(
+                SmtpConfig(host=smtp_sink.host, port=smtp_sink.port, timeout=10)
+            ),
+            config,
+        )
+
+        # When
+        for _ in range(2):
+            token = set_deadline(0.1)
+            try:
+                with pytest.raises(DeadlineExceededException):
+                    sender.send_activation_email(Email("test@spookymotion.com"), "1234")
+            finally:
+                reset_deadline(token)
+
+        # Then
+        assert sender.breaker.state == OPEN
+
+    def test_request_out_of_budget_does_not_reach_the_breaker(self, delegate, config):
+        # Given
+        sender = CircuitBreakerEmailSender(delegate, config)
+        token = set_deadline(0)
+
+        # When
+        try:
+            for _ in range(2):
+                with pytest.raises(DeadlineExceededException):
+                    sender.send_activation_email(Email("test@spookymotion.com"), "1234")
+        finally:
+            reset_deadline(token)
+
+        # Then
+        delegate.send_activation_email.assert_not_called()
+        assert sender.breaker.state == CLOSED
@@ -1,12 +1,18 @@
+import email
 import smtplib
+import time
+from datetime import datetime, timedelta, timezone
+from email import policy
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.domain.exception import DeadlineExceededException
 from src.domain.model import Email
 from src.domain.port import EmailDeliveryException
 from src.infrastructure.adapter.outbound import MailhogEmailSender
 from src.infrastructure.config import SmtpConfig
+from src.infrastructure.deadline import reset_deadline, set_deadline
 
 
 class TestMailhogEmailSender:
@@ -30,17 +36,74 @@ class TestMailhogEmailSender:
         with patch("smtplib.SMTP", return_value=mock_smtp):
             email_sender.send_activation_email(Email("test@spookymotion.com"), "1234")
 
-        mock_smtp.send_message.assert_called_once()
-        message = mock_smtp.send_message.call_args[0][0]
+        mock_smtp.sendmail.assert_called_once()
+        sender, recipients, raw_message = mock_smtp.sendmail.call_args[0]
+        message = email.message_from_bytes(raw_message, policy=policy.default)
+        assert sender == "noreply@spookymotion.com"
+        assert recipients == ["test@spookymotion.com"]
         assert message["Subject"] == "Activate Your Account"
         assert message["From"] == "noreply@spookymotion.com"
         assert message["To"] == "test@spookymotion.com"
-        assert "Your activation code is: 1234" in str(message.get_payload())
+        assert (
+            "Your activation code is: 1234"
+            in message.get_body(("plain",)).get_content()
+        )
+        assert "<strong>1234</strong>" in message.get_body(("html",)).get_content()
+
+    def test_send_activation_email_in_requested_locale(self, email_sender):
+        mock_smtp = MagicMock()
+        mock_smtp.__enter__.return_value = mock_smtp
+
+        with patch("smtplib.SMTP", return_value=mock_smtp):
+            email_sender.send_activation_email(
+                Email("test@spookymotion.com"), "1234", locale="fr-FR"
+            )
+
+        raw_message = mock_smtp.sendmail.call_args[0][2]
+        message = email.message_from_bytes(raw_message, policy=policy.default)
+        assert message["Subject"] == "Activez votre compte"
+        assert (
+            "Votre code d'activation est : 1234"
+            in message.get_body(("plain",)).get_content()
+        )
+
+    def test_send_activation_link(self, email_sender):
+        mock_smtp = MagicMock()
+        mock_smtp.__enter__.return_value = mock_smtp
+        email_sender.config.activation_link_url = "https://spookymotion.com/a?token="
+
+        with patch("smtplib.SMTP", return_value=mock_smtp):
+            email_sender.send_activation_link(
+                Email("test@spookymotion.com"), "key." + "x" * 120
+            )
+
+        raw_message = mock_smtp.sendmail.call_args[0][2]
+        message = email.message_from_bytes(raw_message, policy=policy.default)
+        link = "https://spookymotion.com/a?token=key." + "x" * 120
+        assert link in message.get_body(("plain",)).get_content()
+        assert f'href="{link}"' in message.get_body(("html",)).get_content()
+
+    def test_send_activation_link_renders_time_left(self, email_sender):
+        mock_smtp = MagicMock()
+        mock_smtp.__enter__.return_value = mock_smtp
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+
+        with patch("smtplib.SMTP", return_value=mock_smtp):
+            email_sender.send_activation_link(
+                Email("test@spookymotion.com"), "token", "fr", expires_at
+            )
+
+        raw_message = mock_smtp.sendmail.call_args[0][2]
+        message = email.message_from_bytes(raw_message, policy=policy.default)
+        assert (
+            "Ce lien expire dans 30 minutes."
+            in message.get_body(("plain",)).get_content()
+        )
 
     def test_send_activation_email_failure(self, email_sender):
         mock_smtp = MagicMock()
         mock_smtp.__enter__.return_value = mock_smtp
-        mock_smtp.send_message.side_effect = smtplib.SMTPException("Connection failed")
+        mock_smtp.sendmail.side_effect = smtplib.SMTPException("Connection failed")
 
         with patch("smtplib.SMTP", return_value=mock_smtp):
             with pytest.raises(EmailDeliveryException) as exception:
@@ -49,3 +112,79 @@ class TestMailhogEmailSender:
                 )
 
         assert str(exception.value) == "SMTP error: Connection failed"
+
+    def test_session_is_reused_between_emails(self, email_sender):
+        mock_smtp = MagicMock()
+
+        with patch("smtplib.SMTP", return_value=mock_smtp) as smtp_class:
+            email_sender.send_activation_email(Email("a@spookymotion.com"), "1234")
+            email_sender.send_activation_email(Email("b@spookymotion.com"), "5678")
+
+        smtp_class.assert_called_once()
+        assert mock_smtp.sendmail.call_count == 2
+
+    def test_warm_up_opens_idle_sessions(self, email_sender):
+        with patch("smtplib.SMTP", return_value=MagicMock()) as smtp_class:
+            email_sender.warm_up()
+            email_sender.send_activation_email(Email("a@spookymotion.com"), "1234")
+
+        assert smtp_class.call_count == email_sender.config.max_idle_sessions
+
+    def test_disconnected_idle_session_is_replaced(self, email_sender):
+        stale, fresh = MagicMock(), MagicMock()
+        stale.sendmail.side_effect = [None, smtplib.SMTPServerDisconnected("closed")]
+
+        with patch("smtplib.SMTP", side_effect=[stale, fresh]):
+            email_sender.send_activation_email(Email("a@spookymotion.com"), "1234")
+            email_sender.send_activation_email(Email("b@spookymotion.com"), "5678")
+
+        stale.quit.assert_called_once()
+        fresh.sendmail.assert_called_once()
+
+    def test_retry_after_idle_period_opens_new_session(self, email_sender):
+        # Given
+        stale_sessions = [MagicMock(), MagicMock()]
+        for stale in stale_sessions:
+            stale.sendmail.side_effect = smtplib.SMTPServerDisconnected("closed")
+        fresh = MagicMock()
+        email_sender._sessions = [(stale, time.monotonic()) for stale in stale_sessions]
+
+        # When
+        with patch("smtplib.SMTP", return_value=fresh) as smtp_class:
+            email_sender.send_activation_email(Email("a@spookymotion.com"), "1234")
+
+        # Then
+        smtp_class.assert_called_once()
+        fresh.sendmail.assert_called_once()
+        assert sum(stale.sendmail.call_count for stale in stale_sessions) == 1
+
+    def test_long_idle_session_is_checked_before_reuse(self, email_sender):
+        # Given
+        dropped, fresh = MagicMock(), MagicMock()
+        dropped.noop.side_effect = smtplib.SMTPServerDisconnected("closed")
+        idle_since = time.monotonic() - email_sender.config.idle_check_seconds
+        email_sender._sessions = [(dropped, idle_since)]
+
+        # When
+        with patch("smtplib.SMTP", return_value=fresh) as smtp_class:
+            email_sender.send_activation_email(Email("a@spookymotion.com"), "1234")
+
+        # Then
+        dropped.sendmail.assert_not_called()
+        smtp_class.assert_called_once()
+        fresh.sendmail.assert_called_once()
+
+    def test_slow_server_fails_at_request_deadline(self, smtp_sink):
+        smtp_sink.latency = 0.3
+        email_sender = MailhogEmailSender(
+            SmtpConfig(host=smtp_sink.host, port=smtp_sink.port, timeout=10)
+        )
+        token = set_deadline(0.1)
+
+        try:
+            with pytest.raises(DeadlineExceededException):
+                email_sender.send_activation_email(
+                    Email("test@spookymotion.com"), "1234"
+                )
+        finally:
+            reset_deadline(token)
@@ -0,0 +1,275 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.model import Email
+from src.domain.port import EmailSenderPort, EmailDeliveryException
+from src.infrastructure.adapter.outbound.email import ScheduledEmailSender
+from src.infrastructure.config import EmailSchedulerConfig
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def wall(self) -> datetime:
+        return NOW + timedelta(seconds=self.now)
+
+
+class TestScheduledEmailSender:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def delegate(self):
+        return MagicMock(spec=EmailSenderPort)
+
+    def scheduler(self, delegate, clock, **config):
+        config = EmailSchedulerConfig(
+            **{
+                "enabled": True,
+                "per_domain_rate": 1,
+                "per_domain_burst": 1,
+                "workers": 0,
+                "retry_delay_seconds": 5,
+                **config,
+            }
+        )
+        return ScheduledEmailSender(delegate, config, clock, clock.wall)
+
+    def sent_to(self, delegate) -> list[str]:
+        calls = delegate.method_calls
+        return [call.args[0].value for call in calls if call[0].startswith("send")]
+
+    def test_sends_queued_email_through_delegate(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock)
+        expires_at = NOW + timedelta(minutes=1)
+
+        # When
+        sender.send_activation_email(Email("a@gmail.com"), "1234", "fr", expires_at)
+        delegate.send_activation_email.assert_not_called()
+        sent = sender.step()
+
+        # Then
+        assert sent is True
+        delegate.send_activation_email.assert_called_once_with(
+            Email("a@gmail.com"), "1234", "fr", expires_at
+        )
+        assert len(sender) == 0
+
+    def test_codes_go_before_links(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock, per_domain_burst=10)
+        sender.send_activation_link(Email("link@gmail.com"), "token")
+        sender.send_activation_email(Email("code@gmail.com"), "1234")
+
+        # When
+        while sender.step():
+            pass
+
+        # Then
+        assert self.sent_to(delegate) == ["code@gmail.com", "link@gmail.com"]
+
+    def test_throttled_domain_does_not_hold_back_other_domains(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock)
+        sender.send_activation_email(Email("a@gmail.com"), "1111")
+        sender.send_activation_email(Email("b@gmail.com"), "2222")
+        sender.send_activation_link(Email("c@proton.me"), "token")
+
+        # When
+        while sender.step():
+            pass
+
+        # Then
+        assert self.sent_to(delegate) == ["a@gmail.com", "c@proton.me"]
+        assert len(sender) == 1
+
+        # When
+        clock.now = 1.0
+        sender.step()
+
+        # Then
+        assert self.sent_to(delegate)[-1] == "b@gmail.com"
+
+    def test_domain_rate_override(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock, domain_rates={"slow.com": 0.1})
+        sender.send_activation_link(Email("a@slow.com"), "token")
+        sender.send_activation_link(Email("b@slow.com"), "token")
+        sender.step()
+
+        # When
+        clock.now = 5.0
+        sent_early = sender.step()
+        clock.now = 10.0
+        sent_later = sender.step()
+
+        # Then
+        assert (sent_early, sent_later) == (False, True)
+
+    def test_drops_expired_email(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock)
+        sender.send_activation_email(
+            Email("a@gmail.com"), "1111", expires_at=NOW + timedelta(seconds=30)
+        )
+        sender.send_activation_email(
+            Email("b@gmail.com"), "2222", expires_at=NOW + timedelta(seconds=60)
+        )
+        sender.step()
+
+        # When
+        clock.now = 45.0
+        sender.step()
+
+        # Then
+        assert self.sent_to(delegate) == ["a@gmail.com", "b@gmail.com"]
+
+        # Given
+        sender.send_activation_email(
+            Email("c@gmail.com"), "3333", expires_at=NOW + timedelta(seconds=50)
+        )
+
+        # When
+        clock.now = 55.0
+        sent = sender.step()
+
+        # Then
+        assert sent is False
+        assert len(sender) == 0
+
+    def test_retries_failed_email_behind_fresh_ones(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock, per_domain_burst=10)
+        delegate.send_activation_link.side_effect = [EmailDeliveryException(), None]
+        sender.send_activation_link(Email("retried@gmail.com"), "token")
+        sender.step()
+
+        # When
+        sender.send_activation_email(Email("fresh@gmail.com"), "1234")
+        clock.now = 5.0
+        while sender.step():
+            pass
+
+        # Then
+        assert self.sent_to(delegate) == [
+            "retried@gmail.com",
+            "fresh@gmail.com",
+            "retried@gmail.com",
+        ]
+
+    def test_retry_waits_for_delay(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock)
+        delegate.send_activation_link.side_effect = [OSError(), None]
+        sender.send_activation_link(Email("a@gmail.com"), "token")
+        sender.step()
+
+        # When
+        clock.now = 4.0
+        early = sender.step()
+        clock.now = 5.0
+        late = sender.step()
+
+        # Then
+        assert (early, late) == (False, True)
+
+    def test_does_not_retry_email_that_would_expire(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock)
+        delegate.send_activation_email.side_effect = OSError()
+
+        # When
+        sender.send_activation_email(
+            Email("a@gmail.com"), "1111", expires_at=NOW + timedelta(seconds=3)
+        )
+        sender.step()
+
+        # Then
+        assert len(sender) == 0
+
+    def test_gives_up_after_max_attempts(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock, max_attempts=2)
+        delegate.send_activation_link.side_effect = OSError()
+        sender.send_activation_link(Email("a@gmail.com"), "token")
+
+        # When
+        sender.step()
+        clock.now = 10.0
+        sender.step()
+
+        # Then
+        assert delegate.send_activation_link.call_count == 2
+        assert len(sender) == 0
+
+    def test_rejects_email_when_queue_full(self, delegate, clock):
+        # Given
+        sender = self.scheduler(delegate, clock, max_queued=1)
+        sender.send_activation_link(Email("a@gmail.com"), "token")
+
+        # When / Then
+        with pytest.raises(EmailDeliveryException):
+            sender.send_activation_link(Email("b@gmail.com"), "token")
+
+    def test_workers_send_in_background_and_close_drains(self, delegate):
+        # Given
+        sender = ScheduledEmailSender(
+            delegate,
+            EmailSchedulerConfig(per_domain_rate=1000, per_domain_burst=100),
+        )
+
+        # When
+        for i in range(20):
+            sender.send_activation_email(Email(f"user{i}@gmail.com"), "1234")
+        sender.close()
+
+        # Then
+        assert delegate.send_activation_email.call_count == 20
+        delegate.close.assert_called_once()
+        with pytest.raises(EmailDeliveryException):
+            sender.send_activation_email(Email("late@gmail.com"), "1234")
+
+    def test_close_drops_queued_emails_and_waits_for_the_one_being_sent(self, delegate):
+        # Given
+        sending, release = threading.Event(), threading.Event()
+        events = []
+
+        def send_activation_email(*args):
+            sending.set()
+            release.wait(5)
+            events.append("sent")
+
+        delegate.send_activation_email.side_effect = send_activation_email
+        delegate.close.side_effect = lambda: events.append("closed")
+        sender = ScheduledEmailSender(
+            delegate,
+            EmailSchedulerConfig(
+                per_domain_rate=1000,
+                per_domain_burst=100,
+                workers=1,
+                drain_timeout_seconds=0.05,
+            ),
+        )
+        sender.send_activation_email(Email("first@gmail.com"), "1234")
+        sender.send_activation_email(Email("second@gmail.com"), "1234")
+        sending.wait(5)
+
+        # When
+        threading.Timer(0.2, release.set).start()
+        sender.close()
+
+        # Then
+        assert events == ["sent", "closed"]
+        assert delegate.send_activation_email.call_count == 1
+        assert len(sender) == 0
@@ -0,0 +1,128 @@
+import threading
+import time
+
+import pytest
+
+from src.domain.exception import DeadlineExceededException
+from src.domain.port import (
+    IdempotentResponse,
+    IdempotencyKeyMismatchException,
+    IdempotencyKeyInFlightException,
+)
+from src.infrastructure.adapter.outbound.idempotency import InMemoryIdempotencyStore
+from src.infrastructure.config import IdempotencyConfig
+from src.infrastructure.deadline import reset_deadline, set_deadline
+
+
+class TestInMemoryIdempotencyStore:
+    @pytest.fixture
+    def store(self):
+        return InMemoryIdempotencyStore(
+            IdempotencyConfig(max_entries=2, wait_timeout_seconds=1)
+        )
+
+    def test_first_request_claims_the_key(self, store):
+        # When
+        result = store.begin("key", "fingerprint")
+
+        # Then
+        assert result is None
+
+    def test_completed_response_is_replayed(self, store):
+        # Given
+        response = IdempotentResponse(status_code=201, body={"id": "1"})
+        store.begin("key", "fingerprint")
+        store.complete("key", response)
+
+        # When
+        result = store.begin("key", "fingerprint")
+
+        # Then
+        assert result == response
+
+    def test_reused_key_with_another_payload_is_rejected(self, store):
+        # Given
+        store.begin("key", "fingerprint")
+
+        # When/Then
+        with pytest.raises(IdempotencyKeyMismatchException):
+            store.begin("key", "another fingerprint")
+
+    def test_abandoned_key_can_be_claimed_again(self, store):
+        # Given
+        store.begin("key", "fingerprint")
+        store.abandon("key")
+
+        # When
+        result = store.begin("key", "fingerprint")
+
+        # Then
+        assert result is None
+
+    def test_concurrent_duplicate_waits_for_in_flight_result(self, store):
+        # Given
+        response = IdempotentResponse(status_code=201, body={"id": "1"})
+        store.begin("key", "fingerprint")
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(store.begin("key", "fingerprint"))
+        )
+
+        # When
+        waiter.start()
+        time.sleep(0.05)
+        store.complete("key", response)
+        waiter.join(timeout=1)
+
+        # Then
+        assert results == [response]
+
+    def test_concurrent_duplicate_times_out(self):
+        # Given
+        store = InMemoryIdempotencyStore(IdempotencyConfig(wait_timeout_seconds=0.01))
+        store.begin("key", "fingerprint")
+
+        # When/Then
+        with pytest.raises(IdempotencyKeyInFlightException):
+            store.begin("key", "fingerprint")
+
+    def test_concurrent_duplicate_waits_at_most_until_request_deadline(self):
+        # Given
+        store = InMemoryIdempotencyStore(IdempotencyConfig(wait_timeout_seconds=30))
+        store.begin("key", "fingerprint")
+        token = set_deadline(0.05)
+
+        # When/Then
+        try:
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededException):
+                store.begin("key", "fingerprint")
+            assert time.monotonic() - started < 1
+        finally:
+            reset_deadline(token)
+
+    def test_fingerprint_is_keyed(self):
+        # Given
+        payload = {"email": "test@spookymotion.com", "password": "password123"}
+        store = InMemoryIdempotencyStore(IdempotencyConfig(fingerprint_key=b"a"))
+        same_key = InMemoryIdempotencyStore(IdempotencyConfig(fingerprint_key=b"a"))
+        other_key = InMemoryIdempotencyStore(IdempotencyConfig(fingerprint_key=b"b"))
+
+        # When
+        fingerprint = store.fingerprint(payload)
+
+        # Then
+        assert fingerprint == same_key.fingerprint(payload)
+        assert fingerprint != other_key.fingerprint(payload)
+
+    def test_oldest_completed_entries_are_evicted(self, store):
+        # Given
+        for key in ("first", "second", "third"):
+            store.begin(key, "fingerprint")
+            store.complete(key, IdempotentResponse(status_code=201, body={}))
+
+        # When
+        result = store.begin("first", "fingerprint")
+
+        # Then
+        assert result is None
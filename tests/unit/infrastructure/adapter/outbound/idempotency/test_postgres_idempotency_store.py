@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.domain.port import IdempotentResponse, IdempotencyKeyMismatchException
+from src.infrastructure.adapter.outbound.idempotency import PostgresIdempotencyStore
+from src.infrastructure.config import DatabaseConfig, IdempotencyConfig
+
+CONNECT = (
+    "src.infrastructure.adapter.outbound.repository.connection_pool.psycopg2.connect"
+)
+
+
+class TestPostgresIdempotencyStore:
+    @pytest.fixture
+    def store(self):
+        return PostgresIdempotencyStore(
+            DatabaseConfig(host="localhost"),
+            IdempotencyConfig(
+                backend="postgres", fingerprint_key=b"secret", wait_timeout_seconds=0
+            ),
+        )
+
+    @pytest.fixture
+    def mock_cursor(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def mock_conn(self, mock_cursor):
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_conn.__enter__.return_value = mock_conn
+        return mock_conn
+
+    def test_begin_claims_new_key(self, store, mock_conn, mock_cursor):
+        # Given
+        mock_cursor.fetchone.return_value = ("register:key",)
+
+        with patch(CONNECT, return_value=mock_conn):
+            # When
+            result = store.begin("register:key", "fingerprint")
+
+        # Then
+        assert result is None
+        mock_conn.commit.assert_called_once()
+
+    def test_begin_replays_completed_response(self, store, mock_conn, mock_cursor):
+        # Given
+        mock_cursor.fetchone.side_effect = [None, ("fingerprint", 201, {"id": "1"})]
+
+        with patch(CONNECT, return_value=mock_conn):
+            # When
+            result = store.begin("register:key", "fingerprint")
+
+        # Then
+        assert result == IdempotentResponse(status_code=201, body={"id": "1"})
+
+    def test_begin_rejects_other_fingerprint(self, store, mock_conn, mock_cursor):
+        # Given
+        mock_cursor.fetchone.side_effect = [None, ("fingerprint", None, None)]
+
+        with patch(CONNECT, return_value=mock_conn):
+            # When/Then
+            with pytest.raises(IdempotencyKeyMismatchException):
+                store.begin("register:key", "another fingerprint")
+
+    def test_postgres_backend_requires_fingerprint_key(self):
+        # When/Then
+        with pytest.raises(ValueError):
+            IdempotencyConfig(backend="postgres", fingerprint_key=b"")
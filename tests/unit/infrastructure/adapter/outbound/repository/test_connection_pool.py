@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+from psycopg2.pool import PoolError
+
+from src.domain.exception import DeadlineExceededException
+from src.infrastructure.adapter.outbound.repository import ConnectionPool
+from src.infrastructure.config import DatabaseConfig
+from src.infrastructure.deadline import reset_deadline, set_deadline
+
+CONNECT = (
+    "src.infrastructure.adapter.outbound.repository.connection_pool.psycopg2.connect"
+)
+
+
+def open_connection():
+    conn = MagicMock()
+    conn.closed = 0
+    conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    return conn
+
+
+class TestConnectionPool:
+    @pytest.fixture
+    def pool(self):
+        return ConnectionPool(
+            DatabaseConfig(host="localhost", max_pool_size=1, pool_acquire_timeout=0)
+        )
+
+    def test_released_connection_is_reused(self, pool):
+        # Given
+        conn = open_connection()
+
+        with patch(CONNECT, return_value=conn) as mock_connect:
+            # When
+            with pool.connection():
+                pass
+            with pool.connection() as reused:
+                pass
+
+        # Then
+        assert reused is conn
+        mock_connect.assert_called_once()
+
+    def test_acquire_fails_when_pool_is_exhausted(self, pool):
+        # Given
+        with patch(CONNECT, return_value=open_connection()):
+            pool.acquire()
+
+            # When/Then
+            with pytest.raises(PoolError):
+                pool.acquire()
+
+    def test_closed_connection_is_replaced(self, pool):
+        # Given
+        closed, fresh = open_connection(), open_connection()
+
+        with patch(CONNECT, side_effect=[closed, fresh]):
+            with pool.connection():
+                closed.closed = 2
+
+            # When
+            with pool.connection() as conn:
+                pass
+
+        # Then
+        assert conn is fresh
+        closed.close.assert_called_once()
+
+    def test_connection_left_in_transaction_is_rolled_back(self, pool):
+        # Given
+        conn = open_connection()
+        conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INERROR
+
+        with patch(CONNECT, return_value=conn):
+            # When
+            with pool.connection():
+                pass
+
+        # Then
+        conn.rollback.assert_called_once()
+
+    def test_prefill_opens_min_pool_size_connections(self):
+        # Given
+        pool = ConnectionPool(
+            DatabaseConfig(host="localhost", min_pool_size=2, max_pool_size=3)
+        )
+
+        with patch(
+            CONNECT, side_effect=[open_connection(), open_connection()]
+        ) as mock_connect:
+            # When
+            pool.prefill()
+
+            # Then
+            assert mock_connect.call_count == 2
+            with pool.connection(), pool.connection():
+                assert mock_connect.call_count == 2
+
+    def test_acquire_waits_at_most_until_request_deadline(self):
+        # Given
+        pool = ConnectionPool(
+            DatabaseConfig(host="localhost", max_pool_size=1, pool_acquire_timeout=30)
+        )
+        token = set_deadline(0.05)
+
+        try:
+            with patch(CONNECT, return_value=open_connection()):
+                pool.acquire()
+
+                # When / Then
+                with pytest.raises(DeadlineExceededException):
+                    pool.acquire()
+        finally:
+            reset_deadline(token)
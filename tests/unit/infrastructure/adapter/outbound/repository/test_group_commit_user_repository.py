@@ -0,0 +1,131 @@
+import threading
+import time
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.exception import DeadlineExceededException
+from src.domain.model import Email, User
+from src.domain.port import UserRepositoryPort
+from src.infrastructure.adapter.outbound.repository import GroupCommitUserRepository
+from src.infrastructure.config import GroupCommitConfig
+from src.infrastructure.deadline import reset_deadline, set_deadline
+
+
+def make_user(index: int) -> User:
+    return User(
+        id=uuid.uuid4(),
+        email=Email(f"user{index}@spookymotion.com"),
+        password_hash="hashed_password",
+    )
+
+
+def save_concurrently(repository, users) -> list:
+    errors = []
+
+    def save(user):
+        try:
+            repository.save(user)
+        except Exception as exception:
+            errors.append(exception)
+
+    threads = [threading.Thread(target=save, args=(user,)) for user in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return errors
+
+
+class TestGroupCommitUserRepository:
+    def test_concurrent_saves_are_written_in_one_batch(self):
+        # Given
+        delegate = MagicMock(spec=UserRepositoryPort)
+        repository = GroupCommitUserRepository(
+            delegate, GroupCommitConfig(max_batch_size=10, max_delay_seconds=0.5)
+        )
+        users = [make_user(index) for index in range(10)]
+
+        # When
+        errors = save_concurrently(repository, users)
+        repository.close()
+
+        # Then
+        assert errors == []
+        delegate.save_many.assert_called_once()
+        assert sorted(u.email.value for u in delegate.save_many.call_args.args[0]) == (
+            sorted(user.email.value for user in users)
+        )
+        delegate.save.assert_not_called()
+
+    def test_batch_is_written_after_max_delay(self):
+        # Given
+        delegate = MagicMock(spec=UserRepositoryPort)
+        repository = GroupCommitUserRepository(
+            delegate, GroupCommitConfig(max_batch_size=100, max_delay_seconds=0.01)
+        )
+
+        # When
+        started = time.monotonic()
+        repository.save(make_user(0))
+        elapsed = time.monotonic() - started
+        repository.close()
+
+        # Then
+        assert elapsed < 1
+        delegate.save_many.assert_called_once()
+
+    def test_failed_batch_only_fails_the_faulty_save(self):
+        # Given
+        delegate = MagicMock(spec=UserRepositoryPort)
+        delegate.save_many.side_effect = ValueError("duplicate key")
+        faulty = make_user(0)
+
+        def save(user):
+            if user is faulty:
+                raise ValueError("duplicate key")
+
+        delegate.save.side_effect = save
+        repository = GroupCommitUserRepository(
+            delegate, GroupCommitConfig(max_batch_size=3, max_delay_seconds=0.5)
+        )
+
+        # When
+        errors = save_concurrently(repository, [faulty, make_user(1), make_user(2)])
+        repository.close()
+
+        # Then
+        assert [str(error) for error in errors] == ["duplicate key"]
+        assert delegate.save.call_count == 3
+
+    def test_caller_stops_waiting_at_the_deadline(self):
+        # Given
+        delegate = MagicMock(spec=UserRepositoryPort)
+        release = threading.Event()
+        delegate.save_many.side_effect = lambda users: release.wait(timeout=5)
+        repository = GroupCommitUserRepository(
+            delegate, GroupCommitConfig(max_delay_seconds=0)
+        )
+        token = set_deadline(0.05)
+
+        # When / Then
+        try:
+            with pytest.raises(DeadlineExceededException):
+                repository.save(make_user(0))
+        finally:
+            reset_deadline(token)
+            release.set()
+            repository.close()
+
+    def test_reads_go_to_the_delegate(self):
+        # Given
+        delegate = MagicMock(spec=UserRepositoryPort)
+        repository = GroupCommitUserRepository(delegate, GroupCommitConfig())
+        user_id = uuid.uuid4()
+
+        # When
+        repository.find_by_id(user_id)
+
+        # Then
+        delegate.find_by_id.assert_called_once_with(user_id)
@@ -1,11 +1,16 @@
 import uuid
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+import psycopg2
 import pytest
 
+from src.domain.exception import DeadlineExceededException
 from src.domain.model import User, Email, ActivationCode
 from src.infrastructure.adapter.outbound import PostgresUserRepository
-from src.infrastructure.config import DatabaseConfig
+from src.infrastructure.adapter.outbound.repository import SlowQueryLog
+from src.infrastructure.config import DatabaseConfig, SlowQueryConfig
+from src.infrastructure.deadline import reset_deadline, set_deadline
 
 
 class TestPostgresUserRepository:
@@ -16,12 +21,27 @@ class TestPostgresUserRepository:
             user="test_user",
             password="test_password",
             host="localhost",
+            prepared_statements=False,
         )
 
     @pytest.fixture
     def user_repository(self, db_config):
         return PostgresUserRepository(db_config)
 
+    @pytest.fixture
+    def prepared_user_repository(self, db_config):
+        db_config.prepared_statements = True
+        return PostgresUserRepository(db_config)
+
+    @pytest.fixture
+    def open_connection(self):
+        """Mocks a live pooled connection, kept by the pool between calls"""
+        mock_conn = MagicMock()
+        mock_conn.closed = 0
+        mock_conn.prepared_statements = set()
+        mock_conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        return mock_conn
+
     def test_save_user(self, user_repository):
         # Given
         user = User(
@@ -51,6 +71,39 @@ class TestPostgresUserRepository:
             # Then
             assert mock_conn.cursor.call_count == 1
             mock_cursor.execute.assert_called_once()
+            query, params = mock_cursor.execute.call_args.args
+            assert query.split()[:3] == ["INSERT", "INTO", "pending_users"]
+            assert params[:2] == (str(user.id), "test@spookymotion.com")
+            mock_conn.commit.assert_called_once()
+
+    def test_save_active_user_promotes_pending_row(self, user_repository):
+        # Given
+        user = User(
+            id=uuid.uuid4(),
+            email=Email("test@spookymotion.com"),
+            password_hash="hashed_password",
+            is_active=True,
+        )
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_conn.__enter__.return_value = mock_conn
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            user_repository.save(user)
+
+            # Then
+            query, params = mock_cursor.execute.call_args.args
+            assert " ".join(query.split()).startswith(
+                "WITH promoted AS (DELETE FROM pending_users WHERE id = %s) "
+                "INSERT INTO users"
+            )
+            assert params[:3] == (str(user.id), str(user.id), "test@spookymotion.com")
+            assert params[4] is True
             mock_conn.commit.assert_called_once()
 
     def test_find_by_id(self, user_repository):
@@ -84,7 +137,7 @@ class TestPostgresUserRepository:
             # Then
             assert mock_conn.cursor.call_count == 1
             mock_cursor.execute.assert_called_once_with(
-                "SELECT * FROM users WHERE id = %s", (user_id,)
+                "SELECT * FROM all_users WHERE id = %s", (str(user_id),)
             )
             assert isinstance(result, User)
             assert result.id == user_id
@@ -125,7 +178,7 @@ class TestPostgresUserRepository:
             # Then
             assert mock_conn.cursor.call_count == 1
             mock_cursor.execute.assert_called_once_with(
-                "SELECT * FROM users WHERE email = %s", (email.value,)
+                "SELECT * FROM all_users WHERE email = %s", (email.value,)
             )
             assert isinstance(result, User)
             assert result.id == user_id
@@ -134,3 +187,450 @@ class TestPostgresUserRepository:
             assert result.is_active is False
             assert result.activation_code.value == "1234"
             assert result.activation_code.expires_at == "2025-01-01"
+
+    def test_find_by_email_prepares_statement_once_per_connection(
+        self, prepared_user_repository, open_connection
+    ):
+        # Given
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = None
+        open_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        email = Email("test@spookymotion.com")
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.connection_pool.psycopg2.connect",
+            return_value=open_connection,
+        ) as mock_connect:
+            # When
+            prepared_user_repository.find_by_email(email)
+            prepared_user_repository.find_by_email(email)
+
+        # Then
+        mock_connect.assert_called_once()
+        assert [c.args for c in mock_cursor.execute.call_args_list] == [
+            ("PREPARE find_user_by_email AS SELECT * FROM all_users WHERE email = $1",),
+            ("EXECUTE find_user_by_email (%s)", (email.value,)),
+            ("EXECUTE find_user_by_email (%s)", (email.value,)),
+        ]
+
+    def test_statement_timeout_follows_request_deadline(
+        self, prepared_user_repository, open_connection
+    ):
+        # Given
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = None
+        open_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        open_connection.prepared_statements.add("find_user_by_email")
+        email = Email("test@spookymotion.com")
+        token = set_deadline(2.0)
+
+        try:
+            with patch(
+                "src.infrastructure.adapter.outbound.repository.connection_pool.psycopg2.connect",
+                return_value=open_connection,
+            ):
+                # When
+                prepared_user_repository.find_by_email(email)
+        finally:
+            reset_deadline(token)
+
+        # Then
+        sql, params = mock_cursor.execute.call_args.args
+        timeout_ms = int(sql.split("statement_timeout = ")[1].split(";")[0])
+        assert 1900 < timeout_ms <= 2000
+        assert sql.endswith("; EXECUTE find_user_by_email (%s)")
+        assert params == (email.value,)
+
+    def test_cancelled_statement_raises_deadline_exceeded(
+        self, user_repository, open_connection
+    ):
+        # Given
+        mock_cursor = MagicMock()
+        mock_cursor.execute.side_effect = psycopg2.errors.QueryCanceled()
+        open_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        token = set_deadline(1.0)
+
+        try:
+            with patch(
+                "src.infrastructure.adapter.outbound.repository.connection_pool.psycopg2.connect",
+                return_value=open_connection,
+            ):
+                # When / Then
+                with pytest.raises(DeadlineExceededException):
+                    user_repository.find_by_id(uuid.uuid4())
+        finally:
+            reset_deadline(token)
+
+    def test_find_by_id_prepares_again_when_session_lost_statements(
+        self, prepared_user_repository, open_connection
+    ):
+        # Given
+        user_id = uuid.uuid4()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = None
+        mock_cursor.execute.side_effect = [
+            psycopg2.errors.InvalidSqlStatementName(),
+            None,
+            None,
+        ]
+        open_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        open_connection.prepared_statements = {"find_user_by_id", "save_user"}
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.connection_pool.psycopg2.connect",
+            return_value=open_connection,
+        ):
+            # When
+            result = prepared_user_repository.find_by_id(user_id)
+
+        # Then
+        assert result is None
+        open_connection.rollback.assert_called_once()
+        assert open_connection.prepared_statements == {"find_user_by_id"}
+        assert mock_cursor.execute.call_args_list[-1].args == (
+            "EXECUTE find_user_by_id (%s)",
+            (str(user_id),),
+        )
+
+    def test_save_retries_on_fresh_connection_after_reset(
+        self, user_repository, open_connection
+    ):
+        # Given
+        user = User(
+            id=uuid.uuid4(),
+            email=Email("test@spookymotion.com"),
+            password_hash="hashed_password",
+        )
+        broken_conn = MagicMock()
+        broken_conn.closed = 2
+        broken_conn.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            psycopg2.OperationalError("server closed the connection unexpectedly")
+        )
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.connection_pool.psycopg2.connect",
+            side_effect=[broken_conn, open_connection],
+        ):
+            # When
+            user_repository.save(user)
+
+        # Then
+        broken_conn.close.assert_called_once()
+        open_connection.commit.assert_called_once()
+
+    def test_find_by_ids(self, user_repository):
+        # Given
+        user_ids = [uuid.uuid4(), uuid.uuid4()]
+        mock_rows = [
+            {
+                "id": str(user_ids[0]),
+                "email": "test@spookymotion.com",
+                "password_hash": "hashed_password",
+                "is_active": True,
+                "activation_code": None,
+                "code_expires_at": None,
+            }
+        ]
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+
+        mock_cursor.fetchall.return_value = mock_rows
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            result = user_repository.find_by_ids(user_ids)
+
+            # Then
+            mock_cursor.execute.assert_called_once_with(
+                "SELECT * FROM all_users WHERE id = ANY(%s)",
+                ([str(user_id) for user_id in user_ids],),
+            )
+            assert [user.id for user in result] == [str(user_ids[0])]
+            assert result[0].is_active is True
+
+    def test_find_by_ids_without_ids_skips_query(self, user_repository):
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+        ) as mock_connect:
+            assert user_repository.find_by_ids([]) == []
+            mock_connect.assert_not_called()
+
+    def test_stream_all_uses_named_cursor(self, user_repository):
+        # Given
+        mock_rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "email": f"user{i}@spookymotion.com",
+                "password_hash": "hashed_password",
+                "is_active": True,
+                "activation_code": None,
+                "code_expires_at": None,
+            }
+            for i in range(3)
+        ]
+
+        mock_conn = MagicMock()
+        mock_conn.closed = 0
+        mock_conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter(mock_rows)
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            result = list(user_repository.stream_all(fetch_size=2))
+
+            # Then
+            assert [user.email.value for user in result] == [
+                "user0@spookymotion.com",
+                "user1@spookymotion.com",
+                "user2@spookymotion.com",
+            ]
+            assert mock_conn.cursor.call_args.args == ("stream_users",)
+            assert mock_cursor.itersize == 2
+            mock_cursor.execute.assert_called_once_with("SELECT * FROM all_users")
+            mock_conn.rollback.assert_called_once()
+
+    def test_list_page_continues_after_keyset(self, user_repository):
+        # Given
+        after = (datetime(2025, 1, 1, tzinfo=timezone.utc), str(uuid.uuid4()))
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            result = user_repository.list_page(50, after, is_active=False)
+
+            # Then
+            assert result == []
+            mock_cursor.execute.assert_called_once_with(
+                "SELECT * FROM all_users WHERE (created_at, id) > (%s, %s) AND is_active = %s "
+                "ORDER BY created_at, id LIMIT %s",
+                (*after, False, 50),
+            )
+
+    def test_list_page_of_pending_expired_users(self, user_repository):
+        # Given
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            user_repository.list_page(50, pending_expired=True)
+
+            # Then
+            mock_cursor.execute.assert_called_once_with(
+                "SELECT * FROM all_users WHERE NOT is_active AND code_expires_at <= now() "
+                "ORDER BY created_at, id LIMIT %s",
+                (50,),
+            )
+
+    def test_mark_active_updates_pending_user(self, user_repository):
+        # Given
+        user_id = uuid.uuid4()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = {
+            "id": str(user_id),
+            "email": "test@spookymotion.com",
+            "password_hash": "hashed_password",
+            "is_active": True,
+            "activation_code": None,
+            "code_expires_at": None,
+        }
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            result = user_repository.mark_active(user_id)
+
+            # Then
+            query, params = mock_cursor.execute.call_args.args
+            assert (
+                query.split()
+                == (
+                    "WITH promoted AS ( DELETE FROM pending_users WHERE id = %s "
+                    "RETURNING id, email, password_hash, created_at ) "
+                    "INSERT INTO users (id, email, password_hash, is_active, "
+                    "activation_code, code_expires_at, created_at) "
+                    "SELECT id, email, password_hash, true, NULL, NULL, created_at "
+                    "FROM promoted RETURNING *"
+                ).split()
+            )
+            assert params == (str(user_id),)
+            assert result.is_active is True
+            mock_conn.commit.assert_called_once()
+
+    def test_delete_removes_pending_and_active_rows(self, user_repository):
+        # Given
+        user_id = uuid.uuid4()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            user_repository.delete(user_id)
+
+            # Then
+            query, params = mock_cursor.execute.call_args.args
+            assert (
+                query.split()
+                == (
+                    "WITH pending AS (DELETE FROM pending_users WHERE id = %s) "
+                    "DELETE FROM users WHERE id = %s"
+                ).split()
+            )
+            assert params == (str(user_id), str(user_id))
+            mock_conn.commit.assert_called_once()
+
+    def test_save_many_upserts_each_table_in_one_transaction(self, user_repository):
+        # Given
+        pending = User(
+            id=uuid.uuid4(),
+            email=Email("pending@spookymotion.com"),
+            password_hash="hashed_password",
+        )
+        stale = User(
+            id=uuid.uuid4(),
+            email=Email("active@spookymotion.com"),
+            password_hash="old_hash",
+        )
+        active = User(
+            id=stale.id,
+            email=Email("active@spookymotion.com"),
+            password_hash="hashed_password",
+            is_active=True,
+        )
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ), patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.execute_values"
+        ) as mock_execute_values:
+            # When
+            user_repository.save_many([pending, stale, active])
+
+            # Then
+            (pending_call, active_call) = mock_execute_values.call_args_list
+            assert "INSERT INTO pending_users" in pending_call.args[1]
+            assert [row[1] for row in pending_call.args[2]] == [
+                "pending@spookymotion.com"
+            ]
+            assert "INSERT INTO users" in active_call.args[1]
+            assert [row[2] for row in active_call.args[2]] == ["hashed_password"]
+            mock_conn.commit.assert_called_once()
+
+    def test_statements_are_timed_for_the_slow_query_log(self):
+        # Given
+        slow_queries = MagicMock(spec=SlowQueryLog)
+        repository = PostgresUserRepository(
+            DatabaseConfig(prepared_statements=False), slow_queries=slow_queries
+        )
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = None
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            repository.find_by_email(Email("test@spookymotion.com"))
+
+            # Then
+            name, sql, params, duration, explain = slow_queries.record.call_args.args
+            assert name == "find_user_by_email"
+            assert sql == "SELECT * FROM all_users WHERE email = %s"
+            assert params == ("test@spookymotion.com",)
+            assert duration >= 0
+            assert explain == repository._explain
+
+    def test_slow_query_is_recorded_after_commit(self):
+        # Given
+        slow_queries = MagicMock(spec=SlowQueryLog)
+        repository = PostgresUserRepository(
+            DatabaseConfig(prepared_statements=False), slow_queries=slow_queries
+        )
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value.fetchone.return_value = (
+            None
+        )
+        calls = MagicMock()
+        calls.attach_mock(mock_conn.commit, "commit")
+        calls.attach_mock(slow_queries.record, "record")
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            repository.find_by_email(Email("test@spookymotion.com"))
+
+            # Then
+            assert [name for name, _, _ in calls.mock_calls] == ["commit", "record"]
+
+    @pytest.mark.parametrize(
+        "sql, explain",
+        [
+            (
+                "SELECT * FROM all_users WHERE email = %s",
+                "EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM all_users WHERE email = %s",
+            ),
+            (
+                "DELETE FROM users WHERE id = %s",
+                "EXPLAIN DELETE FROM users WHERE id = %s",
+            ),
+        ],
+    )
+    def test_only_reads_are_explained_with_analyze(self, sql, explain):
+        # Given
+        slow_queries = MagicMock(spec=SlowQueryLog)
+        slow_queries.config = SlowQueryConfig()
+        repository = PostgresUserRepository(
+            DatabaseConfig(prepared_statements=False), slow_queries=slow_queries
+        )
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [("Seq Scan on users",)]
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch(
+            "src.infrastructure.adapter.outbound.repository.postgres_user_repository.psycopg2.connect",
+            return_value=mock_conn,
+        ):
+            # When
+            repository._explain(sql, ("value",))
+
+            # Then
+            mock_cursor.execute.assert_called_with(explain, ("value",))
+            mock_conn.rollback.assert_called_once()
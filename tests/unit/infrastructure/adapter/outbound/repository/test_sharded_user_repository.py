@@ -0,0 +1,200 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.model import Email, User
+from src.infrastructure.adapter.outbound.repository import (
+    InMemoryShardRoutingIndex,
+    ShardedUserRepository,
+    shard_for_email,
+)
+from src.infrastructure.adapter.outbound.repository.sharded_user_repository import (
+    jump_hash,
+)
+from tests.support import InMemoryUserRepository
+
+
+def make_user(email: str, created_at: datetime = None) -> User:
+    return User(
+        id=uuid.uuid4(),
+        email=Email(email),
+        password_hash="hashed_password",
+        created_at=created_at,
+    )
+
+
+@pytest.fixture
+def shards():
+    return [InMemoryUserRepository() for _ in range(3)]
+
+
+@pytest.fixture
+def repository(shards):
+    return ShardedUserRepository(shards, InMemoryShardRoutingIndex())
+
+
+class TestShardForEmail:
+    def test_shard_ignores_case_and_surrounding_spaces(self):
+        # When / Then
+        assert shard_for_email(Email("Ghost@SpookyMotion.com"), 8) == shard_for_email(
+            Email(" ghost@spookymotion.com"), 8
+        )
+
+    def test_appending_a_shard_only_moves_keys_to_it(self):
+        # Given
+        keys = range(10_000)
+
+        # When
+        moved = [key for key in keys if jump_hash(key, 4) != jump_hash(key, 5)]
+
+        # Then
+        assert all(jump_hash(key, 5) == 4 for key in moved)
+        assert 1500 < len(moved) < 2500
+
+
+class TestShardedUserRepository:
+    def test_user_is_saved_on_the_shard_of_its_email(self, repository, shards):
+        # Given
+        user = make_user("ghost@spookymotion.com")
+
+        # When
+        repository.save(user)
+
+        # Then
+        shard = shard_for_email(user.email, 3)
+        assert shards[shard].find_by_id(user.id) is not None
+        assert repository.find_by_email(user.email).id == user.id
+        assert repository.find_by_id(user.id).email == user.email
+
+    def test_save_many_writes_each_shard_once(self, shards):
+        # Given
+        counting = [MagicMock(wraps=shard) for shard in shards]
+        repository = ShardedUserRepository(counting, InMemoryShardRoutingIndex())
+        users = [make_user(f"user{index}@spookymotion.com") for index in range(20)]
+
+        # When
+        repository.save_many(users)
+
+        # Then
+        assert all(shard.save_many.call_count == 1 for shard in counting)
+        for user in users:
+            assert repository.find_by_id(user.id).email == user.email
+
+    def test_mark_active_is_routed_by_id(self, repository):
+        # Given
+        user = make_user("ghost@spookymotion.com")
+        repository.save(user)
+
+        # When
+        activated = repository.mark_active(user.id)
+
+        # Then
+        assert activated.is_active is True
+        assert repository.mark_active(user.id) is None
+        assert repository.mark_active(uuid.uuid4()) is None
+
+    def test_find_by_ids_collects_users_of_every_shard(self, repository):
+        # Given
+        users = [make_user(f"user{index}@spookymotion.com") for index in range(20)]
+        for user in users:
+            repository.save(user)
+
+        # When
+        found = repository.find_by_ids([user.id for user in users] + [uuid.uuid4()])
+
+        # Then
+        assert {user.id for user in found} == {user.id for user in users}
+
+    def test_list_page_merges_shards_by_creation_date(self, repository):
+        # Given
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        users = [
+            make_user(f"user{index}@spookymotion.com", start + timedelta(minutes=index))
+            for index in range(20)
+        ]
+        for user in users:
+            repository.save(user)
+
+        # When
+        first_page = repository.list_page(limit=8)
+        last = first_page[-1]
+        second_page = repository.list_page(
+            limit=20, after=(last.created_at, str(last.id))
+        )
+
+        # Then
+        assert [user.id for user in first_page + second_page] == [
+            user.id for user in users
+        ]
+
+    def test_delete_removes_user_and_route(self, repository):
+        # Given
+        user = make_user("ghost@spookymotion.com")
+        repository.save(user)
+
+        # When
+        repository.delete(user.id)
+
+        # Then
+        assert repository.find_by_email(user.email) is None
+        assert repository.index.get(user.id) is None
+
+
+class TestRebalance:
+    def test_appended_shard_receives_its_users(self, shards):
+        # Given
+        index = InMemoryShardRoutingIndex()
+        users = [make_user(f"user{i}@spookymotion.com") for i in range(60)]
+        before = ShardedUserRepository(shards, index)
+        for user in users:
+            before.save(user)
+        after = ShardedUserRepository([*shards, InMemoryUserRepository()], index)
+
+        # When
+        report = after.rebalance()
+
+        # Then
+        assert report.scanned == 60
+        assert report.moved_count > 0
+        assert {target for _, target in report.moved} == {3}
+        assert len(list(after.stream_all())) == 60
+        for user in users:
+            assert after.find_by_email(user.email).id == user.id
+            assert after.find_by_id(user.id).id == user.id
+
+    def test_dry_run_moves_nothing(self, shards):
+        # Given
+        index = InMemoryShardRoutingIndex()
+        before = ShardedUserRepository(shards, index)
+        for i in range(30):
+            before.save(make_user(f"user{i}@spookymotion.com"))
+        after = ShardedUserRepository([*shards, InMemoryUserRepository()], index)
+
+        # When
+        report = after.rebalance(dry_run=True)
+
+        # Then
+        assert report.moved_count > 0
+        assert list(after.shards[3].stream_all()) == []
+
+    def test_reads_shards_in_pages_without_holding_a_cursor(self, shards):
+        # Given
+        index = InMemoryShardRoutingIndex()
+        users = [make_user(f"user{i}@spookymotion.com") for i in range(60)]
+        before = ShardedUserRepository(shards, index)
+        for user in users:
+            before.save(user)
+        after = ShardedUserRepository([*shards, InMemoryUserRepository()], index)
+        for shard in after.shards:
+            shard.stream_all = MagicMock(side_effect=AssertionError("cursor held"))
+
+        # When
+        report = after.rebalance(fetch_size=7)
+
+        # Then
+        assert report.scanned == 60
+        for user in users:
+            assert after.find_by_email(user.email).id == user.id
@@ -0,0 +1,75 @@
+import threading
+import time
+import uuid
+from unittest.mock import MagicMock
+
+from src.domain.model import Email, User
+from src.domain.port import UserRepositoryPort
+from src.infrastructure.adapter.outbound.repository import SingleFlightUserRepository
+
+
+class TestSingleFlightUserRepository:
+    def test_concurrent_find_by_email_share_one_query(self):
+        # Given
+        user = User(
+            id=uuid.uuid4(), email=Email("test@spookymotion.com"), password_hash="h"
+        )
+        started, release = threading.Event(), threading.Event()
+        delegate = MagicMock(spec=UserRepositoryPort)
+
+        def find_by_email(email):
+            started.set()
+            release.wait(timeout=5)
+            return user
+
+        delegate.find_by_email.side_effect = find_by_email
+        repository = SingleFlightUserRepository(delegate)
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    repository.find_by_email(Email("test@spookymotion.com"))
+                )
+            )
+            for _ in range(3)
+        ]
+        threads[0].start()
+        started.wait(timeout=5)
+        for thread in threads[1:]:
+            thread.start()
+        call = repository._lookups._calls[("email", "test@spookymotion.com")]
+        while len(call.done._cond._waiters) < 2:
+            time.sleep(0.001)
+
+        # When
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # Then
+        delegate.find_by_email.assert_called_once()
+        assert results == [user] * 3
+        assert len({id(result) for result in results}) == 3
+
+    def test_missing_user_is_returned_as_none(self):
+        # Given
+        delegate = MagicMock(spec=UserRepositoryPort)
+        delegate.find_by_id.return_value = None
+        repository = SingleFlightUserRepository(delegate)
+
+        # When / Then
+        assert repository.find_by_id(uuid.uuid4()) is None
+
+    def test_writes_are_delegated(self):
+        # Given
+        delegate = MagicMock(spec=UserRepositoryPort)
+        repository = SingleFlightUserRepository(delegate)
+        user_id = uuid.uuid4()
+
+        # When
+        repository.mark_active(user_id)
+        repository.delete(user_id)
+
+        # Then
+        delegate.mark_active.assert_called_once_with(user_id)
+        delegate.delete.assert_called_once_with(user_id)
@@ -0,0 +1,103 @@
+import logging
+import threading
+from datetime import datetime
+
+from src.infrastructure.adapter.outbound.repository import SlowQueryLog
+from src.infrastructure.config import SlowQueryConfig
+
+
+def make_log(**overrides) -> SlowQueryLog:
+    config = SlowQueryConfig(threshold_ms=100, explain_sample_rate=1.0, max_entries=2)
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return SlowQueryLog(config, sample=lambda: 0.5)
+
+
+class TestSlowQueryLog:
+    def test_fast_statement_is_ignored(self, caplog):
+        # Given
+        slow_queries = make_log()
+
+        # When
+        with caplog.at_level(logging.WARNING):
+            slow_queries.record("find_user_by_email", "SELECT 1", ("a@b.co",), 0.05)
+
+        # Then
+        assert caplog.records == []
+        assert slow_queries.worst() == []
+
+    def test_slow_statement_is_logged_without_parameters(self, caplog):
+        # Given
+        slow_queries = make_log()
+
+        # When
+        with caplog.at_level(logging.WARNING):
+            slow_queries.record(
+                "save_user",
+                "INSERT INTO users VALUES (%s, %s, %s)",
+                ("ghost@spookymotion.com", "$2b$12$hash", None),
+                0.25,
+            )
+
+        # Then
+        [entry] = caplog.records
+        assert entry.getMessage() == "slow_query"
+        assert entry.duration_ms == 250.0
+        assert entry.params == ["<str>", "<str>", "NULL"]
+        assert "ghost@spookymotion.com" not in str(slow_queries.worst())
+
+    def test_only_the_slowest_statements_are_kept(self):
+        # Given
+        slow_queries = make_log(explain_sample_rate=0.0)
+
+        # When
+        for statement, seconds in (("a", 0.3), ("b", 0.2), ("c", 0.5), ("d", 0.1)):
+            slow_queries.record(statement, "SELECT 1", (), seconds)
+
+        # Then
+        assert [query["statement"] for query in slow_queries.worst()] == ["c", "a"]
+
+    def test_sampled_statement_is_explained_with_literals_redacted(self):
+        # Given
+        slow_queries = make_log()
+        explained = threading.Event()
+
+        def explain(sql, params):
+            explained.set()
+            return (
+                "Seq Scan on users  (actual time=0.1..80.2 rows=1 loops=1)\n"
+                "  Filter: ((email)::text = 'ghost@spookymotion.com'::text)"
+            )
+
+        # When
+        slow_queries.record(
+            "find_user_by_email", "SELECT * FROM users", ("x",), 0.2, explain
+        )
+        explained.wait(timeout=5)
+        slow_queries._explaining.acquire(timeout=5)
+
+        # Then
+        [query] = slow_queries.worst()
+        assert query["seq_scan"] is True
+        assert "ghost@spookymotion.com" not in query["plan"]
+        assert "(email)::text = '?'::text" in query["plan"]
+
+    def test_failed_explain_keeps_the_entry(self, caplog):
+        # Given
+        slow_queries = make_log()
+
+        def explain(sql, params):
+            raise RuntimeError("canceling statement due to statement timeout")
+
+        # When
+        with caplog.at_level(logging.WARNING):
+            slow_queries.record(
+                "list_users", "SELECT 1", (datetime.now(),), 0.2, explain
+            )
+            slow_queries._explaining.acquire(timeout=5)
+
+        # Then
+        [query] = slow_queries.worst()
+        assert query["plan"] is None
+        assert query["params"] == ["<datetime>"]
+        assert "Could not explain" in caplog.text
@@ -0,0 +1,185 @@
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.exception import EmailAlreadyExistsException
+from src.domain.model import ActivationCode, Email, User
+from src.infrastructure.adapter.outbound.repository import SqliteUserRepository
+from src.infrastructure.config import SqliteConfig
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = SqliteUserRepository(SqliteConfig(path=str(tmp_path / "users.db")))
+    yield repository
+    repository.close()
+
+
+def make_user(email: str = "test@spookymotion.com", **fields) -> User:
+    return User(
+        id=uuid.uuid4(),
+        email=Email(email),
+        password_hash="hashed_password",
+        activation_code=ActivationCode.generate_activation_code(),
+        **fields,
+    )
+
+
+class TestSqliteUserRepository:
+    def test_database_runs_in_wal_mode(self, repository):
+        # When
+        journal_mode = repository.connection().execute("PRAGMA journal_mode")
+
+        # Then
+        assert journal_mode.fetchone()[0] == "wal"
+
+    def test_save_and_find_pending_user(self, repository):
+        # Given
+        user = make_user()
+
+        # When
+        repository.save(user)
+        found = repository.find_by_email(user.email)
+
+        # Then
+        assert found.id == str(user.id)
+        assert found.is_active is False
+        assert found.activation_code == user.activation_code
+        assert found.created_at is not None
+        assert repository.find_by_id(user.id).email == user.email
+
+    def test_saving_same_email_updates_code(self, repository):
+        # Given
+        user = make_user()
+        repository.save(user)
+        new_code = ActivationCode("4321", user.activation_code.expires_at)
+
+        # When
+        repository.save(
+            User(
+                id=uuid.uuid4(),
+                email=user.email,
+                password_hash="new_hash",
+                activation_code=new_code,
+            )
+        )
+        found = repository.find_by_email(user.email)
+
+        # Then
+        assert found.id == str(user.id)
+        assert found.password_hash == "new_hash"
+        assert found.activation_code.value == "4321"
+
+    def test_saving_active_user_promotes_it(self, repository):
+        # Given
+        user = make_user()
+        repository.save(user)
+        user.activate(user.activation_code.value)
+
+        # When
+        repository.save(user)
+
+        # Then
+        conn = repository.connection()
+        assert conn.execute("SELECT count(*) FROM pending_users").fetchone()[0] == 0
+        assert repository.find_by_id(user.id).is_active is True
+
+    def test_save_many_saves_in_order(self, repository):
+        # Given
+        user = make_user()
+        others = [make_user(f"user{i}@spookymotion.com") for i in range(3)]
+        activated = User(
+            id=user.id, email=user.email, password_hash="h", is_active=True
+        )
+
+        # When
+        repository.save_many([user, *others, activated])
+
+        # Then
+        assert repository.find_by_email(user.email).is_active is True
+        assert len(repository.find_by_ids([other.id for other in others])) == 3
+
+    def test_email_is_unique_across_pending_and_active_users(self, repository):
+        # Given
+        active = User(
+            id=uuid.uuid4(),
+            email=Email("test@spookymotion.com"),
+            password_hash="h",
+            is_active=True,
+        )
+        repository.save(active)
+
+        # When / Then
+        with pytest.raises(EmailAlreadyExistsException):
+            repository.save(make_user("test@spookymotion.com"))
+        assert repository.find_by_email(active.email).id == str(active.id)
+
+    def test_mark_active_only_activates_pending_users(self, repository):
+        # Given
+        user = make_user()
+        repository.save(user)
+
+        # When
+        activated = repository.mark_active(user.id)
+
+        # Then
+        assert activated.is_active is True
+        assert activated.activation_code.value is None
+        assert repository.mark_active(user.id) is None
+        assert repository.find_by_email(user.email).is_active is True
+
+    def test_list_page_uses_keyset_and_filters(self, repository):
+        # Given
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        users = [
+            make_user(f"user{i}@spookymotion.com", created_at=start + timedelta(i))
+            for i in range(5)
+        ]
+        for user in users:
+            repository.save(user)
+        repository.mark_active(users[3].id)
+
+        # When
+        first_page = repository.list_page(limit=2)
+        last = first_page[-1]
+        rest = repository.list_page(limit=10, after=(last.created_at, str(last.id)))
+        active = repository.list_page(limit=10, is_active=True)
+
+        # Then
+        assert [user.id for user in first_page + rest] == [
+            str(user.id) for user in users
+        ]
+        assert [user.id for user in active] == [str(users[3].id)]
+
+    def test_stream_all_and_find_by_ids(self, repository):
+        # Given
+        users = [make_user(f"user{i}@spookymotion.com") for i in range(7)]
+        for user in users:
+            repository.save(user)
+
+        # When
+        streamed = list(repository.stream_all(fetch_size=3))
+        found = repository.find_by_ids([users[0].id, users[6].id, uuid.uuid4()])
+
+        # Then
+        assert len(streamed) == 7
+        assert {user.id for user in found} == {str(users[0].id), str(users[6].id)}
+
+    def test_each_thread_uses_its_own_connection(self, repository):
+        # Given
+        connections = []
+
+        # When
+        threads = [
+            threading.Thread(target=lambda: connections.append(repository.connection()))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        assert len({id(conn) for conn in connections}) == 3
@@ -0,0 +1,133 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.adapter.outbound.stats import (
+    FunnelRollupStore,
+    RegistrationFunnel,
+)
+from src.infrastructure.config import FunnelStatsConfig
+from tests.support import InMemoryFunnelRollupStore
+
+NOON = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+
+class FakeNow:
+    def __init__(self):
+        self.now = NOON
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class TestRegistrationFunnel:
+    @pytest.fixture
+    def now(self):
+        return FakeNow()
+
+    @pytest.fixture
+    def store(self):
+        return InMemoryFunnelRollupStore()
+
+    @pytest.fixture
+    def funnel(self, store, now):
+        config = FunnelStatsConfig(
+            flush_interval_seconds=3600, latency_buckets_seconds=(10, 60)
+        )
+        return RegistrationFunnel(store, config, now)
+
+    def test_summary_of_unflushed_counts(self, funnel, store):
+        # Given
+        for _ in range(4):
+            funnel.record_registered()
+        funnel.record_activated(timedelta(seconds=5))
+        funnel.record_activated(timedelta(seconds=40))
+        funnel.record_expired()
+        store.expirations = [NOON - timedelta(minutes=10), NOON + timedelta(minutes=5)]
+
+        # When
+        summary = funnel.summary(hours=1)
+
+        # Then
+        assert store.totals(NOON - timedelta(days=1)) == Counter()
+        assert summary["since"] == "2026-01-01T12:00:00+00:00"
+        assert summary["registered"] == 4
+        assert summary["activated"] == 2
+        assert summary["expired"] == 1
+        assert summary["expired_attempts"] == 1
+        assert summary["activation_rate"] == 0.5
+        latency = summary["activation_latency"]
+        assert latency["mean_seconds"] == 22.5
+        assert latency["buckets"] == [
+            {"le": 10, "count": 1},
+            {"le": 60, "count": 1},
+            {"le": "+Inf", "count": 0},
+        ]
+        assert (latency["p50_seconds"], latency["p99_seconds"]) == (10, 60)
+
+    def test_flush_adds_hourly_counts_to_store(self, funnel, store, now):
+        # Given
+        funnel.record_registered()
+        now.now = NOON + timedelta(hours=1)
+        funnel.record_registered()
+        funnel.record_activated(timedelta(minutes=5))
+
+        # When
+        funnel.flush()
+
+        # Then
+        assert store.totals(NOON.replace(minute=0))["registered"] == 2
+        assert store.totals(NOON.replace(minute=0) + timedelta(hours=1)) == Counter(
+            {
+                "registered": 1,
+                "activated": 1,
+                "activation_seconds_sum": 300.0,
+                "activation_seconds_le_inf": 1,
+            }
+        )
+        summary = funnel.summary(hours=1)
+        assert summary["registered"] == 1
+        assert summary["activation_latency"]["p90_seconds"] == "+Inf"
+
+    def test_summary_window_excludes_older_hours(self, funnel, store, now):
+        # Given
+        funnel.record_registered()
+        funnel.flush()
+
+        # When
+        now.now = NOON + timedelta(hours=3)
+        summary = funnel.summary(hours=3)
+
+        # Then
+        assert summary["registered"] == 0
+        assert summary["activation_rate"] is None
+        assert summary["activation_latency"]["p50_seconds"] is None
+
+    def test_counts_kept_when_flush_fails(self, now):
+        # Given
+        store = MagicMock(spec=FunnelRollupStore)
+        store.add.side_effect = [OSError("connection refused"), None]
+        store.totals.return_value = Counter()
+        funnel = RegistrationFunnel(store, FunnelStatsConfig(), now)
+        funnel.record_registered()
+
+        # When
+        funnel.flush()
+        funnel.flush()
+
+        # Then
+        assert store.add.call_count == 2
+        (counts,) = store.add.call_args.args
+        assert counts == {NOON.replace(minute=0): Counter({"registered": 1})}
+
+    def test_close_flushes(self, funnel, store):
+        # Given
+        funnel.record_expired()
+
+        # When
+        funnel.close()
+
+        # Then
+        assert store.totals(NOON - timedelta(days=1))["expired_attempts"] == 1
@@ -0,0 +1,91 @@
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.model import ActivationCode, Email, User
+from src.infrastructure.adapter.outbound.repository import SqliteUserRepository
+from src.infrastructure.adapter.outbound.stats import SqliteFunnelRollupStore
+from src.infrastructure.config import SqliteConfig
+
+NOON = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = SqliteUserRepository(SqliteConfig(path=str(tmp_path / "users.db")))
+    yield repository
+    repository.close()
+
+
+@pytest.fixture
+def store(repository):
+    return SqliteFunnelRollupStore(repository)
+
+
+def pending_user(email: str, created_at: datetime, code_expires_at=None) -> User:
+    return User(
+        id=uuid.uuid4(),
+        email=Email(email),
+        password_hash="hashed_password",
+        activation_code=(
+            ActivationCode("1234", code_expires_at) if code_expires_at else None
+        ),
+        created_at=created_at,
+    )
+
+
+class TestSqliteFunnelRollupStore:
+    def test_counts_persist_across_stores(self, repository, tmp_path):
+        # Given
+        SqliteFunnelRollupStore(repository).add(
+            {
+                NOON: Counter({"registered": 2}),
+                NOON - timedelta(hours=2): Counter({"registered": 1}),
+            }
+        )
+        SqliteFunnelRollupStore(repository).add({NOON: Counter({"registered": 1})})
+
+        # When
+        other_worker = SqliteUserRepository(
+            SqliteConfig(path=str(tmp_path / "users.db"))
+        )
+        try:
+            totals = SqliteFunnelRollupStore(other_worker).totals(
+                NOON - timedelta(hours=1)
+            )
+        finally:
+            other_worker.close()
+
+        # Then
+        assert totals == Counter({"registered": 3.0})
+
+    def test_expired_registrations_of_codes_and_links(self, repository, store):
+        # Given
+        repository.save(
+            pending_user(
+                "code@spookymotion.com",
+                NOON - timedelta(minutes=20),
+                code_expires_at=NOON - timedelta(minutes=5),
+            )
+        )
+        repository.save(
+            pending_user(
+                "fresh-code@spookymotion.com",
+                NOON,
+                code_expires_at=NOON + timedelta(minutes=15),
+            )
+        )
+        repository.save(
+            pending_user("link@spookymotion.com", NOON - timedelta(hours=1))
+        )
+        repository.save(pending_user("fresh-link@spookymotion.com", NOON))
+
+        # When
+        expired = store.expired_registrations(
+            NOON - timedelta(hours=1), NOON, link_ttl=timedelta(minutes=15)
+        )
+
+        # Then
+        assert expired == 2
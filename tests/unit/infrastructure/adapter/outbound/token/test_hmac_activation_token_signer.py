@@ -0,0 +1,76 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.exception import (
+    ExpiredActivationCodeException,
+    InvalidActivationCodeException,
+)
+from src.infrastructure.adapter.outbound.token import HmacActivationTokenSigner
+
+
+class TestHmacActivationTokenSigner:
+    @pytest.fixture
+    def signer(self):
+        return HmacActivationTokenSigner({"2025-01": b"secret"}, "2025-01")
+
+    @pytest.fixture
+    def expires_at(self):
+        return datetime.now(timezone.utc) + timedelta(minutes=15)
+
+    def test_verify_issued_token(self, signer, expires_at):
+        # Given
+        user_id = uuid.uuid4()
+
+        # When
+        token = signer.issue(user_id, expires_at)
+
+        # Then
+        assert token.startswith("2025-01.")
+        assert signer.verify(token) == user_id
+
+    def test_verify_rejects_tampered_token(self, signer, expires_at):
+        # Given
+        key_id, payload, signature = signer.issue(uuid.uuid4(), expires_at).split(".")
+        forged_payload = signer.issue(uuid.uuid4(), expires_at).split(".")[1]
+
+        # When/Then
+        with pytest.raises(InvalidActivationCodeException):
+            signer.verify(f"{key_id}.{forged_payload}.{signature}")
+
+    @pytest.mark.parametrize("token", ["", "garbage", "a.b.c", "2025-01.!!.??"])
+    def test_verify_rejects_malformed_token(self, signer, token):
+        with pytest.raises(InvalidActivationCodeException):
+            signer.verify(token)
+
+    def test_verify_rejects_expired_token(self, signer):
+        # Given
+        token = signer.issue(
+            uuid.uuid4(), datetime.now(timezone.utc) - timedelta(seconds=1)
+        )
+
+        # When/Then
+        with pytest.raises(ExpiredActivationCodeException):
+            signer.verify(token)
+
+    def test_rotated_keys_verify_tokens_of_previous_key(self, signer, expires_at):
+        # Given
+        user_id = uuid.uuid4()
+        token = signer.issue(user_id, expires_at)
+        rotated = HmacActivationTokenSigner(
+            {"2025-02": b"new secret", "2025-01": b"secret"}, "2025-02"
+        )
+
+        # When/Then
+        assert rotated.verify(token) == user_id
+        assert rotated.issue(user_id, expires_at).startswith("2025-02.")
+
+    def test_verify_rejects_token_of_retired_key(self, signer, expires_at):
+        # Given
+        token = signer.issue(uuid.uuid4(), expires_at)
+        rotated = HmacActivationTokenSigner({"2025-02": b"new secret"}, "2025-02")
+
+        # When/Then
+        with pytest.raises(InvalidActivationCodeException):
+            rotated.verify(token)
@@ -0,0 +1,20 @@
+from src.infrastructure.config import DatabaseConfig
+
+
+class TestDatabaseConfig:
+    def test_prepared_statements_by_default(self, monkeypatch):
+        # Given
+        monkeypatch.delenv("DB_PREPARED_STATEMENTS", raising=False)
+
+        # When / Then
+        assert DatabaseConfig().prepared_statements is True
+
+    def test_prepared_statements_can_be_disabled_from_environment(self, monkeypatch):
+        # Given
+        monkeypatch.setenv("DB_PREPARED_STATEMENTS", "false")
+
+        # When
+        config = DatabaseConfig()
+
+        # Then
+        assert config.prepared_statements is False
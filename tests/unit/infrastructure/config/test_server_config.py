@@ -0,0 +1,72 @@
+import pytest
+
+from src.infrastructure.config import ServerConfig
+from src.infrastructure.config.server_config import available_cpus
+
+
+class TestServerConfig:
+    def test_pool_size_splits_connection_budget_between_workers(self):
+        # Given
+        config = ServerConfig(
+            workers=8,
+            threadpool_size=40,
+            db_max_connections=100,
+            db_reserved_connections=10,
+        )
+
+        # When
+        pool_size = config.db_pool_size_per_worker
+
+        # Then
+        assert pool_size == 11
+        assert config.worker_count * pool_size <= 90
+
+    def test_pool_size_is_capped_by_threadpool(self):
+        # Given
+        config = ServerConfig(
+            workers=2,
+            threadpool_size=20,
+            db_max_connections=500,
+            db_reserved_connections=10,
+        )
+
+        # When / Then
+        assert config.db_pool_size_per_worker == 20
+
+    def test_too_many_workers_for_budget_raise_error(self):
+        # Given
+        config = ServerConfig(
+            workers=16, db_max_connections=20, db_reserved_connections=10
+        )
+
+        # When / Then
+        with pytest.raises(ValueError, match="16 workers exceed"):
+            config.db_pool_size_per_worker
+
+    def test_worker_count_defaults_to_available_cpus(self):
+        # Given
+        config = ServerConfig(workers=0)
+
+        # When / Then
+        assert config.worker_count == available_cpus()
+
+
+class TestAvailableCpus:
+    def test_cgroup_quota_limits_cpus(self, tmp_path):
+        # Given
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+
+        # When
+        cpus = available_cpus(cpu_max)
+
+        # Then
+        assert cpus == min(2, available_cpus(tmp_path / "missing"))
+
+    def test_unlimited_cgroup_uses_affinity(self, tmp_path):
+        # Given
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("max 100000\n")
+
+        # When / Then
+        assert available_cpus(cpu_max) == available_cpus(tmp_path / "missing")
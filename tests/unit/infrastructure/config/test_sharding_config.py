@@ -0,0 +1,23 @@
+from src.infrastructure.config import DatabaseConfig, ShardingConfig
+
+
+class TestShardingConfig:
+    def test_shards_share_base_credentials(self):
+        # Given
+        base = DatabaseConfig(host="directory", port=5432, database="users", user="u")
+        config = ShardingConfig(shards=["shard-0", "shard-1:6432/users_1"])
+
+        # When
+        shard_configs = config.shard_configs(base)
+
+        # Then
+        assert [(c.host, c.port, c.database) for c in shard_configs] == [
+            ("shard-0", 5432, "users"),
+            ("shard-1", 6432, "users_1"),
+        ]
+        assert all(c.user == "u" for c in shard_configs)
+
+    def test_sharding_is_disabled_without_shards(self):
+        # When / Then
+        assert ShardingConfig(shards=[]).enabled is False
+        assert ShardingConfig(shards=[]).shard_configs(DatabaseConfig()) == []
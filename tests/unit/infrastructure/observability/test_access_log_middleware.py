@@ -0,0 +1,55 @@
+import asyncio
+import logging
+
+import pytest
+
+from src.infrastructure.config import LoggingConfig
+from src.infrastructure.observability import AccessLogMiddleware
+
+
+def serve(middleware_config, method, path, status, sample=lambda: 0.5):
+    async def endpoint(scope, receive, send):
+        await send({"type": "http.response.start", "status": status})
+
+    async def send(message):
+        pass
+
+    middleware = AccessLogMiddleware(endpoint, middleware_config, sample)
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    asyncio.run(middleware(scope, None, send))
+
+
+class TestAccessLogMiddleware:
+    @pytest.fixture
+    def config(self):
+        return LoggingConfig(access_log_sample_rates={"GET /live": 0.1})
+
+    def test_request_is_logged(self, config, caplog):
+        # When
+        with caplog.at_level(logging.INFO, logger="access"):
+            serve(config, "POST", "/api/v1/users/register", 201)
+
+        # Then
+        [entry] = caplog.records
+        assert entry.getMessage() == "request"
+        assert entry.method == "POST"
+        assert entry.status == 201
+        assert entry.duration_ms >= 0
+
+    def test_high_volume_route_is_sampled(self, config, caplog):
+        # When
+        with caplog.at_level(logging.INFO, logger="access"):
+            serve(config, "GET", "/live", 200, sample=lambda: 0.5)
+            serve(config, "GET", "/live", 200, sample=lambda: 0.05)
+
+        # Then
+        assert len(caplog.records) == 1
+        assert caplog.records[0].sample_rate == 0.1
+
+    def test_server_errors_are_always_logged(self, config, caplog):
+        # When
+        with caplog.at_level(logging.INFO, logger="access"):
+            serve(config, "GET", "/live", 503, sample=lambda: 0.99)
+
+        # Then
+        assert caplog.records[0].status == 503
@@ -0,0 +1,105 @@
+import tracemalloc
+import uuid
+from collections import Counter
+
+import pytest
+
+from src.domain.model import ActivationCode, Email, User
+from src.infrastructure.config import ProfilingConfig
+from src.infrastructure.observability import AllocationProfiler
+
+
+@pytest.fixture
+def profiler():
+    profiler = AllocationProfiler(ProfilingConfig(max_snapshots=2))
+    yield profiler
+    profiler.stop()
+
+
+def create_users(count: int) -> list[User]:
+    return [
+        User(
+            id=uuid.uuid4(),
+            email=Email(f"user{index}@spookymotion.com"),
+            password_hash="hashed_password",
+            activation_code=ActivationCode.generate_activation_code(),
+        )
+        for index in range(count)
+    ]
+
+
+class TestAllocationProfiler:
+    def test_snapshot_requires_tracing(self, profiler):
+        # When / Then
+        with pytest.raises(ValueError, match="not tracing"):
+            profiler.take_snapshot()
+
+    def test_diff_attributes_growth_to_domain(self, profiler):
+        # Given
+        profiler.start(frames=10)
+        base = profiler.take_snapshot()
+        users = create_users(500)
+        snapshot = profiler.take_snapshot()
+
+        # When
+        diff = profiler.diff(base["id"], snapshot["id"], limit=3)
+
+        # Then
+        groups = {group["group"]: group for group in diff["groups"]}
+        assert groups["domain"]["size_bytes"] > 0
+        assert any(
+            "src/domain/model/" in site["site"]
+            for site in groups["domain"]["top_sites"]
+        )
+        assert len(users) == 500
+
+    def test_top_lists_groups_by_size(self, profiler):
+        # Given
+        profiler.start()
+        snapshot = profiler.take_snapshot()
+
+        # When
+        top = profiler.top(snapshot["id"], limit=1)
+
+        # Then
+        sizes = [group["size_bytes"] for group in top["groups"]]
+        assert sizes == sorted(sizes, reverse=True)
+        assert all(len(group["top_sites"]) <= 1 for group in top["groups"])
+
+    def test_oldest_snapshots_are_dropped(self, profiler):
+        # Given
+        profiler.start()
+        first = profiler.take_snapshot()
+
+        # When
+        profiler.take_snapshot()
+        profiler.take_snapshot()
+
+        # Then
+        assert first["id"] not in profiler.status()["snapshots"]
+        with pytest.raises(KeyError):
+            profiler.top(first["id"])
+
+    def test_stop_ends_tracing(self, profiler):
+        # Given
+        profiler.start()
+
+        # When
+        status = profiler.stop()
+
+        # Then
+        assert status["tracing"] is False
+        assert tracemalloc.is_tracing() is False
+
+    def test_request_allocations_are_averaged_per_route(self, profiler):
+        # When
+        profiler.record_request("GET /x", Counter(User=2, DictRow=4))
+        profiler.record_request("GET /x", Counter(User=1))
+
+        # Then
+        assert profiler.request_allocations() == {
+            "GET /x": {
+                "sampled_requests": 2,
+                "per_request": {"DictRow": 2.0, "User": 1.5},
+            }
+        }
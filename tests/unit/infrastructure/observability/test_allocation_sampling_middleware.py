@@ -0,0 +1,88 @@
+import asyncio
+
+from src.infrastructure.config import ProfilingConfig
+from src.infrastructure.observability import (
+    AllocationProfiler,
+    AllocationSamplingMiddleware,
+)
+from src.infrastructure.observability.allocation_counter import (
+    start_counting,
+    stop_counting,
+    track_instances,
+)
+
+
+class Row:
+    def __init__(self, value):
+        self.value = value
+
+
+track_instances(Row)
+
+
+def serve(profiler, rate, sample=lambda: 0.5):
+    async def endpoint(scope, receive, send):
+        Row(1), Row(2)
+        await send({"type": "http.response.start", "status": 200})
+
+    async def send(message):
+        pass
+
+    middleware = AllocationSamplingMiddleware(
+        endpoint,
+        profiler,
+        ProfilingConfig(allocation_sample_rate=rate, tracked_types=()),
+        sample,
+    )
+    scope = {"type": "http", "method": "GET", "path": "/rows", "headers": []}
+    asyncio.run(middleware(scope, None, send))
+
+
+class TestAllocationCounter:
+    def test_instances_are_only_counted_while_counting(self):
+        # Given
+        Row(0)
+        token = start_counting()
+
+        # When
+        Row(1), Row(2)
+        counts = stop_counting(token)
+        Row(3)
+
+        # Then
+        assert counts == {"Row": 2}
+        assert Row(4).value == 4
+
+    def test_class_is_wrapped_once(self):
+        # Given
+        init = Row.__init__
+
+        # When
+        track_instances(Row)
+
+        # Then
+        assert Row.__init__ is init
+
+
+class TestAllocationSamplingMiddleware:
+    def test_sampled_request_counts_instances(self):
+        # Given
+        profiler = AllocationProfiler()
+
+        # When
+        serve(profiler, rate=1.0)
+
+        # Then
+        assert profiler.request_allocations() == {
+            "GET /rows": {"sampled_requests": 1, "per_request": {"Row": 2.0}}
+        }
+
+    def test_unsampled_request_is_not_recorded(self):
+        # Given
+        profiler = AllocationProfiler()
+
+        # When
+        serve(profiler, rate=0.1, sample=lambda: 0.5)
+
+        # Then
+        assert profiler.request_allocations() == {}
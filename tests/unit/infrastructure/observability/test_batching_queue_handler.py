@@ -0,0 +1,78 @@
+import io
+import json
+import logging
+
+from src.infrastructure.observability import BatchingQueueHandler, JsonFormatter
+
+
+def record(message: str) -> logging.LogRecord:
+    return logging.makeLogRecord(
+        {"name": "test", "levelno": logging.INFO, "levelname": "INFO", "msg": message}
+    )
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+class TestBatchingQueueHandler:
+    def test_records_are_written_in_batches(self):
+        # Given
+        stream = CountingStream()
+        handler = BatchingQueueHandler(stream, batch_size=10, flush_interval_seconds=5)
+        handler.setFormatter(JsonFormatter())
+        for i in range(10):
+            handler.emit(record(f"event {i}"))
+
+        # When
+        handler.start()
+        handler.close()
+
+        # Then
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == [
+            f"event {i}" for i in range(10)
+        ]
+        assert stream.writes == 1
+
+    def test_full_queue_drops_and_counts_records(self):
+        # Given
+        stream = io.StringIO()
+        handler = BatchingQueueHandler(stream, queue_size=2)
+        handler.setFormatter(JsonFormatter())
+
+        # When
+        for i in range(5):
+            handler.emit(record(f"event {i}"))
+        handler.start()
+        handler.close()
+
+        # Then
+        assert handler.dropped == 3
+        entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [entry["message"] for entry in entries] == [
+            "event 0",
+            "event 1",
+            "log_records_dropped",
+        ]
+        assert entries[-1]["dropped_total"] == 3
+
+    def test_close_flushes_pending_records(self):
+        # Given
+        stream = io.StringIO()
+        handler = BatchingQueueHandler(stream, flush_interval_seconds=60)
+        handler.setFormatter(JsonFormatter())
+        handler.start()
+        handler.emit(record("last words"))
+
+        # When
+        handler.close()
+
+        # Then
+        assert json.loads(stream.getvalue())["message"] == "last words"
@@ -0,0 +1,44 @@
+import json
+import logging
+import sys
+
+from src.infrastructure.observability import JsonFormatter
+
+
+class TestJsonFormatter:
+    def test_extra_fields_are_top_level_keys(self):
+        # Given
+        record = logging.makeLogRecord(
+            {
+                "name": "src.application.service",
+                "levelno": logging.INFO,
+                "levelname": "INFO",
+                "msg": "user_registered",
+                "user_id": "42",
+            }
+        )
+
+        # When
+        entry = json.loads(JsonFormatter().format(record))
+
+        # Then
+        assert entry["message"] == "user_registered"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "src.application.service"
+        assert entry["user_id"] == "42"
+        assert "args" not in entry
+
+    def test_exception_is_formatted(self):
+        # Given
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.makeLogRecord(
+                {"msg": "failed", "exc_info": sys.exc_info()}
+            )
+
+        # When
+        entry = json.loads(JsonFormatter().format(record))
+
+        # Then
+        assert "ValueError: boom" in entry["exception"]
@@ -0,0 +1,114 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.config import CircuitBreakerConfig
+from src.infrastructure.resilience import CircuitBreaker, CircuitOpenError
+from src.infrastructure.resilience.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        config = CircuitBreakerConfig(
+            window_size=4,
+            minimum_calls=4,
+            failure_rate_threshold=0.5,
+            slow_call_seconds=1.0,
+            slow_call_rate_threshold=0.75,
+            open_seconds=30,
+        )
+        return CircuitBreaker(config, clock)
+
+    def fail(self, breaker):
+        with pytest.raises(OSError):
+            breaker.call(MagicMock(side_effect=OSError("timed out")))
+
+    def test_opens_when_failure_rate_reaches_threshold(self, breaker):
+        # Given
+        breaker.call(lambda: None)
+        breaker.call(lambda: None)
+        self.fail(breaker)
+
+        # When
+        self.fail(breaker)
+
+        # Then
+        assert breaker.state == OPEN
+        function = MagicMock()
+        with pytest.raises(CircuitOpenError):
+            breaker.call(function)
+        function.assert_not_called()
+
+    def test_stays_closed_below_minimum_calls(self, breaker):
+        # When
+        self.fail(breaker)
+        self.fail(breaker)
+
+        # Then
+        assert breaker.state == CLOSED
+
+    def test_opens_when_calls_are_slow(self, breaker, clock):
+        # Given
+        def slow_call():
+            clock.now += 2.0
+
+        # When
+        for _ in range(3):
+            breaker.call(slow_call)
+        breaker.call(lambda: None)
+
+        # Then
+        assert breaker.state == OPEN
+
+    def test_half_open_trial_success_closes_circuit(self, breaker, clock):
+        # Given
+        for _ in range(4):
+            self.fail(breaker)
+        clock.now += 30
+
+        # When
+        assert breaker.state == HALF_OPEN
+        breaker.call(lambda: None)
+
+        # Then
+        assert breaker.state == CLOSED
+
+    def test_half_open_trial_failure_reopens_circuit(self, breaker, clock):
+        # Given
+        for _ in range(4):
+            self.fail(breaker)
+        clock.now += 30
+
+        # When
+        self.fail(breaker)
+
+        # Then
+        assert breaker.state == OPEN
+
+    def test_half_open_allows_limited_trial_calls(self, breaker, clock):
+        # Given
+        for _ in range(4):
+            self.fail(breaker)
+        clock.now += 30
+
+        def concurrent_call():
+            # Then: a second call while the trial is in flight is rejected
+            with pytest.raises(CircuitOpenError):
+                breaker.call(lambda: None)
+
+        # When
+        breaker.call(concurrent_call)
+        assert breaker.state == CLOSED
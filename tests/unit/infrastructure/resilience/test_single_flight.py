@@ -0,0 +1,161 @@
+import threading
+import time
+
+import pytest
+
+from src.domain.exception import DeadlineExceededException
+from src.infrastructure.deadline import reset_deadline, set_deadline
+from src.infrastructure.resilience import SingleFlight
+
+
+def run_followers(single_flight, key, function, count):
+    outcomes = []
+
+    def follow():
+        try:
+            outcomes.append(single_flight.do(key, function))
+        except Exception as error:
+            outcomes.append(error)
+
+    threads = [threading.Thread(target=follow) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def wait_for_waiters(single_flight, key, count):
+    call = single_flight._calls[key]
+    deadline = time.monotonic() + 5
+    while len(call.done._cond._waiters) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        # Given
+        single_flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        follower_lookup = threading.Event()
+
+        def lookup():
+            started.set()
+            release.wait(timeout=5)
+            return "user"
+
+        leader = threading.Thread(target=single_flight.do, args=("key", lookup))
+        leader.start()
+        started.wait(timeout=5)
+        threads, outcomes = run_followers(
+            single_flight, "key", follower_lookup.set, count=4
+        )
+        wait_for_waiters(single_flight, "key", 4)
+
+        # When
+        release.set()
+        for thread in [leader, *threads]:
+            thread.join(timeout=5)
+
+        # Then
+        assert outcomes == ["user"] * 4
+        assert not follower_lookup.is_set()
+
+    def test_followers_receive_the_leader_error(self):
+        # Given
+        single_flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        error = ConnectionError("database down")
+
+        def failing_lookup():
+            started.set()
+            release.wait(timeout=5)
+            raise error
+
+        leader = threading.Thread(
+            target=lambda: pytest.raises(
+                ConnectionError, single_flight.do, "key", failing_lookup
+            )
+        )
+        leader.start()
+        started.wait(timeout=5)
+        threads, outcomes = run_followers(single_flight, "key", lambda: None, count=2)
+        wait_for_waiters(single_flight, "key", 2)
+
+        # When
+        release.set()
+        for thread in [leader, *threads]:
+            thread.join(timeout=5)
+
+        # Then
+        assert [type(outcome) for outcome in outcomes] == [ConnectionError] * 2
+        assert all(outcome is not error for outcome in outcomes)
+        assert all(outcome.__cause__ is error for outcome in outcomes)
+        assert outcomes[0] is not outcomes[1]
+
+    def test_follower_waits_within_its_own_deadline(self):
+        # Given
+        single_flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def hung_lookup():
+            started.set()
+            release.wait(timeout=5)
+            return "user"
+
+        leader = threading.Thread(target=single_flight.do, args=("key", hung_lookup))
+        leader.start()
+        started.wait(timeout=5)
+        token = set_deadline(0.05)
+
+        # When / Then
+        try:
+            began = time.monotonic()
+            with pytest.raises(DeadlineExceededException):
+                single_flight.do("key", lambda: "follower")
+            assert time.monotonic() - began < 1
+        finally:
+            reset_deadline(token)
+            release.set()
+            leader.join(timeout=5)
+
+    def test_follower_with_budget_left_retries_after_leader_deadline(self):
+        # Given
+        single_flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def lookup_past_leader_deadline():
+            started.set()
+            release.wait(timeout=5)
+            raise DeadlineExceededException("Request deadline exceeded.")
+
+        leader = threading.Thread(
+            target=lambda: pytest.raises(
+                DeadlineExceededException,
+                single_flight.do,
+                "key",
+                lookup_past_leader_deadline,
+            )
+        )
+        leader.start()
+        started.wait(timeout=5)
+        threads, outcomes = run_followers(single_flight, "key", lambda: "user", 1)
+        wait_for_waiters(single_flight, "key", 1)
+
+        # When
+        release.set()
+        for thread in [leader, *threads]:
+            thread.join(timeout=5)
+
+        # Then
+        assert outcomes == ["user"]
+
+    def test_sequential_calls_run_again(self):
+        # Given
+        single_flight = SingleFlight()
+
+        # When
+        first = single_flight.do("key", lambda: 1)
+        second = single_flight.do("key", lambda: 2)
+
+        # Then
+        assert (first, second) == (1, 2)
+        assert single_flight._calls == {}
@@ -0,0 +1,59 @@
+import pytest
+
+from src.infrastructure.resilience import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def test_allows_a_burst_then_refills_at_rate(self, clock):
+        # Given
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+        # When
+        burst = [bucket.try_acquire() for _ in range(4)]
+        clock.now = 0.5
+        refilled = bucket.try_acquire()
+
+        # Then
+        assert burst == [True, True, True, False]
+        assert refilled is True
+        assert bucket.try_acquire() is False
+
+    def test_wait_seconds_until_next_token(self, clock):
+        # Given
+        bucket = TokenBucket(rate=4, burst=1, clock=clock)
+        bucket.try_acquire()
+
+        # When
+        clock.now = 0.125
+
+        # Then
+        assert bucket.wait_seconds() == pytest.approx(0.125)
+
+    def test_refills_up_to_burst(self, clock):
+        # Given
+        bucket = TokenBucket(rate=10, burst=2, clock=clock)
+        bucket.try_acquire()
+        assert not bucket.full
+
+        # When
+        clock.now = 60
+
+        # Then
+        assert bucket.full
+        assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+    def test_rejects_invalid_rate(self, clock):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, burst=1, clock=clock)
@@ -0,0 +1,94 @@
+import pytest
+
+from src.infrastructure.capacity_model import (
+    Deployment,
+    Flow,
+    StageCosts,
+    capacity,
+    flows,
+)
+
+COSTS = StageCosts(
+    bcrypt_hash=0.25,
+    bcrypt_verify=0.25,
+    db_lookup=0.002,
+    db_upsert=0.005,
+    smtp_send=0.05,
+)
+
+
+class TestCapacityModel:
+    def test_flows_of_the_endpoints(self):
+        # When
+        register, activate_code, activate_link = flows(COSTS)
+
+        # Then
+        assert register.cpu_seconds == 0.25
+        assert register.db_seconds == pytest.approx(0.007)
+        assert register.thread_seconds == pytest.approx(0.307)
+        assert activate_code.db_seconds == pytest.approx(0.009)
+        assert activate_link == Flow("activate (link)", 0.0, 0.005, 0.0, 0.005)
+
+    def test_scheduled_email_leaves_request_path(self):
+        # When
+        register, *_ = flows(COSTS, email_in_request=False)
+
+        # Then
+        assert register.smtp_seconds == 0.0
+
+    def test_bcrypt_bound_registration(self):
+        # Given
+        register, *_ = flows(COSTS)
+        deployment = Deployment(workers=4, threadpool_size=40, db_pool_size=20, cpus=4)
+
+        # When
+        result = capacity(register, deployment)
+
+        # Then
+        assert result.bottleneck == "cpu (bcrypt)"
+        assert result.max_rate == pytest.approx(16.0)
+        assert [stage for stage, _ in result.limits] == [
+            "cpu (bcrypt)",
+            "threadpool",
+            "database pool",
+        ]
+
+    def test_small_threadpool_becomes_the_bottleneck(self):
+        # Given
+        register, *_ = flows(COSTS)
+        deployment = Deployment(workers=1, threadpool_size=2, db_pool_size=2, cpus=8)
+
+        # When
+        result = capacity(register, deployment)
+
+        # Then
+        assert result.bottleneck == "threadpool"
+        assert result.max_rate == pytest.approx(2 / 0.307)
+
+    def test_unused_stage_does_not_limit(self):
+        # Given
+        *_, activate_link = flows(COSTS)
+        deployment = Deployment(workers=2, threadpool_size=40, db_pool_size=5, cpus=2)
+
+        # When
+        result = capacity(activate_link, deployment)
+
+        # Then
+        assert result.bottleneck == "database pool"
+        assert result.max_rate == pytest.approx(2000.0)
+        assert "cpu (bcrypt)" not in dict(result.limits)
+
+    def test_sqlite_writes_are_a_single_slot(self):
+        # Given
+        *_, activate_link = flows(COSTS)
+        deployment = Deployment(
+            workers=2, threadpool_size=40, db_pool_size=5, cpus=2, backend="sqlite"
+        )
+
+        # When
+        result = capacity(activate_link, deployment)
+
+        # Then
+        assert result.bottleneck == "database writes"
+        assert result.max_rate == pytest.approx(200.0)
+        assert "database pool" not in dict(result.limits)
@@ -0,0 +1,51 @@
+import pytest
+
+from src.domain.exception import DeadlineExceededException
+from src.infrastructure.deadline import (
+    bounded_timeout,
+    deadline_exceeded,
+    reset_deadline,
+    set_deadline,
+    time_left,
+)
+
+
+@pytest.fixture
+def request_deadline():
+    tokens = []
+    yield lambda seconds: tokens.append(set_deadline(seconds))
+    for token in reversed(tokens):
+        reset_deadline(token)
+
+
+class TestDeadline:
+    def test_without_deadline_timeouts_are_unchanged(self):
+        assert time_left() is None
+        assert bounded_timeout(10) == 10
+        assert not deadline_exceeded()
+
+    def test_timeout_is_shortened_to_time_left(self, request_deadline):
+        # Given
+        request_deadline(2.0)
+
+        # When
+        timeout = bounded_timeout(10)
+
+        # Then
+        assert 1.9 < timeout <= 2.0
+
+    def test_shorter_default_timeout_is_kept(self, request_deadline):
+        # Given
+        request_deadline(60.0)
+
+        # When / Then
+        assert bounded_timeout(10) == 10
+
+    def test_exhausted_budget_raises(self, request_deadline):
+        # Given
+        request_deadline(0)
+
+        # When / Then
+        assert deadline_exceeded()
+        with pytest.raises(DeadlineExceededException):
+            bounded_timeout(10)
@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+from src.infrastructure.warm_up import WarmUp
+
+
+class TestWarmUp:
+    def test_ready_once_every_step_ran(self):
+        # Given
+        bcrypt, database = MagicMock(), MagicMock()
+        warm_up = WarmUp([("bcrypt", bcrypt), ("database", database)])
+
+        # When
+        warm_up.run()
+
+        # Then
+        bcrypt.assert_called_once()
+        database.assert_called_once()
+        assert warm_up.ready
+        assert warm_up.pending == []
+
+    def test_failed_step_is_retried(self):
+        # Given
+        database = MagicMock(side_effect=[ConnectionError("refused"), None])
+        warm_up = WarmUp([("database", database)], retry_interval_seconds=0)
+
+        # When
+        warm_up.run()
+
+        # Then
+        assert database.call_count == 2
+        assert warm_up.ready
+
+    def test_best_effort_step_does_not_gate_readiness(self):
+        # Given
+        smtp = MagicMock(side_effect=OSError("down"))
+        warm_up = WarmUp(
+            [("database", MagicMock())],
+            retry_interval_seconds=0,
+            best_effort=[("smtp", smtp)],
+        )
+
+        # When
+        warm_up.run()
+
+        # Then
+        assert warm_up.ready
+        assert warm_up.pending == []
+        smtp.assert_called_once()
+
+    def test_not_ready_when_stopped_before_completion(self):
+        # Given
+        warm_up = WarmUp([("smtp", MagicMock(side_effect=OSError("down")))])
+        warm_up.stop()
+
+        # When
+        warm_up.run()
+
+        # Then
+        assert not warm_up.ready
+        assert warm_up.pending == ["smtp"]
@@ -0,0 +1,64 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from src.domain.model import ActivationCode, Email, User
+from tests.support import InMemoryUserRepository
+
+
+def make_user(email: str = "test@spookymotion.com", **fields) -> User:
+    return User(
+        id=uuid.uuid4(), email=Email(email), password_hash="hashed_password", **fields
+    )
+
+
+class TestInMemoryUserRepository:
+    def test_saving_same_email_updates_existing_user(self):
+        # Given
+        repository = InMemoryUserRepository()
+        original = make_user()
+        repository.save(original)
+
+        # When
+        repository.save(make_user(is_active=True))
+        found = repository.find_by_email(original.email)
+
+        # Then
+        assert found.id == original.id
+        assert found.is_active is True
+        assert found.created_at is not None
+
+    def test_mark_active_only_activates_pending_users(self):
+        # Given
+        repository = InMemoryUserRepository()
+        user = make_user(activation_code=ActivationCode.generate_activation_code())
+        repository.save(user)
+
+        # When
+        activated = repository.mark_active(user.id)
+
+        # Then
+        assert activated.is_active is True
+        assert activated.activation_code is None
+        assert repository.mark_active(user.id) is None
+
+    def test_list_page_filters_expired_pending_users(self):
+        # Given
+        repository = InMemoryUserRepository()
+        expired = make_user(
+            "expired@spookymotion.com",
+            activation_code=ActivationCode(
+                "1234", datetime.now(timezone.utc) - timedelta(minutes=1)
+            ),
+        )
+        pending = make_user(
+            "pending@spookymotion.com",
+            activation_code=ActivationCode.generate_activation_code(),
+        )
+        for user in (expired, pending):
+            repository.save(user)
+
+        # When
+        page = repository.list_page(limit=10, pending_expired=True)
+
+        # Then
+        assert [user.id for user in page] == [expired.id]